@@ -0,0 +1,345 @@
+"""Runner batch tanpa UI untuk rumus simulasi gas ideal.
+
+Membaca file CSV/Parquet berisi keadaan gas, spesifikasi proses atau
+spesifikasi siklus per chunk, menghitungnya dengan fungsi yang sama
+dengan aplikasi Streamlit, lalu menulis hasilnya secara streaming ke
+CSV/Parquet. Memori yang dipakai dibatasi oleh ukuran chunk dan jumlah
+worker, bukan ukuran file.
+
+Contoh:
+    python batch_runner.py state keadaan.csv hasil.parquet --solve P --workers 4
+    python batch_runner.py process proses.parquet hasil.csv
+    python batch_runner.py cycle siklus.csv hasil.csv --chunksize 50000
+
+Kolom input:
+    state   : n, T (K), V (L), P (atm) -- kolom yang di-solve boleh tidak ada;
+              opsional gas (mis. "N2") atau M (g/mol); vdw_gas (mis. "CO2")
+              atau a, b untuk deviasi Van der Waals
+    process : process (isobarik, isokhorik, isotermal, adiabatik, politropik,
+              vdw_isotermal, vdw_adiabatik), n, T1, T2, V1, V2, P1, Cp, Cv;
+              opsional gas (mis. "N2") untuk energi dengan Cp(T) dari tabel
+              properti (Cp, Cv tidak diperlukan untuk baris bergas pada empat
+              proses dasar; baris dengan gas kosong memakai Cp, Cv konstan);
+              k untuk politropik; vdw_gas atau a, b untuk proses Van der Waals
+    cycle   : cycle (carnot, otto, brayton, stirling), n, gamma dan parameter
+              siklus: T_hot, T_cold, V1, V2 (carnot/stirling), T1,
+              compression_ratio, Q_in (otto), T1, pressure_ratio, Q_in (brayton)
+              -> kolom hasil eta, W_net, Q_in_calc (kalor masuk terhitung), Q_out
+"""
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cycle_engine import brayton_cycle, stirling_cycle
+from process_engine import PROCESSES as GENERAL_PROCESSES, solve_process_batch
+from thermo_engine import (
+    GAS_PROPERTIES, VDW_PARAMS, PROCESSES, SHOMATE, gas_formula,
+    solve_ideal_gas, calculate_molecular_properties, vdw_deviation,
+    solve_process, carnot_cycle, otto_cycle,
+)
+
+KINDS = ("state", "process", "cycle")
+CHUNK_SIZE = 100_000
+CYCLE_OUTPUTS = {"eta": "eta", "W_net": "W_net", "Q_in": "Q_in_calc", "Q_out": "Q_out"}
+
+_SUBSCRIPTS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+
+
+def _short_name(name):
+    """Nama singkat gas, mis. "N₂ (Nitrogen)" -> "N2" """
+    return name.translate(_SUBSCRIPTS).split()[0]
+
+
+GAS_ALIASES = {_short_name(k): k for k in GAS_PROPERTIES}
+VDW_ALIASES = {_short_name(k): k for k in VDW_PARAMS}
+
+
+def _lookup(column, table, aliases, field):
+    """Properti gas per baris dari nama lengkap atau nama singkat"""
+    keys = column.astype(str).map(lambda g: g if g in table else aliases.get(g.translate(_SUBSCRIPTS)))
+    if keys.isna().any():
+        unknown = sorted(set(column[keys.isna()].astype(str)))
+        raise ValueError(f"Gas tidak dikenal: {unknown}")
+    return keys.map(lambda k: table[k][field]).to_numpy(dtype=float)
+
+
+def _col(df, name, default=None):
+    if name in df:
+        return df[name].to_numpy(dtype=float)
+    if default is None:
+        raise ValueError(f"Kolom wajib tidak ada: {name!r}")
+    return np.full(len(df), default, dtype=float)
+
+
+def _vdw_ab(df):
+    """Parameter a, b per baris dari kolom vdw_gas (jika terisi) atau a/b, None jika kolomnya tidak ada.
+
+    Baris tanpa vdw_gas maupun a/b bernilai NaN.
+    """
+    has_ab = "a" in df and "b" in df
+    if "vdw_gas" not in df and not has_ab:
+        return None
+    a = np.array(df["a"], dtype=float) if has_ab else np.full(len(df), np.nan)
+    b = np.array(df["b"], dtype=float) if has_ab else np.full(len(df), np.nan)
+    if "vdw_gas" in df:
+        named = df["vdw_gas"].notna().to_numpy()
+        if named.any():
+            gases = df["vdw_gas"][named]
+            a[named] = _lookup(gases, VDW_PARAMS, VDW_ALIASES, "a")
+            b[named] = _lookup(gases, VDW_PARAMS, VDW_ALIASES, "b")
+    return a, b
+
+
+def _has_gas(df):
+    """Mask baris yang kolom gas-nya terisi (bukan NaN atau string kosong)"""
+    if "gas" not in df:
+        return np.zeros(len(df), dtype=bool)
+    return (df["gas"].notna() & (df["gas"].astype(str).str.strip() != "")).to_numpy()
+
+
+def _table_gases(column):
+    """Nama gas per baris sebagai kunci tabel Cp(T) (SHOMATE)"""
+    formulas = column.astype(str).map(gas_formula)
+    unknown = sorted(set(column[~formulas.isin(list(SHOMATE))].astype(str)))
+    if unknown:
+        raise ValueError(f"Gas tanpa data Cp(T): {unknown}")
+    return formulas.to_numpy()
+
+
+# === PERHITUNGAN PER CHUNK ===
+def compute_states(df, solve="P"):
+    """Keadaan gas: PV = nRT, properti molekular dan deviasi Van der Waals"""
+    out = df.copy()
+    known = {k: _col(df, k) for k in ("n", "T", "V", "P") if k != solve}
+    out[solve] = solve_ideal_gas(solve, **known)
+    n, T, V = (out[k].to_numpy(dtype=float) for k in ("n", "T", "V"))
+
+    if "M" in df:
+        M = _col(df, "M")
+    elif "gas" in df:
+        M = _lookup(df["gas"], GAS_PROPERTIES, GAS_ALIASES, "M")
+    else:
+        M = 28.014  # Default N2, sama dengan calculate_molecular_properties
+    out["v_avg"], out["v_rms"], out["v_mp"] = calculate_molecular_properties(T, M)
+
+    ab = _vdw_ab(df)
+    if ab is not None:
+        dev = vdw_deviation(T, V, n, *ab)
+        out["P_vdw"], out["Z"], out["deviation"] = dev["P"], dev["Z"], dev["deviation"]
+    return out
+
+
+def compute_processes(df):
+    """Proses termodinamika, dikelompokkan per jenis proses dalam chunk"""
+    out = df.copy()
+    for key in ("P2", "V2_final", "T2_final", "q", "w", "dU", "dH"):
+        out[key] = np.nan
+
+    kinds = df["process"].astype(str).str.lower()
+    unknown = set(kinds) - set(PROCESSES) - set(GENERAL_PROCESSES)
+    if unknown:
+        raise ValueError(f"Proses tidak dikenal: {sorted(unknown)}")
+
+    # Baris dengan gas terisi memakai tabel Cp(T); baris bergas kosong memakai Cp/Cv konstan
+    has_gas = _has_gas(df)
+    groups = []
+    for kind in kinds.unique():
+        mask = (kinds == kind).to_numpy()
+        if kind in PROCESSES:
+            groups += [(kind, mask & has_gas, True), (kind, mask & ~has_gas, False)]
+        else:
+            groups.append((kind, mask, False))
+
+    for kind, mask, table in groups:
+        if not mask.any():
+            continue
+        part = df[mask]
+        if table:
+            result = solve_process(kind, *(_col(part, c) for c in ("n", "T1", "T2", "V1", "V2", "P1")),
+                                   _col(part, "Cp", np.nan), _col(part, "Cv", np.nan),
+                                   gas=_table_gases(part["gas"]))
+        elif kind in PROCESSES:
+            result = solve_process(kind, *(_col(part, c) for c in ("n", "T1", "T2", "V1", "V2", "P1", "Cp", "Cv")))
+        else:
+            ab = (None, None)
+            if kind.startswith("vdw_"):
+                ab = _vdw_ab(part)
+                if ab is None or np.isnan(ab[0]).any() or np.isnan(ab[1]).any():
+                    raise ValueError(f"Proses {kind} membutuhkan vdw_gas atau a dan b di setiap baris")
+            result = solve_process_batch(
+                kind, _col(part, "n"), _col(part, "T1"), _col(part, "V1"), _col(part, "V2"), _col(part, "Cv"),
+                k=_col(part, "k") if kind == "politropik" else None, a=ab[0], b=ab[1],
+            )
+        out.loc[mask, "P2"] = result["P2"]
+        out.loc[mask, "V2_final"] = result["V2"]
+        out.loc[mask, "T2_final"] = result["T2"]
+        for key in ("q", "w", "dU", "dH"):
+            out.loc[mask, key] = result[key]
+    return out
+
+
+def compute_cycles(df):
+    """Analisis siklus; Carnot/Otto tervektorisasi, Brayton/Stirling per set parameter (di-cache)"""
+    out = df.copy()
+    # Kalor masuk hasil integrasi ditulis ke Q_in_calc agar kolom input Q_in tidak tertimpa
+    for key in CYCLE_OUTPUTS.values():
+        out[key] = np.nan
+
+    kinds = df["cycle"].astype(str).str.lower()
+    unknown = set(kinds) - {"carnot", "otto", "brayton", "stirling"}
+    if unknown:
+        raise ValueError(f"Siklus tidak dikenal: {sorted(unknown)}")
+
+    for kind in kinds.unique():
+        mask = (kinds == kind).to_numpy()
+        part = df[mask]
+        n, gamma = _col(part, "n"), _col(part, "gamma")
+        if kind == "carnot":
+            r = carnot_cycle(n, _col(part, "T_hot"), _col(part, "T_cold"), _col(part, "V1"), _col(part, "V2"), gamma)
+            values = {"eta": r["eta"], "W_net": r["W_net"], "Q_in": r["Q_hot"], "Q_out": np.abs(r["Q_cold"])}
+        elif kind == "otto":
+            Q_in = _col(part, "Q_in")
+            r = otto_cycle(n, _col(part, "T1"), _col(part, "compression_ratio"), Q_in, gamma)
+            values = {"eta": r["eta"], "W_net": r["W_net"], "Q_in": Q_in, "Q_out": r["Q_out"]}
+        else:
+            if kind == "brayton":
+                args = zip(n, _col(part, "T1"), _col(part, "pressure_ratio"), _col(part, "Q_in"), gamma)
+                results = [brayton_cycle(*map(float, a)) for a in args]
+            else:
+                args = zip(n, _col(part, "T_hot"), _col(part, "T_cold"), _col(part, "V1"), _col(part, "V2"), gamma)
+                results = [stirling_cycle(*map(float, a)) for a in args]
+            values = {key: np.array([r[key] for r in results]) for key in ("eta", "W_net", "Q_in", "Q_out")}
+        for key, value in values.items():
+            out.loc[mask, CYCLE_OUTPUTS[key]] = value
+    return out
+
+
+def compute_chunk(kind, df, solve="P"):
+    """Hitung satu chunk DataFrame (dipanggil juga di proses worker)"""
+    if kind == "state":
+        return compute_states(df, solve)
+    if kind == "process":
+        return compute_processes(df)
+    if kind == "cycle":
+        return compute_cycles(df)
+    raise ValueError(f"Jenis input tidak dikenal: {kind!r}")
+
+
+# === I/O STREAMING ===
+def _is_parquet(path):
+    return Path(path).suffix.lower() in (".parquet", ".pq")
+
+
+def read_chunks(path, chunksize=CHUNK_SIZE):
+    """Baca CSV/Parquet per chunk tanpa memuat seluruh file"""
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+class ChunkWriter:
+    """Penulis CSV/Parquet bertahap; skema diambil dari chunk pertama"""
+
+    def __init__(self, path):
+        self.path = path
+        self._parquet = _is_parquet(path)
+        self._writer = None
+        self._first = True
+
+    def write(self, df):
+        if self._parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table.cast(self._writer.schema))
+        else:
+            df.to_csv(self.path, mode="w" if self._first else "a", header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def run(kind, input_path, output_path, chunksize=CHUNK_SIZE, workers=1, solve="P", progress=None):
+    """Proses file input per chunk dan tulis hasil berurutan; mengembalikan jumlah baris"""
+    writer = ChunkWriter(output_path)
+    rows = 0
+    try:
+        if workers <= 1:
+            for df in read_chunks(input_path, chunksize):
+                writer.write(compute_chunk(kind, df, solve))
+                rows += len(df)
+                if progress:
+                    progress(rows)
+        else:
+            # Jendela tugas terbatas agar memori tidak tumbuh bersama ukuran file
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for df in read_chunks(input_path, chunksize):
+                    pending.append(pool.submit(compute_chunk, kind, df, solve))
+                    if len(pending) >= 2 * workers:
+                        result = pending.popleft().result()
+                        writer.write(result)
+                        rows += len(result)
+                        if progress:
+                            progress(rows)
+                while pending:
+                    result = pending.popleft().result()
+                    writer.write(result)
+                    rows += len(result)
+                    if progress:
+                        progress(rows)
+    finally:
+        writer.close()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Runner batch simulasi gas ideal (CSV/Parquet, streaming per chunk)")
+    parser.add_argument("kind", choices=KINDS, help="jenis input: keadaan gas, proses atau siklus")
+    parser.add_argument("input", help="file input .csv atau .parquet")
+    parser.add_argument("output", help="file output .csv atau .parquet")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE, help="baris per chunk")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="jumlah proses worker (0 = semua core)")
+    parser.add_argument("--solve", choices=("P", "V", "n", "T"), default="P",
+                        help="variabel PV = nRT yang dihitung (mode state)")
+    parser.add_argument("--quiet", action="store_true", help="jangan tampilkan progres")
+    args = parser.parse_args(argv)
+
+    workers = args.workers or os.cpu_count() or 1
+
+    def progress(rows):
+        print(f"\r{rows:,} baris diproses", end="", file=sys.stderr, flush=True)
+
+    try:
+        rows = run(args.kind, args.input, args.output, args.chunksize, workers, args.solve,
+                   None if args.quiet else progress)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"\nError: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"\nError: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    if not args.quiet:
+        print(f"\rSelesai: {rows:,} baris -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
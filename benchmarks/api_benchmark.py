@@ -0,0 +1,163 @@
+"""Benchmark throughput dan latensi compute_api.
+
+Menjalankan server (`compute_api.py`, kecuali `--url` diberikan) lalu
+membebaninya dari beberapa proses klien, masing-masing dengan koneksi
+keep-alive sendiri. Skenario:
+- cached  : permintaan tunggal identik (dilayani cache LRU);
+- unique  : permintaan tunggal dengan suhu berbeda-beda (selalu dihitung);
+- batch   : batch 100 permintaan skalar unik (dihitung tervektorisasi);
+- arrow   : kurva Maxwell-Boltzmann 10^5 titik sebagai Arrow IPC vs JSON.
+Laporan berisi permintaan/detik, persentil latensi dan selisih statistik
+cache server (hit, miss, permintaan yang digabung).
+
+Contoh:
+    python benchmarks/api_benchmark.py --clients 4 --duration 5
+    python benchmarks/api_benchmark.py --server-workers 4 --output api.json
+"""
+import argparse
+import http.client
+import json
+import multiprocessing as mp
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from compute_api import ARROW_MIME  # noqa: E402
+
+SCENARIOS = ("cached", "unique", "batch", "arrow_json", "arrow")
+BATCH_SIZE = 100
+CURVE_POINTS = 100_000
+
+
+def scenario_request(name, client, i):
+    """(body, header Accept, jumlah item) untuk permintaan ke-i seorang klien"""
+    if name == "cached":
+        return {"op": "ideal_gas", "target": "P", "n": 1, "T": 300, "V": 22.4}, "application/json", 1
+    if name == "unique":
+        T = 200 + client + 1e-6 * i  # Unik per klien dan per permintaan
+        return {"op": "molecular_speeds", "T": T, "gas": "N2"}, "application/json", 1
+    if name == "batch":
+        base = 1000 + client * 1e3 + i * BATCH_SIZE * 1e-6
+        items = [{"op": "cycle", "cycle": "otto", "T1": base + j * 1e-6, "compression_ratio": 8, "Q_in": 1500}
+                 for j in range(BATCH_SIZE)]
+        return {"requests": items}, "application/json", BATCH_SIZE
+    curve = {"op": "maxwell_boltzmann", "T": 300, "gas": "N2", "num": CURVE_POINTS}
+    return curve, ARROW_MIME if name == "arrow" else "application/json", 1
+
+
+def client_loop(url, name, client, duration, queue):
+    parts = urlsplit(url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port)
+    latencies, items, received = [], 0, 0
+    deadline = time.perf_counter() + duration
+    i = 0
+    while time.perf_counter() < deadline:
+        body, accept, count = scenario_request(name, client, i)
+        payload = json.dumps(body)
+        start = time.perf_counter()
+        conn.request("POST", "/v1/compute", payload, {"Content-Type": "application/json", "Accept": accept})
+        response = conn.getresponse()
+        data = response.read()
+        latencies.append(time.perf_counter() - start)
+        if response.status != 200:
+            raise RuntimeError(f"{name}: HTTP {response.status} {data[:200]!r}")
+        items += count
+        received += len(data)
+        i += 1
+    conn.close()
+    queue.put((latencies, items, received))
+
+
+def get_json(url, path):
+    parts = urlsplit(url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port)
+    conn.request("GET", path)
+    data = json.loads(conn.getresponse().read())
+    conn.close()
+    return data
+
+
+def run_scenario(url, name, clients, duration):
+    before = get_json(url, "/v1/stats")
+    queue = mp.Queue()
+    procs = [mp.Process(target=client_loop, args=(url, name, c, duration, queue)) for c in range(clients)]
+    start = time.perf_counter()
+    for p in procs:
+        p.start()
+    results = [queue.get() for _ in procs]
+    for p in procs:
+        p.join()
+    wall = time.perf_counter() - start
+    after = get_json(url, "/v1/stats")
+
+    latencies = np.concatenate([r[0] for r in results]) * 1e3
+    requests = len(latencies)
+    return {
+        "scenario": name,
+        "clients": clients,
+        "requests": requests,
+        "requests_per_s": requests / wall,
+        "items_per_s": sum(r[1] for r in results) / wall,
+        "bytes_per_response": sum(r[2] for r in results) / max(requests, 1),
+        "latency": {f"p{q}_ms": float(np.percentile(latencies, q)) for q in (50, 90, 99)},
+        "cache": {k: after[k] - before[k] for k in ("hits", "misses", "coalesced")},
+    }
+
+
+def wait_ready(url, timeout=30):
+    deadline = time.time() + timeout
+    while True:
+        try:
+            return get_json(url, "/health")
+        except OSError:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark throughput compute_api")
+    parser.add_argument("--url", help="Server yang sudah berjalan; tanpa ini server dijalankan sendiri")
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--server-workers", type=int, default=1)
+    parser.add_argument("--clients", type=int, default=4, help="Jumlah proses klien bersamaan")
+    parser.add_argument("--duration", type=float, default=3.0, help="Detik per skenario")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--output", type=Path, help="Simpan hasil sebagai JSON")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        url = f"http://127.0.0.1:{args.port}"
+        server = subprocess.Popen([sys.executable, str(ROOT / "compute_api.py"), "--port", str(args.port),
+                                   "--workers", str(args.server_workers)], stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(url)
+        results = []
+        for name in args.scenarios.split(","):
+            result = run_scenario(url, name, args.clients, args.duration)
+            lat = result["latency"]
+            print(f"{name:<10} {result['requests_per_s']:>9.0f} req/s {result['items_per_s']:>10.0f} item/s  "
+                  f"p50 {lat['p50_ms']:.2f} ms  p99 {lat['p99_ms']:.2f} ms  "
+                  f"{result['bytes_per_response'] / 1e3:.1f} kB/respons  cache {result['cache']}")
+            results.append(result)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if args.output:
+        args.output.write_text(json.dumps({"results": results}, indent=2))
+        print(f"Hasil disimpan ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Uji beban: N sesi bersamaan dalam satu proses server Streamlit.
+
+Tiap sesi adalah AppTest sendiri (session_state terpisah) yang berjalan di
+thread-nya sendiri, sementara cache_resource/cache_data dibagi seperti pada
+satu proses `streamlit run`. Setiap sesi melewati semua simulation_mode,
+menekan tombol analisis mode tersebut (dan menyalakan toggle seperti
+animasi sweep suhu), lalu mengulanginya sebanyak
+`--rounds`. Laporan berisi throughput rerun, persentil latensi
+(keseluruhan dan per mode) serta memori puncak, untuk menentukan jumlah
+sesi per proses saat deployment.
+
+AppTest dirancang untuk satu sesi per proses, jadi beberapa bagiannya
+disesuaikan agar meniru satu server dengan banyak sesi:
+- skrip dikompilasi sekali dan bytecode-nya dibagi semua sesi (AppTest
+  mengompilasi ulang tiap run; kompilasi paralel dari banyak thread memicu
+  SystemError di parser CPython 3.11);
+- runtime dan opsi konfigurasi `global.appTest` tetap terpasang selama uji
+  (AppTest memasang dan melepasnya per run, sehingga akhir run satu sesi
+  memutus sesi lain yang masih berjalan);
+- jaringan Lottie di-stub.
+Secara default satu sesi pemanasan dijalankan lebih dulu sehingga impor
+pertama pustaka berat tidak saling berebut antar thread (`--cold` untuk
+melewatinya).
+
+Contoh:
+    python benchmarks/load_test.py --sessions 8 --rounds 3
+    python benchmarks/load_test.py --sessions 1,4,16 --output load.json
+"""
+import argparse
+import contextlib
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from streamlit.runtime.runtime import Runtime
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1.util import patch_config_options
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from rendering import memory_usage  # noqa: E402
+from run_benchmarks import BUTTONS, MODES, TOGGLES, _OfflineSession  # noqa: E402
+
+PERCENTILES = (50, 90, 99)
+
+_bytecode = {}
+_bytecode_lock = threading.Lock()
+_compile = ScriptCache.get_bytecode
+_runtime = {}
+
+
+def _shared_bytecode(script_cache, script_path):
+    """Pengganti ScriptCache.get_bytecode: satu kompilasi per skrip untuk semua sesi"""
+    with _bytecode_lock:
+        if script_path not in _bytecode:
+            _bytecode[script_path] = _compile(script_cache, script_path)
+        return _bytecode[script_path]
+
+
+def _sticky_runtime(cls):
+    """Pengganti Runtime.instance: runtime terakhir yang dipasang AppTest tetap dipakai"""
+    if cls._instance is not None:
+        _runtime["last"] = cls._instance
+    return _runtime["last"]
+
+
+def server_patches():
+    """Patch yang membuat AppTest di banyak thread berperilaku seperti satu server"""
+    import lottie_loader
+
+    return [
+        mock.patch.object(lottie_loader, "_get_session", lambda: _OfflineSession()),
+        mock.patch.object(ScriptCache, "get_bytecode", _shared_bytecode),
+        mock.patch.object(Runtime, "instance", classmethod(_sticky_runtime)),
+        mock.patch.object(Runtime, "exists", classmethod(lambda cls: bool(_runtime) or cls._instance is not None)),
+        patch_config_options({"global.appTest": True}),
+    ]
+
+
+class MemorySampler(threading.Thread):
+    """Sampel RSS proses secara berkala; `peak` adalah RSS tertinggi selama berjalan (None jika tidak tersedia)"""
+
+    def __init__(self, interval=0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.start_mb = self.peak = memory_usage()[0]
+        self._stop_event = threading.Event()
+
+    def sample(self):
+        rss = memory_usage()[0]
+        if rss is not None:
+            self.peak = rss if self.peak is None else max(self.peak, rss)
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.sample()
+
+
+def run_session(app_path, rounds, barrier, samples, errors):
+    """Satu sesi: semua mode (dan tombol analisisnya) sebanyak `rounds` kali"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=600)
+    barrier.wait()  # semua sesi mulai bersamaan
+    for _ in range(rounds):
+        for mode in MODES:
+            steps = [("mode", lambda: at.run())]
+            if mode in BUTTONS:
+                steps.append(("analisis", lambda: at.button(key=BUTTONS[mode]).click().run()))
+            if mode in TOGGLES:
+                steps.append(("toggle", lambda: at.toggle(key=TOGGLES[mode]).set_value(True).run()))
+                steps.append(("toggle_off", lambda: at.toggle(key=TOGGLES[mode]).set_value(False).run()))
+            at.session_state["simulation_mode"] = mode
+            for action, step in steps:
+                start = time.perf_counter()
+                try:
+                    step()
+                    error = at.exception[0].message if at.exception else None
+                except Exception as e:  # timeout AppTest atau error skrip
+                    error = repr(e)
+                samples.append((mode, action, time.perf_counter() - start))
+                if error:
+                    errors.append(f"{mode}/{action}: {error}")
+
+
+def summarize(latencies):
+    ms = np.asarray(latencies) * 1e3
+    return {
+        **{f"p{q}_ms": float(np.percentile(ms, q)) for q in PERCENTILES},
+        "mean_ms": float(ms.mean()),
+        "max_ms": float(ms.max()),
+    }
+
+
+def load_test(sessions, rounds, app_path):
+    """Jalankan `sessions` sesi bersamaan dan kembalikan ringkasannya"""
+    samples, errors = [], []
+    barrier = threading.Barrier(sessions + 1)
+    threads = [threading.Thread(target=run_session, args=(app_path, rounds, barrier, samples, errors))
+               for _ in range(sessions)]
+    sampler = MemorySampler()
+    sampler.start()
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+    sampler.stop()
+
+    by_mode = defaultdict(list)
+    for mode, action, elapsed in samples:
+        by_mode[f"{mode}/{action}"].append(elapsed)
+    return {
+        "sessions": sessions,
+        "reruns": len(samples),
+        "errors": len(errors),
+        "error_messages": sorted(set(errors)),
+        "wall_s": wall,
+        "throughput_rps": len(samples) / wall,
+        "latency": summarize([s[2] for s in samples]),
+        "per_mode": {key: summarize(values) for key, values in by_mode.items()},
+        "rss_start_mb": sampler.start_mb,
+        "rss_peak_mb": sampler.peak,
+    }
+
+
+def print_report(result):
+    lat = result["latency"]
+    print(f"\n{result['sessions']} sesi: {result['reruns']} rerun dalam {result['wall_s']:.1f} s "
+          f"→ {result['throughput_rps']:.2f} rerun/s, error {result['errors']}")
+    print(f"  latensi p50 {lat['p50_ms']:.0f} ms, p90 {lat['p90_ms']:.0f} ms, "
+          f"p99 {lat['p99_ms']:.0f} ms, maks {lat['max_ms']:.0f} ms")
+    if result["rss_peak_mb"] is not None:
+        print(f"  RSS {result['rss_start_mb']:.0f} MB → puncak {result['rss_peak_mb']:.0f} MB")
+    for message in result["error_messages"]:
+        print(f"  ❌ {message}")
+    width = max(len(key) for key in result["per_mode"])
+    for key, stats in result["per_mode"].items():
+        print(f"    {key:<{width}}  p50 {stats['p50_ms']:>7.0f} ms  p99 {stats['p99_ms']:>7.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uji beban sesi bersamaan aplikasi simulasi gas ideal")
+    parser.add_argument("--sessions", default="4",
+                        help="Jumlah sesi bersamaan; daftar dipisah koma untuk beberapa tingkat beban")
+    parser.add_argument("--rounds", type=int, default=2, help="Putaran semua mode per sesi")
+    parser.add_argument("--cold", action="store_true",
+                        help="Tanpa sesi pemanasan: impor pustaka dan cache proses masih kosong saat uji dimulai")
+    parser.add_argument("--output", type=Path, help="Simpan hasil sebagai JSON")
+    args = parser.parse_args()
+
+    app_path = str(ROOT / "streamlit_app.py")
+    levels = [int(x) for x in args.sessions.split(",")]
+    results = []
+    with contextlib.ExitStack() as stack:
+        for patch in server_patches():
+            stack.enter_context(patch)
+        if not args.cold:
+            load_test(1, 1, app_path)
+        for sessions in levels:
+            result = load_test(sessions, args.rounds, app_path)
+            print_report(result)
+            results.append(result)
+
+    if args.output:
+        args.output.write_text(json.dumps({"rounds": args.rounds, "modes": list(MODES), "results": results},
+                                          indent=2))
+        print(f"\nHasil disimpan ke {args.output}")
+    return 1 if any(r["errors"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""Benchmark kernel numerik dan rerun aplikasi Streamlit.
+
+Mengukur calculate_molecular_properties, maxwell_boltzmann dan
+van_der_waals untuk ukuran array 10 sampai 10^7, analisis siklus
+Carnot/Otto, satu langkah simulasi partikel (hingga 10^6 partikel), rerun headless tiap simulation_mode lewat AppTest
+(jaringan Lottie di-stub), serta waktu startup dingin per mode di proses
+Python baru beserta pustaka berat yang dimuatnya. Hasil disimpan sebagai
+JSON dan bisa dibandingkan dengan baseline sebelumnya.
+
+Contoh:
+    python benchmarks/run_benchmarks.py --output baseline.json
+    python benchmarks/run_benchmarks.py --baseline baseline.json --tolerance 0.25
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from thermo_engine import (  # noqa: E402
+    calculate_molecular_properties, maxwell_boltzmann, van_der_waals,
+    carnot_cycle, otto_cycle,
+)
+from particle_sim import ParticleGas  # noqa: E402
+
+PARTICLE_MAX = 1_000_000  # Batas ukuran benchmark langkah simulasi partikel
+
+MODES = ("Gas Ideal Dasar", "Proses Termodinamika", "Siklus Termodinamika", "Perbandingan Gas", "Simulasi Partikel")
+BUTTONS = {
+    "Gas Ideal Dasar": "calc_basic",
+    "Proses Termodinamika": "analyze_process",
+    "Siklus Termodinamika": "analyze_cycle",
+}
+# Toggle yang membuka jalur tambahan per mode (mis. animasi sweep suhu Maxwell-Boltzmann)
+TOGGLES = {
+    "Gas Ideal Dasar": "mb_animate",
+}
+# Pustaka yang impornya mahal; laporan startup mencatat mana yang dimuat tiap mode
+HEAVY_MODULES = ("pandas", "matplotlib", "plotly.graph_objects", "streamlit_lottie", "pyarrow")
+
+
+def timeit(func, min_time=0.2, max_repeat=50):
+    """Waktu terbaik (detik) dari beberapa pengulangan"""
+    func()  # pemanasan
+    best = float("inf")
+    total = 0.0
+    for _ in range(max_repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        if total >= min_time:
+            break
+    return best
+
+
+def bench_kernels(max_size):
+    """Benchmark kernel untuk ukuran 10, 100, ..., max_size"""
+    results = {}
+    rng = np.random.default_rng(0)
+    size = 10
+    while size <= max_size:
+        T = rng.uniform(200, 1000, size)
+        v = rng.uniform(0, 3000, size)
+        V = rng.uniform(0.5, 5, size)
+        r = rng.uniform(2, 15, size)
+        cases = {
+            "calculate_molecular_properties": lambda: calculate_molecular_properties(T, 28.014),
+            "maxwell_boltzmann": lambda: maxwell_boltzmann(v, T, 28.014),
+            "van_der_waals": lambda: van_der_waals(T, V, 1.0, 3.640, 0.04267),
+            "carnot_cycle": lambda: carnot_cycle(1.0, T + 300, T, 1.0, V, 1.4),
+            "otto_cycle": lambda: otto_cycle(1.0, T, r, 1000.0, 1.4),
+        }
+        if 1000 <= size <= PARTICLE_MAX:
+            cases["particle_step"] = ParticleGas(size, 300.0, 28.014).step
+        for name, func in cases.items():
+            results[f"kernel/{name}/{size}"] = timeit(func)
+        print(f"  kernel ukuran {size:>10,} selesai", file=sys.stderr)
+        size *= 10
+    return results
+
+
+def bench_batch(rows=100_000):
+    """Benchmark batch_runner.compute_processes dengan kolom gas campuran (terisi, kosong, NaN)"""
+    import pandas as pd
+
+    from batch_runner import compute_processes
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "process": rng.choice(["isobarik", "isokhorik", "isotermal", "adiabatik"], rows),
+        "n": 1.0, "T1": rng.uniform(250, 600, rows), "T2": rng.uniform(250, 600, rows),
+        "V1": rng.uniform(0.5, 5, rows), "V2": rng.uniform(0.5, 5, rows), "P1": 1.0,
+        "Cp": 29.1, "Cv": 20.8,
+        # Baris bergas memakai tabel Cp(T), sisanya Cp/Cv konstan
+        "gas": rng.choice(np.array(["N2", "H2O", "NH3", "", None], dtype=object), rows),
+    })
+    result = compute_processes(df)
+    if result[["P2", "T2_final", "q", "w", "dU", "dH"]].isna().any().any():
+        raise RuntimeError("compute_processes: hasil NaN untuk kolom gas campuran")
+    return {f"batch/process_mixed_gas/{rows}": timeit(lambda: compute_processes(df))}
+
+
+class _OfflineSession:
+    """Pengganti requests.Session: semua permintaan gagal seperti saat offline"""
+
+    def get(self, *args, **kwargs):
+        import requests
+
+        raise requests.ConnectionError("jaringan di-stub oleh benchmark")
+
+
+def bench_app(reruns):
+    """Benchmark rerun headless tiap simulation_mode dengan AppTest"""
+    from streamlit.testing.v1 import AppTest
+
+    import lottie_loader
+
+    results = {}
+    app_path = str(ROOT / "streamlit_app.py")
+    with mock.patch.object(lottie_loader, "_get_session", lambda: _OfflineSession()):
+        for mode in MODES:
+            at = AppTest.from_file(app_path, default_timeout=120)
+            start = time.perf_counter()
+            at.run()
+            at.sidebar.selectbox[0].set_value(mode).run()
+            results[f"app/{mode}/first_run"] = time.perf_counter() - start
+
+            def rerun():
+                at.run()
+                if at.exception:
+                    raise RuntimeError(f"{mode}: {at.exception[0].message}")
+
+            results[f"app/{mode}/rerun"] = timeit(rerun, min_time=0, max_repeat=reruns)
+
+            if mode in BUTTONS:
+                results[f"app/{mode}/button"] = timeit(
+                    lambda: at.button(key=BUTTONS[mode]).click().run(), min_time=0, max_repeat=reruns)
+            if mode in TOGGLES:
+                at.toggle(key=TOGGLES[mode]).set_value(True)
+                results[f"app/{mode}/toggle"] = timeit(rerun, min_time=0, max_repeat=reruns)
+                at.toggle(key=TOGGLES[mode]).set_value(False)
+            print(f"  app {mode} selesai", file=sys.stderr)
+    return results
+
+
+def startup_probe(mode):
+    """Dijalankan di proses baru (profiling aktif): waktu startup mode dan pustaka berat yang dimuat.
+
+    `first_paint` adalah waktu sampai konten utama mode selesai dirender,
+    yaitu total rerun dikurangi fase setelah konten utama (animasi Lottie
+    dan sidebar akhir) yang tercatat di log profiling.
+    """
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    import lottie_loader
+    import profiling
+
+    report = {"import_streamlit": time.perf_counter() - start}
+    with mock.patch.object(lottie_loader, "_get_session", lambda: _OfflineSession()):
+        at = AppTest.from_file(str(ROOT / "streamlit_app.py"), default_timeout=120)
+        at.session_state["simulation_mode"] = mode  # langsung ke mode, tanpa rerun mode default
+        at.run()
+    if at.exception:
+        raise RuntimeError(f"{mode}: {at.exception[0].message}")
+    report["script_done"] = time.perf_counter() - start
+
+    phases = json.loads(profiling.LOG_PATH.read_text().splitlines()[-1])["phases"]
+    names = list(phases)
+    tail_ms = sum(phases[name] for name in names[names.index("lottie"):])
+    report["first_paint"] = report["script_done"] - tail_ms / 1e3
+    report["phases"] = phases
+    report["modules"] = [name for name in HEAVY_MODULES if name in sys.modules]
+    print(json.dumps(report))
+
+
+def bench_startup():
+    """Startup dingin tiap mode, masing-masing di interpreter Python baru"""
+    results, details = {}, {}
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, GASIDEAL_PROFILE="1", GASIDEAL_PROFILE_LOG=str(Path(tmp) / "profile.jsonl"))
+        for mode in MODES:
+            out = subprocess.run([sys.executable, __file__, "--startup-probe", mode],
+                                 capture_output=True, text=True, check=True, env=env).stdout
+            report = json.loads(out.strip().splitlines()[-1])
+            for key in ("import_streamlit", "first_paint", "script_done"):
+                results[f"startup/{mode}/{key}"] = report[key]
+            details[mode] = {"modules": report["modules"], "phases": report["phases"]}
+            print(f"  startup {mode}: paint pertama {report['first_paint'] * 1e3:.0f} ms, "
+                  f"selesai {report['script_done'] * 1e3:.0f} ms, "
+                  f"memuat {', '.join(report['modules']) or '-'}", file=sys.stderr)
+    return results, details
+
+
+def compare(results, baseline, tolerance):
+    """Daftar regresi: benchmark yang lebih lambat dari baseline × (1 + tolerance)"""
+    regressions = []
+    for name, value in sorted(results.items()):
+        base = baseline.get(name)
+        if base and value > base * (1 + tolerance):
+            regressions.append((name, base, value))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark simulasi gas ideal")
+    parser.add_argument("--max-size", type=float, default=1e7, help="ukuran array terbesar")
+    parser.add_argument("--reruns", type=int, default=5, help="pengulangan rerun aplikasi per mode")
+    parser.add_argument("--skip-app", action="store_true", help="lewati benchmark AppTest")
+    parser.add_argument("--skip-startup", action="store_true", help="lewati benchmark startup dingin")
+    parser.add_argument("--startup-probe", metavar="MODE", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help="simpan hasil ke file JSON")
+    parser.add_argument("--baseline", help="file JSON baseline untuk perbandingan")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="toleransi perlambatan relatif sebelum dianggap regresi")
+    args = parser.parse_args(argv)
+    if args.startup_probe:
+        startup_probe(args.startup_probe)
+        return 0
+
+    results = bench_kernels(int(args.max_size))
+    results.update(bench_batch())
+    startup = {}
+    if not args.skip_app:
+        results.update(bench_app(args.reruns))
+    if not args.skip_startup:
+        startup_results, startup = bench_startup()
+        results.update(startup_results)
+
+    for name, value in sorted(results.items()):
+        print(f"{name:<60} {value * 1e3:12.3f} ms")
+
+    if args.output:
+        payload = {
+            "meta": {
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "results": results,
+            "startup": startup,
+        }
+        Path(args.output).write_text(json.dumps(payload, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for name, base, value in regressions:
+            print(f"REGRESI {name}: {base * 1e3:.3f} ms -> {value * 1e3:.3f} ms "
+                  f"(+{(value / base - 1) * 100:.0f}%)")
+        if regressions:
+            return 1
+        print(f"Tidak ada regresi di atas {args.tolerance * 100:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
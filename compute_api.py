@@ -0,0 +1,697 @@
+"""API HTTP lokal (JSON / Arrow IPC) untuk rumus simulasi gas ideal.
+
+Layanan lain bisa memakai fungsi yang sama dengan aplikasi Streamlit
+tanpa UI: PV = nRT, kecepatan molekular, distribusi Maxwell-Boltzmann,
+deviasi Van der Waals, proses dan siklus termodinamika.
+
+    POST /v1/compute     satu permintaan {"op": ..., parameter...} atau
+                         batch {"requests": [...]} (atau array JSON)
+    GET  /v1/operations  daftar operasi dan parameternya
+    GET  /v1/stats       statistik cache
+    GET  /health
+
+Parameter numerik boleh skalar atau array (di-broadcast seperti fungsi
+aslinya). Respons berupa JSON, atau Arrow IPC stream jika header Accept
+berisi `application/vnd.apache.arrow.stream` (atau `?format=arrow`);
+array hasil dikirim dari buffer NumPy tanpa konversi ke list Python.
+`read_arrow` mengubah respons Arrow kembali menjadi dict array.
+
+Hasil per permintaan disimpan di cache LRU (dibatasi jumlah entri dan
+byte). Permintaan identik yang sedang dihitung oleh thread lain tidak
+dihitung ulang tetapi menunggu hasil yang sama. Dalam satu batch,
+permintaan skalar dengan operasi dan parameter non-numerik yang sama
+dihitung dalam satu panggilan tervektorisasi.
+
+Contoh:
+    python compute_api.py --port 8765 --workers 4
+    curl -s localhost:8765/v1/compute -d '{"op": "ideal_gas", "target": "P", "n": 1, "T": 300, "V": 22.4}'
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import signal
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, NamedTuple
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from curve_cache import DEFAULT_GRID
+from cycle_engine import brayton_cycle, stirling_cycle
+from process_engine import PROCESSES as GENERAL_PROCESSES, solve_process_batch
+from thermo_engine import (
+    GAS_PROPERTIES, VDW_PARAMS, PROCESSES, SHOMATE,
+    gas_formula, solve_ideal_gas, calculate_molecular_properties, maxwell_boltzmann,
+    vdw_deviation, vdw_comparison, solve_process, carnot_cycle, otto_cycle,
+)
+
+ARROW_MIME = "application/vnd.apache.arrow.stream"
+CACHE_ENTRIES = 4096
+CACHE_BYTES = 256 * 2**20
+MAX_BODY = 64 * 2**20
+MAX_POINTS = 10_000_000  # batas elemen array (input dan grid/tabel hasil) per permintaan
+MAX_CYCLES = 1000  # batas elemen Brayton/Stirling per permintaan (diintegrasi satu per satu)
+
+# Domain fisik parameter numerik, sama dengan batas widget aplikasi
+POSITIVE = {"n", "T", "V", "P", "M", "T1", "T2", "V1", "V2", "P1", "Cp", "Cv",
+            "T_hot", "T_cold", "compression_ratio", "pressure_ratio", "num"}
+NON_NEGATIVE = {"a", "b", "Q_in", "v", "v_min", "v_max"}
+
+_GASES = {gas_formula(k): k for k in GAS_PROPERTIES}
+_VDW_GASES = {gas_formula(k): k for k in VDW_PARAMS}
+_TABLE_GASES = {k: k for k in SHOMATE}  # Gas dengan Cp(T) di tabel properti (mis. H2O, NH3)
+
+
+def _gas(gas, names):
+    """Nama kunci tabel untuk nama gas lengkap atau singkat (mis. "N2")"""
+    key = names.get(gas_formula(gas))
+    if key is None:
+        raise ValueError(f"Gas tidak dikenal: {gas!r}")
+    return key
+
+
+def _required(**params):
+    missing = [k for k, v in params.items() if v is None]
+    if missing:
+        raise ValueError(f"Parameter wajib tidak ada: {missing}")
+
+
+def _molar_mass(M, gas):
+    if gas is not None:
+        return GAS_PROPERTIES[_gas(gas, _GASES)]["M"]
+    return 28.014 if M is None else M  # Default N2, sama dengan calculate_molecular_properties
+
+
+def _vdw_ab(a, b, gas):
+    if gas is not None:
+        params = VDW_PARAMS[_gas(gas, _VDW_GASES)]
+        return params["a"], params["b"]
+    _required(a=a, b=b)
+    return a, b
+
+
+# === OPERASI ===
+def ideal_gas(target="P", n=None, T=None, V=None, P=None):
+    """PV = nRT untuk satu variabel (P atm, V L, T K)"""
+    known = {"n": n, "T": T, "V": V, "P": P}
+    if known.pop(target, "") == "":
+        raise ValueError(f"Variabel tidak dikenal: {target!r}")
+    _required(**known)
+    return {target: solve_ideal_gas(target, **known)}
+
+
+def molecular_speeds(T=None, M=None, gas=None):
+    """Kecepatan rata-rata, rms dan paling mungkin (m/s)"""
+    _required(T=T)
+    v_avg, v_rms, v_mp = calculate_molecular_properties(T, _molar_mass(M, gas))
+    return {"v_avg": v_avg, "v_rms": v_rms, "v_mp": v_mp}
+
+
+def maxwell_boltzmann_curve(T=None, M=None, gas=None, v=None,
+                            v_min=DEFAULT_GRID[0], v_max=DEFAULT_GRID[1], num=DEFAULT_GRID[2]):
+    """Distribusi f(v) pada grid kecepatan; T berupa array menghasilkan satu baris per suhu"""
+    _required(T=T)
+    if v is None:
+        if not 2 <= num <= MAX_POINTS:
+            raise ValueError(f"num harus antara 2 dan {MAX_POINTS}")
+        v = np.linspace(v_min, v_max, int(num))
+    if np.size(T) * np.size(v) > MAX_POINTS:
+        raise ValueError(f"Hasil melebihi {MAX_POINTS} titik")
+    return {"v": v, "f": maxwell_boltzmann(v, np.asarray(T)[..., None], _molar_mass(M, gas))}
+
+
+def van_der_waals(T=None, V=None, n=1.0, a=None, b=None, gas=None):
+    """Tekanan Van der Waals vs ideal (atm), Z dan deviasi (%)"""
+    _required(T=T, V=V)
+    return vdw_deviation(T, V, n, *_vdw_ab(a, b, gas))
+
+
+def vdw_table(T=None, V=None, n=1.0, gases=None):
+    """Tabel deviasi semua gas (atau `gases`) pada grid T × V"""
+    _required(T=T, V=V)
+    if np.size(T) * np.size(V) * len(gases or VDW_PARAMS) > MAX_POINTS:
+        raise ValueError(f"Tabel melebihi {MAX_POINTS} titik")
+    if gases is not None:
+        gases = {name: VDW_PARAMS[name] for name in (_gas(g, _VDW_GASES) for g in gases)}
+    return vdw_comparison(T, V, n, gases)
+
+
+def process(process=None, n=1.0, T1=None, T2=None, V1=None, V2=None, P1=None, Cp=None, Cv=None,
+            k=None, a=None, b=None, gas=None, vdw_gas=None):
+    """Keadaan akhir dan energi (J) proses termodinamika"""
+    if process in PROCESSES:
+        _required(T1=T1, V1=V1, P1=P1)
+        if process in ("isobarik", "isokhorik"):
+            _required(T2=T2)
+        else:
+            _required(V2=V2)
+        if gas is not None:
+            gas = _gas(gas, _TABLE_GASES)  # Energi dari tabel Cp(T)
+        else:
+            _required(Cp=Cp, Cv=Cv)
+        nan = np.nan
+        result = solve_process(process, n, T1, nan if T2 is None else T2, V1, nan if V2 is None else V2, P1,
+                               nan if Cp is None else Cp, nan if Cv is None else Cv, gas=gas)
+    elif process in GENERAL_PROCESSES:
+        if Cv is None and gas is not None:
+            Cv = GAS_PROPERTIES[_gas(gas, _GASES)]["Cv"]
+        _required(T1=T1, V1=V1, V2=V2, Cv=Cv)
+        if process == "politropik":
+            _required(k=k)
+        else:
+            a, b = _vdw_ab(a, b, vdw_gas)
+        result = solve_process_batch(process, *np.broadcast_arrays(n, T1, V1, V2, Cv), k=k, a=a, b=b)
+    else:
+        raise ValueError(f"Proses tidak dikenal: {process!r}")
+    return {key: result[key] for key in ("P2", "V2", "T2", "q", "w", "dU", "dH")}
+
+
+def cycle(cycle=None, n=1.0, gamma=1.4, T_hot=None, T_cold=None, V1=None, V2=None,
+          T1=None, compression_ratio=None, Q_in=None, pressure_ratio=None):
+    """Efisiensi, kerja bersih dan kalor (J) siklus Carnot, Otto, Brayton atau Stirling"""
+    if cycle == "carnot":
+        _required(T_hot=T_hot, T_cold=T_cold, V1=V1, V2=V2)
+        r = carnot_cycle(n, T_hot, T_cold, V1, V2, gamma)
+        return {"eta": r["eta"], "W_net": r["W_net"], "Q_in": r["Q_hot"], "Q_out": np.abs(r["Q_cold"])}
+    if cycle == "otto":
+        _required(T1=T1, compression_ratio=compression_ratio, Q_in=Q_in)
+        r = otto_cycle(n, T1, compression_ratio, Q_in, gamma)
+        return {"eta": r["eta"], "W_net": r["W_net"], "Q_in": np.broadcast_to(Q_in, r["eta"].shape),
+                "Q_out": r["Q_out"]}
+    if cycle == "brayton":
+        _required(T1=T1, pressure_ratio=pressure_ratio, Q_in=Q_in)
+        args, function = (n, T1, pressure_ratio, Q_in, gamma), brayton_cycle
+    elif cycle == "stirling":
+        _required(T_hot=T_hot, T_cold=T_cold, V1=V1, V2=V2)
+        args, function = (n, T_hot, T_cold, V1, V2, gamma), stirling_cycle
+    else:
+        raise ValueError(f"Siklus tidak dikenal: {cycle!r}")
+    # Brayton/Stirling diintegrasi per set parameter (di-cache lru_cache)
+    args = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in args])
+    if args[0].size > MAX_CYCLES:
+        raise ValueError(f"Siklus {cycle} dibatasi {MAX_CYCLES} elemen per permintaan")
+    results = [function(*map(float, values)) for values in zip(*(x.ravel() for x in args))]
+    return {key: np.array([r[key] for r in results]).reshape(args[0].shape)
+            for key in ("eta", "W_net", "Q_in", "Q_out")}
+
+
+class Operation(NamedTuple):
+    function: Callable
+    static: tuple  # parameter non-numerik; permintaan dikelompokkan per nilainya
+    vector: bool  # permintaan skalar boleh ditumpuk menjadi satu panggilan array
+
+
+OPERATIONS = {
+    "ideal_gas": Operation(ideal_gas, ("target",), True),
+    "molecular_speeds": Operation(molecular_speeds, ("gas",), True),
+    "maxwell_boltzmann": Operation(maxwell_boltzmann_curve, ("gas",), False),
+    "van_der_waals": Operation(van_der_waals, ("gas",), True),
+    "vdw_table": Operation(vdw_table, ("gases",), False),
+    "process": Operation(process, ("process", "gas", "vdw_gas"), True),
+    "cycle": Operation(cycle, ("cycle",), True),
+}
+_PARAMETERS = {name: tuple(inspect.signature(op.function).parameters) for name, op in OPERATIONS.items()}
+
+
+def describe_operations():
+    """Daftar operasi beserta parameter dan default-nya (untuk GET /v1/operations)"""
+    out = {}
+    for name, op in OPERATIONS.items():
+        params = inspect.signature(op.function).parameters.values()
+        out[name] = {
+            "description": inspect.getdoc(op.function),
+            "parameters": {p.name: p.default for p in params},
+            "static": list(op.static),
+        }
+    return out
+
+
+# === PERMINTAAN ===
+class Request(NamedTuple):
+    op: str
+    params: dict
+    key: tuple
+    scalar: bool  # semua parameter numerik berupa skalar
+
+
+def _check_domain(key, array):
+    """Tolak nilai tak hingga dan di luar domain fisik (ValueError)"""
+    if array.size > MAX_POINTS:
+        raise ValueError(f"Parameter {key!r} melebihi {MAX_POINTS} elemen")
+    if not np.isfinite(array).all():
+        raise ValueError(f"Parameter {key!r} harus berhingga")
+    if key in POSITIVE and not (array > 0).all():
+        raise ValueError(f"Parameter {key!r} harus > 0")
+    if key in NON_NEGATIVE and not (array >= 0).all():
+        raise ValueError(f"Parameter {key!r} harus ≥ 0")
+    if key == "gamma" and not (array > 1).all():
+        raise ValueError("Parameter 'gamma' harus > 1")
+
+
+def parse_request(item):
+    """Validasi satu permintaan JSON dan hitung kunci cache-nya"""
+    if not isinstance(item, dict):
+        raise ValueError("Permintaan harus berupa objek JSON")
+    item = dict(item)
+    name = item.pop("op", None)
+    op = OPERATIONS.get(name)
+    if op is None:
+        raise ValueError(f"Operasi tidak dikenal: {name!r}; pilihan: {sorted(OPERATIONS)}")
+    unknown = set(item) - set(_PARAMETERS[name])
+    if unknown:
+        raise ValueError(f"Parameter tidak dikenal untuk {name}: {sorted(unknown)}")
+
+    params, arrays, scalar = {}, [], True
+    for key, value in item.items():
+        if value is None:
+            continue
+        if key in op.static:
+            if not (isinstance(value, str) or isinstance(value, list) and all(isinstance(v, str) for v in value)):
+                raise ValueError(f"Parameter {key!r} harus berupa string atau list string")
+            params[key] = value
+            scalar = scalar and isinstance(value, str)  # kunci grup harus hashable
+        elif isinstance(value, (int, float, list)) and not isinstance(value, bool):
+            try:
+                array = np.asarray(value, dtype=float)
+            except (OverflowError, TypeError, ValueError):
+                raise ValueError(f"Parameter {key!r} harus berupa angka atau array angka") from None
+            _check_domain(key, array)
+            if isinstance(value, list):
+                array.flags.writeable = False
+                params[key] = array
+                arrays.append(key)
+                scalar = False
+            else:
+                params[key] = float(array)
+        else:
+            raise ValueError(f"Parameter {key!r} harus berupa angka atau array angka")
+
+    # Kunci cache: nilai skalar sudah kanonik (1 == 1.0), array diwakili hash byte-nya
+    key = [name]
+    for k in sorted(params):
+        value = params[k]
+        if k in arrays:
+            value = (value.shape, hashlib.blake2b(value.data, digest_size=16).digest())
+        elif isinstance(value, list):
+            value = tuple(value)
+        key.append((k, value))
+    return Request(name, params, tuple(key), scalar and op.vector)
+
+
+def _freeze(value):
+    """Nilai hasil yang aman dibagi: array read-only, skalar NumPy menjadi float"""
+    if isinstance(value, np.ndarray):
+        if value.ndim == 0:
+            return float(value)
+        value = np.ascontiguousarray(value)
+        value.flags.writeable = False
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _jsonable(value):
+    """Nilai JSON; NaN dan ±inf (mis. V ≤ nb atau pembagian nol) menjadi null"""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "f" and not np.isfinite(value).all():
+            return np.where(np.isfinite(value), value.astype(object), None).tolist()
+        return value.tolist()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+class Entry:
+    """Hasil satu permintaan; JSON-nya dibuat sekali saat pertama dibutuhkan"""
+
+    __slots__ = ("result", "nbytes", "_json")
+
+    def __init__(self, result):
+        self.result = {k: _freeze(v) for k, v in result.items()}
+        self.nbytes = sum(getattr(v, "nbytes", 8) for v in self.result.values())
+        self._json = None
+
+    def json(self):
+        if self._json is None:
+            self._json = json.dumps({k: _jsonable(v) for k, v in self.result.items()},
+                                    ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+        return self._json
+
+
+class ResponseCache:
+    """Cache LRU hasil per permintaan dengan penggabungan permintaan identik yang sedang berjalan.
+
+    `claim` membagi kunci menjadi hasil yang sudah ada, hasil yang sedang
+    dihitung thread lain (Future untuk ditunggu) dan kunci yang menjadi
+    tanggung jawab pemanggil; pemanggil wajib menutup tiap kunci miliknya
+    dengan `fulfil` atau `fail`.
+    """
+
+    def __init__(self, maxsize=CACHE_ENTRIES, max_bytes=CACHE_BYTES):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def claim(self, keys):
+        found, waiting, owned = {}, {}, []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    found[key] = entry
+                elif key in self._inflight:
+                    self.coalesced += 1
+                    waiting[key] = self._inflight[key]
+                else:
+                    self.misses += 1
+                    self._inflight[key] = Future()
+                    owned.append(key)
+        return found, waiting, owned
+
+    def fulfil(self, key, entry):
+        with self._lock:
+            if entry.nbytes <= self.max_bytes:
+                old = self._entries.pop(key, None)
+                self.nbytes += entry.nbytes - (old.nbytes if old is not None else 0)
+                self._entries[key] = entry
+                while len(self._entries) > self.maxsize or self.nbytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self.nbytes -= evicted.nbytes
+                    self.evictions += 1
+            future = self._inflight.pop(key)
+        future.set_result(entry)
+
+    def fail(self, key, error):
+        with self._lock:
+            future = self._inflight.pop(key)
+        future.set_exception(error)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.nbytes, "hits": self.hits,
+                    "misses": self.misses, "coalesced": self.coalesced, "evictions": self.evictions}
+
+
+def _error_message(error):
+    return str(error) if isinstance(error, ValueError) else f"{type(error).__name__}: {error}"
+
+
+def _compute_group(requests):
+    """Entry per permintaan; permintaan skalar sejenis dihitung dalam satu panggilan array"""
+    first = requests[0]
+    op = OPERATIONS[first.op]
+    if not first.scalar:
+        return [Entry(op.function(**first.params))]
+    count = len(requests)
+    kwargs = {k: (v if k in op.static else np.array([r.params[k] for r in requests]))
+              for k, v in first.params.items()}
+    result = op.function(**kwargs)
+    # Hasil berbentuk (count, ...) dipecah per permintaan; nilai lain sama untuk semua
+    return [Entry({k: (v[i] if isinstance(v, np.ndarray) and v.ndim and len(v) == count else v)
+                   for k, v in result.items()}) for i in range(count)]
+
+
+class ComputeEngine:
+    """Eksekusi batch permintaan dengan cache respons bersama"""
+
+    def __init__(self, cache=None):
+        self.cache = cache or ResponseCache()
+
+    def run(self, items):
+        """Hasil per item sesuai urutan: Entry, atau string pesan error"""
+        outcomes = [None] * len(items)
+        requests = {}
+        for i, item in enumerate(items):
+            try:
+                requests[i] = parse_request(item)
+            except ValueError as e:
+                outcomes[i] = str(e)
+
+        unique = {}
+        for request in requests.values():
+            unique.setdefault(request.key, request)
+        found, waiting, owned = self.cache.claim(unique)
+        found.update(self._compute([unique[key] for key in owned]))
+        for key, future in waiting.items():
+            try:
+                found[key] = future.result()
+            except Exception as e:
+                found[key] = _error_message(e)
+
+        for i, request in requests.items():
+            outcomes[i] = found[request.key]
+        return outcomes
+
+    def _compute(self, requests):
+        """Hitung permintaan yang diklaim; setiap kunci pasti ditutup di cache"""
+        groups = defaultdict(list)
+        for request in requests:
+            if request.scalar:
+                op = OPERATIONS[request.op]
+                statics = tuple(request.params.get(k) for k in op.static)
+                groups[(request.op, statics, tuple(sorted(request.params)))].append(request)
+            else:
+                groups[request.key].append(request)
+
+        done = {}
+        for group in groups.values():
+            try:
+                entries = _compute_group(group)
+            except Exception as e:
+                if len(group) == 1:
+                    entries = [_error_message(e)]
+                else:
+                    # Cari permintaan yang gagal: hitung ulang satu per satu
+                    entries = []
+                    for request in group:
+                        try:
+                            entries.append(_compute_group([request])[0])
+                        except Exception as e:
+                            entries.append(_error_message(e))
+            for request, entry in zip(group, entries):
+                done[request.key] = entry
+
+        for request in requests:
+            entry = done[request.key]
+            if isinstance(entry, Entry):
+                self.cache.fulfil(request.key, entry)
+            else:
+                self.cache.fail(request.key, ValueError(entry))  # Error tidak di-cache
+        return done
+
+
+# === ARROW IPC ===
+def _arrow_column(value):
+    """Kolom Arrow satu baris dan metadata field untuk satu nilai hasil"""
+    import pyarrow as pa
+
+    if isinstance(value, np.ndarray):
+        values = pa.array(value.reshape(-1))  # Membungkus buffer NumPy tanpa salinan
+        offsets = pa.array([0, len(values)], type=pa.int64())
+        return pa.LargeListArray.from_arrays(offsets, values), {"shape": json.dumps(value.shape)}
+    if isinstance(value, list):
+        return pa.array([value], type=pa.list_(pa.string())), {}
+    if isinstance(value, str):
+        return pa.array([value], type=pa.string()), {}
+    return pa.array([value], type=pa.float64()), {}
+
+
+def encode_arrow(outcomes, batch=False):
+    """Arrow IPC stream satu baris; kolom `<i>.<nama>` untuk batch (error di `<i>.error`)"""
+    import pyarrow as pa
+
+    fields, columns = [], []
+    for i, outcome in enumerate(outcomes):
+        prefix = f"{i}." if batch else ""
+        result = {"error": outcome} if isinstance(outcome, str) else outcome.result
+        for name, value in result.items():
+            column, metadata = _arrow_column(value)
+            fields.append(pa.field(prefix + name, column.type, metadata=metadata or None))
+            columns.append(column)
+    schema = pa.schema(fields, metadata={"batch": str(len(outcomes)) if batch else ""})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(pa.record_batch(columns, schema=schema))
+    return sink.getvalue()
+
+
+def read_arrow(data):
+    """Kebalikan encode_arrow: dict nilai (array NumPy read-only), atau list dict untuk batch"""
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(data).read_all()
+    values = {}
+    for field, column in zip(table.schema, table.columns):
+        metadata = field.metadata or {}
+        if b"shape" in metadata:
+            flat = column.chunk(0).values.to_numpy(zero_copy_only=True)
+            values[field.name] = flat.reshape(json.loads(metadata[b"shape"]))
+        else:
+            values[field.name] = column[0].as_py()
+
+    count = (table.schema.metadata or {}).get(b"batch", b"")
+    if not count:
+        return values
+    results = [{} for _ in range(int(count))]
+    for name, value in values.items():
+        i, key = name.split(".", 1)
+        results[int(i)][key] = value
+    return results
+
+
+# === SERVER HTTP ===
+def _json_item(outcome):
+    """Satu item respons batch; item yang gagal di-encode menjadi error tanpa menggagalkan batch"""
+    if not isinstance(outcome, str):
+        try:
+            return b'{"result":' + outcome.json() + b"}"
+        except Exception as e:
+            outcome = f"Gagal menyusun hasil: {_error_message(e)}"
+    return b'{"error":' + json.dumps(outcome, ensure_ascii=False).encode() + b"}"
+
+
+class ComputeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Koneksi keep-alive
+    server_version = "GasIdealAPI/1.0"
+    disable_nagle_algorithm = True
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode())
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif path == "/v1/operations":
+            self._send_json(200, describe_operations())
+        elif path == "/v1/stats":
+            self._send_json(200, self.server.engine.cache.stats())
+        else:
+            self._send_json(404, {"error": f"Path tidak dikenal: {path}"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/v1/compute":
+            self._send_json(404, {"error": f"Path tidak dikenal: {url.path}"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            self.close_connection = True
+            self._send_json(413, {"error": f"Body lebih dari {MAX_BODY} byte"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            self._send_json(400, {"error": f"JSON tidak valid: {e}"})
+            return
+
+        batch = isinstance(payload, list) or isinstance(payload, dict) and "requests" in payload
+        items = (payload if isinstance(payload, list) else payload["requests"]) if batch else [payload]
+        if not isinstance(items, list):
+            self._send_json(400, {"error": "'requests' harus berupa array"})
+            return
+        arrow = "arrow" in parse_qs(url.query).get("format", ()) or ARROW_MIME in self.headers.get("Accept", "")
+
+        outcomes = self.server.engine.run(items)
+        try:
+            if not batch and isinstance(outcomes[0], str):
+                self._send_json(400, {"error": outcomes[0]})
+            elif arrow:
+                self._send(200, memoryview(encode_arrow(outcomes, batch)), ARROW_MIME)
+            elif batch:
+                self._send(200, b'{"results":[' + b",".join(map(_json_item, outcomes)) + b"]}")
+            else:
+                self._send(200, b'{"result":' + outcomes[0].json() + b"}")
+        except ImportError:
+            self._send_json(406, {"error": "Format Arrow membutuhkan pyarrow"})
+        except Exception as e:
+            self._send_json(500, {"error": f"Gagal menyusun respons: {_error_message(e)}"})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ComputeServer(ThreadingHTTPServer):
+    """Server HTTP berthread; satu ComputeEngine (dan cache) per proses"""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address, engine=None, verbose=False, reuse_port=False):
+        self.allow_reuse_port = reuse_port  # Beberapa proses worker berbagi satu port (SO_REUSEPORT)
+        super().__init__(address, ComputeHandler)
+        self.engine = engine or ComputeEngine()
+        self.verbose = verbose
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API HTTP lokal untuk rumus simulasi gas ideal")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="jumlah proses server pada port yang sama (0 = semua core; butuh fork)")
+    parser.add_argument("--cache-entries", type=int, default=CACHE_ENTRIES, help="entri cache LRU per proses")
+    parser.add_argument("--cache-mb", type=float, default=CACHE_BYTES / 2**20, help="batas byte cache per proses")
+    parser.add_argument("--verbose", action="store_true", help="log setiap permintaan")
+    args = parser.parse_args(argv)
+
+    workers = args.workers or os.cpu_count() or 1
+    if workers > 1 and not hasattr(os, "fork"):
+        print("--workers > 1 membutuhkan os.fork; memakai 1 proses", file=sys.stderr)
+        workers = 1
+    children = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            children = []  # Proses anak langsung melayani
+            break
+        children.append(pid)
+    if children:
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # Hentikan juga worker anak
+
+    cache = ResponseCache(args.cache_entries, int(args.cache_mb * 2**20))
+    server = ComputeServer((args.host, args.port), ComputeEngine(cache), args.verbose, reuse_port=workers > 1)
+    print(f"Melayani di http://{args.host}:{args.port} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
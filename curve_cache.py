@@ -0,0 +1,135 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from thermo_engine import maxwell_boltzmann
+
+# Grid kecepatan default untuk diagram Maxwell-Boltzmann: (awal, akhir, jumlah titik)
+DEFAULT_GRID = (0.0, 3000.0, 1000)
+REFERENCE_TEMPERATURES = (200, 300, 400, 500)  # K
+MAX_BANKS = 8  # bank kurva animasi yang disimpan (masing-masing frame × titik grid)
+MAX_REFERENCE_SETS = 32  # set kurva referensi yang disimpan (satu per gas/suhu/grid)
+
+
+class CurveCache:
+    """Cache LRU terbatas untuk kurva Maxwell-Boltzmann.
+
+    Kunci cache adalah (T, M, grid). Grid kecepatan disimpan sekali per
+    definisi grid dan kurva suhu referensi dihitung per gas dalam satu
+    panggilan tervektorisasi. Aman dipakai bersama oleh banyak thread/sesi.
+    Array yang dikembalikan bersifat read-only.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._curves = OrderedDict()
+        self._grids = {}
+        self._references = OrderedDict()
+        self._banks = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def grid(self, grid=DEFAULT_GRID):
+        """Grid kecepatan (m/s), dibuat sekali per definisi grid"""
+        grid = (float(grid[0]), float(grid[1]), int(grid[2]))
+        v = self._grids.get(grid)
+        if v is None:
+            v = np.linspace(*grid)
+            v.flags.writeable = False
+            self._grids[grid] = v
+        return v
+
+    def curve(self, T, M, grid=DEFAULT_GRID):
+        """Kurva distribusi pada suhu T (K) untuk gas bermassa molar M (g/mol)"""
+        key = (round(float(T), 6), float(M), tuple(grid))
+        with self._lock:
+            prob = self._curves.get(key)
+            if prob is not None:
+                self._curves.move_to_end(key)
+                self.hits += 1
+                return prob
+            self.misses += 1
+
+        prob = maxwell_boltzmann(self.grid(grid), key[0], key[1])
+        prob.flags.writeable = False
+
+        with self._lock:
+            self._curves[key] = prob
+            self._curves.move_to_end(key)
+            while len(self._curves) > self.maxsize:
+                self._curves.popitem(last=False)
+                self.evictions += 1
+        return prob
+
+    def reference_curves(self, M, temperatures=REFERENCE_TEMPERATURES, grid=DEFAULT_GRID):
+        """Kurva suhu referensi untuk satu gas, array berbentuk (len(temperatures), titik grid).
+
+        Set kurva disimpan LRU hingga MAX_REFERENCE_SETS.
+        """
+        key = (float(M), tuple(temperatures), tuple(grid))
+        with self._lock:
+            curves = self._references.get(key)
+            if curves is not None:
+                self._references.move_to_end(key)
+                self.hits += 1
+                return curves
+            self.misses += 1
+
+        T = np.asarray(temperatures, dtype=float)[:, None]
+        curves = maxwell_boltzmann(self.grid(grid)[None, :], T, key[0])
+        curves.flags.writeable = False
+
+        with self._lock:
+            self._references[key] = curves
+            while len(self._references) > MAX_REFERENCE_SETS:
+                self._references.popitem(last=False)
+        return curves
+
+    def temperature_bank(self, M, T_min, T_max, num, grid=DEFAULT_GRID):
+        """Bank kurva untuk `num` suhu merata di [T_min, T_max] (K), dihitung dalam satu panggilan.
+
+        Mengembalikan (temperatures, curves) dengan curves berbentuk
+        (num, titik grid). Bank terakhir disimpan LRU hingga MAX_BANKS.
+        """
+        key = (float(M), round(float(T_min), 6), round(float(T_max), 6), int(num), tuple(grid))
+        with self._lock:
+            bank = self._banks.get(key)
+            if bank is not None:
+                self._banks.move_to_end(key)
+                self.hits += 1
+                return bank
+            self.misses += 1
+
+        T = np.linspace(key[1], key[2], key[3])
+        curves = maxwell_boltzmann(self.grid(grid)[None, :], T[:, None], key[0])
+        T.flags.writeable = False
+        curves.flags.writeable = False
+
+        with self._lock:
+            self._banks[key] = (T, curves)
+            while len(self._banks) > MAX_BANKS:
+                self._banks.popitem(last=False)
+        return T, curves
+
+    def warm(self, gas_properties, temperatures=REFERENCE_TEMPERATURES, grid=DEFAULT_GRID):
+        """Hitung kurva referensi untuk semua gas di tabel properti"""
+        for props in gas_properties.values():
+            self.reference_curves(props["M"], temperatures, grid)
+
+    def stats(self):
+        """Penghitung hit/miss dan ukuran cache"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._curves),
+                "maxsize": self.maxsize,
+                "evictions": self.evictions,
+                "reference_sets": len(self._references),
+                "banks": len(self._banks),
+            }
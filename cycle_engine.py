@@ -0,0 +1,184 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+from thermo_engine import R, L_ATM_TO_J, process_path
+
+# Fungsi trapesium: np.trapezoid (NumPy 2) atau np.trapz (NumPy 1.x)
+_trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+
+def _quadrature(y, x):
+    """Integral ∫y dx dengan Simpson komposit untuk grid seragam berjumlah titik ganjil"""
+    if len(x) < 3 or len(x) % 2 == 0:
+        return _trapezoid(y, x)
+    h = (x[-1] - x[0]) / (len(x) - 1)
+    return h / 3 * (y[0] + y[-1] + 4 * y[1:-1:2].sum() + 2 * y[2:-1:2].sum())
+
+
+# R dalam J/mol·K yang konsisten dengan R dalam L·atm, agar hukum pertama tertutup tepat
+R_CYCLE = R * L_ATM_TO_J
+
+
+def _end_state(kind, P, V, T, target, value, n, gamma):
+    """Keadaan akhir (P, V, T) sebuah leg dari satu variabel target"""
+    if kind == "isobarik":
+        V2 = value if target == "V" else n * R * value / P
+        return P, V2, P * V2 / (n * R)
+    if kind == "isokhorik":
+        P2 = value if target == "P" else n * R * value / V
+        return P2, V, P2 * V / (n * R)
+    if kind == "isotermal":
+        V2 = value if target == "V" else n * R * T / value
+        return n * R * T / V2, V2, T
+    if kind == "adiabatik":
+        if target == "V":
+            V2 = value
+        elif target == "P":
+            V2 = V * (P / value)**(1 / gamma)  # PV^γ = konstan
+        else:
+            V2 = V * (T / value)**(1 / (gamma - 1))  # TV^(γ-1) = konstan
+        P2 = P * (V / V2)**gamma
+        return P2, V2, P2 * V2 / (n * R)
+    raise ValueError(f"Jenis leg tidak dikenal: {kind!r}")
+
+
+class LegCache:
+    """Cache LRU leg siklus (lintasan dan kerja) di memori, aman dibagi banyak thread/sesi"""
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self._legs = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            leg = self._legs.get(key)
+            if leg is None:
+                self.misses += 1
+                return None
+            self._legs.move_to_end(key)
+            self.hits += 1
+            return leg
+
+    def put(self, key, leg):
+        with self._lock:
+            self._legs[key] = leg
+            self._legs.move_to_end(key)
+            while len(self._legs) > self.maxsize:
+                self._legs.popitem(last=False)
+
+
+def integrate_cycle(legs, n, gamma, P0, V0, num=201, regenerated=(), leg_cache=None):
+    """Integrasi siklus yang tersusun dari leg proses.
+
+    `legs` adalah urutan (jenis, target, nilai) dengan jenis salah satu
+    dari "isobarik", "isokhorik", "isotermal", "adiabatik" dan target
+    "P", "V" atau "T" untuk keadaan akhir leg. Tiap leg didiskretisasi
+    menjadi `num` titik; kerja dihitung dengan kuadratur Simpson atas
+    lintasan P-V. Kalor dari leg di `regenerated` (indeks) dianggap
+    ditukar dengan regenerator dan tidak dihitung sebagai kalor masuk.
+    `leg_cache` (opsional, mis. LegCache: objek dengan get(key) dan
+    put(key, hasil)) menyimpan lintasan dan kerja per leg, sehingga saat parameter siklus
+    berubah hanya leg yang keadaan awal atau targetnya berubah yang
+    diintegrasi ulang.
+
+    Mengembalikan dict berisi lintasan P, V, T, S yang sama untuk
+    diagram P-V dan T-S, titik keadaan, energi per leg (J) dan efisiensi.
+    """
+    Cv = R_CYCLE / (gamma - 1)
+    P, V = float(P0), float(V0)
+    T = P * V / (n * R)
+    T0, V_ref = T, V
+
+    paths = {"P": [], "V": [], "T": [], "S": []}
+    states = [(P, V, T)]
+    W, Q, dU = [], [], []
+
+    for kind, target, value in legs:
+        leg_key = (kind, target, float(value), float(P), float(V), float(T), float(n), float(gamma), num)
+        leg = leg_cache.get(leg_key) if leg_cache is not None else None
+        if leg is None:
+            P2, V2, T2 = _end_state(kind, P, V, T, target, value, n, gamma)
+            V_path, P_path = process_path(kind, V, V2, P, P2, gamma, num)
+            leg = {"end": (P2, V2, T2), "V": V_path, "P": P_path,
+                   "w": _quadrature(P_path, V_path) * L_ATM_TO_J}  # Kerja oleh gas
+            if leg_cache is not None:
+                leg_cache.put(leg_key, leg)
+        P2, V2, T2 = (float(x) for x in leg["end"])
+        V_path, P_path, w = leg["V"], leg["P"], float(leg["w"])
+        T_path = P_path * V_path / (n * R)
+        S_path = n * Cv * np.log(T_path / T0) + n * R_CYCLE * np.log(V_path / V_ref)
+
+        du = n * Cv * (T2 - T)
+        W.append(w)
+        dU.append(du)
+        Q.append(du + w)  # Hukum pertama
+
+        paths["P"].append(P_path)
+        paths["V"].append(V_path)
+        paths["T"].append(T_path)
+        paths["S"].append(S_path)
+        P, V, T = P2, V2, T2
+        states.append((P, V, T))
+
+    W, Q, dU = np.array(W), np.array(Q), np.array(dU)
+    exchanged = np.zeros(len(legs), dtype=bool)
+    exchanged[list(regenerated)] = True
+    Q_in = Q[(Q > 0) & ~exchanged].sum()
+    Q_out = -Q[(Q < 0) & ~exchanged].sum()
+    W_net = W.sum()
+
+    result = {key: np.concatenate(value) for key, value in paths.items()}
+    result.update({
+        "leg_bounds": np.arange(len(legs) + 1) * num,
+        "states": np.array(states[:-1]),  # (P, V, T) per titik; titik terakhir = titik awal
+        "closure": np.array(states[-1]) - np.array(states[0]),
+        "W": W, "Q": Q, "dU": dU,
+        "W_net": W_net, "Q_in": Q_in, "Q_out": Q_out,
+        "eta": W_net / Q_in if Q_in > 0 else np.nan,
+    })
+    for value in result.values():
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+    return result
+
+
+# === SIKLUS SPESIFIK (di-cache per set parameter) ===
+@lru_cache(maxsize=128)
+def brayton_cycle(n, T1, pressure_ratio, Q_in, gamma, P1=1.0, num=201, leg_cache=None):
+    """Siklus Brayton: kompresi adiabatik, pemanasan isobarik, ekspansi adiabatik, pendinginan isobarik"""
+    V1 = n * R * T1 / P1
+    P2 = P1 * pressure_ratio
+    T2 = T1 * pressure_ratio**((gamma - 1) / gamma)
+    Cp = gamma * R_CYCLE / (gamma - 1)
+    T3 = T2 + Q_in / (n * Cp)  # Kalor masuk pada tekanan konstan
+    legs = (
+        ("adiabatik", "P", P2),
+        ("isobarik", "T", T3),
+        ("adiabatik", "P", P1),
+        ("isobarik", "V", V1),
+    )
+    return integrate_cycle(legs, n, gamma, P1, V1, num, leg_cache=leg_cache)
+
+
+@lru_cache(maxsize=128)
+def stirling_cycle(n, T_hot, T_cold, V1, V2, gamma, regenerator=True, num=201, leg_cache=None):
+    """Siklus Stirling: dua isotermal dan dua isokhorik.
+
+    Dengan regenerator ideal, kalor isokhorik ditukar internal sehingga
+    efisiensinya sama dengan Carnot.
+    """
+    P1 = n * R * T_hot / V1
+    legs = (
+        ("isotermal", "V", V2),      # Ekspansi isotermal pada T_hot
+        ("isokhorik", "T", T_cold),  # Pendinginan isokhorik
+        ("isotermal", "V", V1),      # Kompresi isotermal pada T_cold
+        ("isokhorik", "T", T_hot),   # Pemanasan isokhorik
+    )
+    regenerated = (1, 3) if regenerator else ()
+    return integrate_cycle(legs, n, gamma, P1, V1, num, regenerated, leg_cache)
@@ -0,0 +1,166 @@
+import inspect
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from thermo_engine import carnot_cycle, otto_cycle
+
+# Fungsi analisis dan nama parameternya untuk tiap siklus
+CYCLES = {
+    "otto": (otto_cycle, ("n", "T1", "compression_ratio", "Q_in", "gamma")),
+    "carnot": (carnot_cycle, ("n", "T_hot", "T_cold", "V1", "V2", "gamma")),
+}
+
+CHUNK_SIZE = 250_000  # titik grid per chunk
+PARALLEL_THRESHOLD = 2_000_000  # di atas ini dievaluasi dengan process pool
+
+OUTPUTS = ("eta", "W_net", "T_max", "P_max")  # grid yang dikembalikan run_sweep
+
+
+def _evaluate_chunk(cycle, columns, keep=None):
+    """Evaluasi satu chunk titik grid (dipanggil juga di proses worker).
+
+    Hanya grid OUTPUTS pada titik `keep` (indeks lokal, None = semua) dan
+    titik keadaan T/P untuk titik efisiensi terbaik chunk yang
+    dikembalikan, sehingga array (titik, 4) tidak pernah keluar dari worker.
+    """
+    func, _ = CYCLES[cycle]
+    result = func(**columns)
+    eta = result["eta"]
+    i = int(np.argmax(np.where(np.isnan(eta), -np.inf, eta)))
+    grids = {
+        "eta": eta,
+        "W_net": result["W_net"],
+        "T_max": result["T"].max(axis=-1),
+        "P_max": result["P"].max(axis=-1),
+    }
+    partial = {key: value if keep is None else value[keep] for key, value in grids.items()}
+    partial["best"] = {
+        "offset": i, "eta": float(eta[i]), "W_net": float(result["W_net"][i]),
+        "T": result["T"][i].copy(), "P": result["P"][i].copy(),
+    }
+    return partial
+
+
+def sweep_axes(cycle, params):
+    """Pisahkan parameter menjadi sumbu sweep (array 1D) dan parameter tetap"""
+    func, names = CYCLES[cycle]
+    required = {p.name for p in inspect.signature(func).parameters.values() if p.default is p.empty}
+    missing = required - set(params)
+    if missing:
+        raise ValueError(f"Parameter siklus {cycle} belum lengkap: {sorted(missing)}")
+    axes, fixed = {}, {}
+    for name, value in params.items():
+        if name not in names:
+            raise ValueError(f"Parameter tidak dikenal untuk siklus {cycle}: {name!r}")
+        value = np.asarray(value, dtype=float)
+        if value.ndim == 0:
+            fixed[name] = float(value)
+        else:
+            axes[name] = value.ravel()
+    return axes, fixed
+
+
+def _chunk_columns(axes, fixed, start, stop):
+    """Kolom parameter untuk titik grid datar [start, stop) tanpa membuat meshgrid penuh"""
+    shape = tuple(len(v) for v in axes.values())
+    index = np.unravel_index(np.arange(start, stop), shape)
+    columns = dict(fixed)
+    for (name, values), idx in zip(axes.items(), index):
+        columns[name] = values[idx]
+    return columns
+
+
+def _strided_positions(shape, stride, start, stop):
+    """Titik chunk [start, stop) yang jatuh di grid ber-stride: (indeks lokal, indeks datar grid ber-stride)"""
+    index = np.unravel_index(np.arange(start, stop), shape)
+    keep = np.flatnonzero(np.all([idx % stride == 0 for idx in index], axis=0))
+    strided = tuple(-(-n // stride) for n in shape)
+    return keep, np.ravel_multi_index([idx[keep] // stride for idx in index], strided)
+
+
+def iter_sweep(cycle, params, chunk_size=CHUNK_SIZE, workers=None, stride=1):
+    """Evaluasi grid parameter siklus per chunk.
+
+    Menghasilkan (start, stop, partial) setiap kali satu chunk selesai,
+    dengan start/stop indeks datar pada grid. partial berisi grid OUTPUTS
+    di titik yang indeks tiap sumbunya kelipatan `stride`, ditambah
+    "best" (titik efisiensi terbaik chunk; "index" adalah indeks datar
+    pada grid penuh) dan "target" (indeks datar grid ber-stride). Urutan
+    chunk tidak dijamin jika memakai process pool. `workers=None` memilih
+    otomatis: serial untuk grid kecil, semua core untuk grid di atas
+    PARALLEL_THRESHOLD. Paling banyak 2 × workers chunk berjalan bersamaan.
+    """
+    axes, fixed = sweep_axes(cycle, params)
+    shape = tuple(len(v) for v in axes.values())
+    total = int(np.prod(shape, dtype=np.int64))
+    bounds = [(s, min(s + chunk_size, total)) for s in range(0, total, chunk_size)]
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if total > PARALLEL_THRESHOLD else 1
+
+    def finish(start, stop, target, partial):
+        partial["target"] = target
+        partial["best"]["index"] = start + partial["best"].pop("offset")
+        return start, stop, partial
+
+    if workers <= 1 or len(bounds) <= 1:
+        for start, stop in bounds:
+            keep, target = _strided_positions(shape, stride, start, stop)
+            partial = _evaluate_chunk(cycle, _chunk_columns(axes, fixed, start, stop), None if stride == 1 else keep)
+            yield finish(start, stop, target, partial)
+        return
+
+    # Antrian terbatas: kolom chunk dibuat saat akan dikirim, bukan semuanya di awal
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start, stop in bounds:
+            keep, target = _strided_positions(shape, stride, start, stop)
+            future = pool.submit(_evaluate_chunk, cycle, _chunk_columns(axes, fixed, start, stop),
+                                 None if stride == 1 else keep)
+            pending.append((start, stop, target, future))
+            if len(pending) >= 2 * workers:
+                start, stop, target, future = pending.popleft()
+                yield finish(start, stop, target, future.result())
+        while pending:
+            start, stop, target, future = pending.popleft()
+            yield finish(start, stop, target, future.result())
+
+
+def run_sweep(cycle, params, chunk_size=CHUNK_SIZE, workers=None, on_chunk=None, stride=1):
+    """Evaluasi grid parameter lengkap dan susun hasil berbentuk grid.
+
+    Mengembalikan (axes, results): axes adalah dict sumbu sweep (penuh),
+    results berisi grid eta, W_net, T_max, P_max pada axes[::stride]
+    serta "best": titik efisiensi maksimum pada grid penuh (index berupa
+    tuple indeks per sumbu, eta, W_net dan titik keadaan T, P). Dengan
+    stride > 1 memori hasil turun sekitar stride^dimensi kali.
+    `on_chunk(done, total, start, stop, partial)` dipanggil setelah tiap
+    chunk selesai.
+    """
+    axes, _ = sweep_axes(cycle, params)
+    shape = tuple(len(v) for v in axes.values())
+    strided = tuple(-(-n // stride) for n in shape)
+    total = int(np.prod(shape, dtype=np.int64))
+
+    results = {key: np.empty(int(np.prod(strided, dtype=np.int64))) for key in OUTPUTS}
+    best = None
+    done = 0
+    for start, stop, partial in iter_sweep(cycle, params, chunk_size, workers, stride):
+        for key in OUTPUTS:
+            results[key][partial["target"]] = partial[key]
+        candidate = partial["best"]
+        if best is None or candidate["eta"] > best["eta"] or np.isnan(best["eta"]):
+            best = candidate
+        done += stop - start
+        if on_chunk is not None:
+            on_chunk(done, total, start, stop, partial)
+
+    for key in OUTPUTS:
+        results[key] = results[key].reshape(strided)
+    if best is not None:
+        best["index"] = tuple(int(i) for i in np.unravel_index(best["index"], shape))
+    results["best"] = best
+    return axes, results
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import requests
+
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_DIR = Path(os.environ.get("GASIDEAL_CACHE_DIR", BASE_DIR / ".cache")) / "lottie"
+FALLBACK_PATH = BASE_DIR / "assets" / "lottie_fallback.json"
+
+TIMEOUT = (2.0, 3.0)  # (connect, read) dalam detik
+CACHE_TTL = 24 * 3600  # detik
+
+_session = None
+
+
+def _get_session():
+    """Session HTTP bersama agar koneksi dipakai ulang"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
+def _cache_path(url):
+    return CACHE_DIR / (hashlib.sha256(url.encode("utf-8")).hexdigest()[:16] + ".json")
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(path, data):
+    # Tulis ke file sementara lalu rename agar pembaca lain tidak melihat file setengah jadi
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def load_fallback():
+    """Animasi Lottie bawaan untuk mode offline"""
+    return _read_json(FALLBACK_PATH)
+
+
+def load_lottie(url, ttl=CACHE_TTL, timeout=TIMEOUT):
+    """Muat JSON Lottie dengan urutan: cache disk segar, jaringan, cache disk lama, bawaan.
+
+    Tidak pernah melempar exception; mengembalikan None hanya jika
+    semua sumber gagal.
+    """
+    path = _cache_path(url)
+    cached = None
+    if path.exists():
+        cached = _read_json(path)
+        if cached is not None and time.time() - path.stat().st_mtime < ttl:
+            return cached
+
+    try:
+        r = _get_session().get(url, timeout=timeout)
+        if r.status_code == 200:
+            data = r.json()
+            _write_cache(path, data)
+            return data
+    except (requests.RequestException, ValueError):
+        pass
+
+    if cached is not None:
+        return cached
+    return load_fallback()
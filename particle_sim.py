@@ -0,0 +1,219 @@
+"""Simulasi partikel bola keras untuk gas (hampir) ideal dalam kotak 3D.
+
+Partikel bergerak bebas (streaming) dengan langkah waktu tetap, memantul
+spekular di dinding dan bertumbukan elastis satu sama lain. Deteksi
+tumbukan memakai cell list: partikel diurutkan per sel berukuran ≥ σ
+sehingga hanya pasangan di sel sendiri dan 13 sel tetangga (setengah
+kulit) yang diperiksa, dengan biaya mendekati O(N). Tekanan diukur dari
+impuls yang diterima dinding.
+
+Diameter σ tidak diambil dari ukuran molekul nyata melainkan dari fraksi
+isian η, agar jalan bebas rata-rata sebanding dengan ukuran kotak dan gas
+mencapai kesetimbangan dalam ratusan langkah. Untuk η kecil gas hampir
+ideal; koreksi bola keras diberikan oleh persamaan Carnahan-Starling.
+"""
+import time
+
+import numpy as np
+
+from thermo_engine import R_J, NA
+
+K_B = R_J / NA  # Konstanta Boltzmann (J/K)
+ATM = 101325.0  # Pa
+
+# 13 sel tetangga "setengah kulit": setiap pasangan sel bertetangga diperiksa tepat sekali
+HALF_SHELL = [
+    (dx, dy, dz)
+    for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+    if (dx, dy, dz) > (0, 0, 0)
+]
+
+
+def hard_sphere_z(eta):
+    """Faktor kompresibilitas bola keras Carnahan-Starling"""
+    return (1 + eta + eta**2 - eta**3) / (1 - eta)**3
+
+
+class ParticleGas:
+    """Gas N partikel bola keras dengan massa molar M (g/mol) pada suhu T (K).
+
+    Volume kotak dipilih agar tekanan ideal sama dengan `P` (atm). Semua
+    partikel dimulai dengan laju yang sama (arah acak) sehingga relaksasi
+    menuju distribusi Maxwell-Boltzmann terlihat. Keadaan disimpan di
+    objek sehingga simulasi bisa dilanjutkan per potongan waktu.
+    """
+
+    def __init__(self, N, T, M, P=1.0, packing=0.005, seed=0):
+        self.N, self.T, self.M, self.packing = int(N), float(T), float(M), float(packing)
+        self.m = M / 1000 / NA  # kg per partikel
+        self.volume = self.N * K_B * self.T / (P * ATM)  # m³
+        self.L = self.volume ** (1 / 3)
+        self.sigma = (6 * self.packing * self.volume / (np.pi * self.N)) ** (1 / 3)
+
+        # Posisi dan kecepatan berbentuk (3, N): tiap komponen kontigu untuk gather cepat
+        rng = np.random.default_rng(seed)
+        self.pos = rng.uniform(0, self.L, (3, self.N))
+        direction = rng.normal(size=(3, self.N))
+        direction /= np.linalg.norm(direction, axis=0)
+        self.vel = direction * np.sqrt(3 * K_B * self.T / self.m)
+
+        # Perpindahan per langkah ≈ σ/4 pada laju rms
+        self.dt = 0.25 * self.sigma / np.sqrt(3 * K_B * self.T / self.m)
+        # Sel ≥ σ dengan rata-rata ~1 partikel per sel
+        self.cells = max(1, min(int(self.L / self.sigma), int(round(self.N ** (1 / 3)))))
+
+        self.time = 0.0
+        self.steps = 0
+        self.collisions = 0
+        self.impulse = 0.0  # Total impuls ke dinding (N·s)
+
+    # === DINAMIKA ===
+    def step(self):
+        """Satu langkah: streaming, pantulan dinding, lalu tumbukan antarpartikel"""
+        self.pos += self.vel * self.dt
+
+        low = self.pos < 0
+        high = self.pos > self.L
+        wall = low | high
+        self.impulse += 2 * self.m * np.abs(self.vel[wall]).sum()
+        self.pos[low] = -self.pos[low]
+        self.pos[high] = 2 * self.L - self.pos[high]
+        self.vel[wall] = -self.vel[wall]
+
+        self._collide()
+        self.time += self.dt
+        self.steps += 1
+
+    def _sort_cells(self):
+        """Urutkan partikel menurut sel; mengembalikan (indeks sel, koordinat sel) terurut.
+
+        Partikel identik sehingga urutannya bebas diubah. Karena partikel
+        hanya bergeser sedikit per langkah, array sudah hampir terurut dan
+        sort stabil (timsort) murah.
+        """
+        nc = self.cells
+        idx = np.minimum((self.pos * (nc / self.L)).astype(np.int64), nc - 1)
+        cell = (idx[0] * nc + idx[1]) * nc + idx[2]
+        order = np.argsort(cell, kind="stable")
+        self.pos = self.pos[:, order]
+        self.vel = self.vel[:, order]
+        return cell[order], idx[:, order]
+
+    def _candidate_pairs(self):
+        """Pasangan (a, b) yang saling tumpang tindih dan saling mendekat, dari cell list"""
+        nc = self.cells
+        cell, idx = self._sort_cells()
+        x, y, z = self.pos
+        sigma2 = self.sigma**2
+        pairs_a, pairs_b = [], []
+
+        def check(p, q):
+            close = (x[p] - x[q]) ** 2 + (y[p] - y[q]) ** 2 + (z[p] - z[q]) ** 2 < sigma2
+            if close.any():
+                pairs_a.append(p[close])
+                pairs_b.append(q[close])
+
+        # Sel yang sama: anggotanya berurutan, jadi cukup bandingkan dengan geseran s
+        p = np.flatnonzero(cell[1:] == cell[:-1])
+        s = 1
+        while p.size:
+            check(p, p + s)
+            s += 1
+            p = p[p + s < self.N]
+            p = p[cell[p + s] == cell[p]]
+
+        # Sel tetangga: hanya partikel yang berjarak < σ dari sisi bersama
+        counts = np.bincount(cell, minlength=nc**3)
+        starts = np.cumsum(counts) - counts
+        frac = self.pos * (nc / self.L) - idx
+        reach = self.sigma * nc / self.L
+        near_low = (frac < reach) & (idx > 0)
+        near_high = (frac > 1 - reach) & (idx < nc - 1)
+        for dx, dy, dz in HALF_SHELL:
+            inside = np.ones(self.N, dtype=bool)
+            for axis, d in enumerate((dx, dy, dz)):
+                if d < 0:
+                    inside &= near_low[axis]
+                elif d > 0:
+                    inside &= near_high[axis]
+            p = np.flatnonzero(inside)
+            nb_cell = cell[p] + (dx * nc + dy) * nc + dz
+            first, count = starts[nb_cell], counts[nb_cell]
+            k = 0
+            while p.size:
+                # Anggota ke-k sel tetangga untuk semua partikel yang masih punya anggota ke-k
+                keep = count > k
+                p, first, count = p[keep], first[keep], count[keep]
+                check(p, first + k)
+                k += 1
+
+        if not pairs_a:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        a, b = np.concatenate(pairs_a), np.concatenate(pairs_b)
+        d = self.pos[:, a] - self.pos[:, b]
+        approaching = np.einsum("ij,ij->j", self.vel[:, a] - self.vel[:, b], d) < 0
+        return a[approaching], b[approaching]
+
+    def _collide(self):
+        a, b = self._candidate_pairs()
+        if a.size == 0:
+            return
+        # Partikel yang terlibat >1 tumbukan dalam satu langkah ditunda ke langkah berikutnya
+        involved = np.bincount(np.concatenate([a, b]), minlength=self.N)
+        single = (involved[a] == 1) & (involved[b] == 1)
+        a, b = a[single], b[single]
+
+        # Tumbukan elastis massa sama: tukar komponen kecepatan relatif searah garis pusat
+        normal = self.pos[:, a] - self.pos[:, b]
+        normal /= np.linalg.norm(normal, axis=0)
+        dv = np.einsum("ij,ij->j", self.vel[:, a] - self.vel[:, b], normal) * normal
+        self.vel[:, a] -= dv
+        self.vel[:, b] += dv
+        self.collisions += a.size
+
+    def advance(self, budget=0.5, max_steps=None):
+        """Jalankan langkah hingga `budget` detik waktu dinding (atau `max_steps`) habis"""
+        start = time.perf_counter()
+        done = 0
+        while (max_steps is None or done < max_steps) and (done == 0 or time.perf_counter() - start < budget):
+            self.step()
+            done += 1
+        return done
+
+    # === PENGAMATAN ===
+    def speeds(self):
+        return np.linalg.norm(self.vel, axis=0)
+
+    def speed_histogram(self, bins=60, v_max=None):
+        """(pusat bin, densitas) laju partikel dalam m/s"""
+        v = self.speeds()
+        v_max = v_max or 4 * np.sqrt(2 * K_B * self.T / self.m)
+        density, edges = np.histogram(v, bins=bins, range=(0, v_max), density=False)
+        density = density / (self.N * np.diff(edges))
+        return 0.5 * (edges[1:] + edges[:-1]), density
+
+    def observables(self):
+        """Besaran makroskopik hasil simulasi dan pembandingnya"""
+        v = self.speeds()
+        T_kin = self.m * np.mean(v**2) / (3 * K_B)
+        P_ideal = self.N * K_B * self.T / self.volume
+        P = self.impulse / (self.time * 6 * self.L**2) if self.time > 0 else np.nan
+        n_density = self.N / self.volume
+        mean_free_path = 1 / (np.sqrt(2) * np.pi * self.sigma**2 * n_density)
+        return {
+            "time": self.time,
+            "steps": self.steps,
+            "collisions": self.collisions,
+            "collisions_per_particle": 2 * self.collisions / self.N,
+            "T_kin": T_kin,
+            "v_avg": np.mean(v),
+            "v_rms": np.sqrt(np.mean(v**2)),
+            "P": P / ATM,
+            "P_ideal": P_ideal / ATM,
+            "Z": P / P_ideal,
+            "Z_hard_sphere": hard_sphere_z(self.packing),
+            "mean_free_path": mean_free_path,
+            "box": self.L,
+            "sigma": self.sigma,
+        }
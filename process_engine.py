@@ -0,0 +1,132 @@
+import numpy as np
+
+from thermo_engine import R, L_ATM_TO_J, van_der_waals
+
+# Proses umum yang diintegrasikan secara numerik
+PROCESSES = ("politropik", "vdw_isotermal", "vdw_adiabatik")
+
+REFERENCE_POINTS = 257  # grid referensi untuk estimasi kelengkungan
+
+
+def _column(x):
+    return np.atleast_1d(np.asarray(x, dtype=float))[:, None]
+
+
+def _trapezoid_rows(y, x):
+    """Integral trapesium per baris untuk grid tidak seragam"""
+    return 0.5 * ((y[:, 1:] + y[:, :-1]) * np.diff(x, axis=1)).sum(axis=1)
+
+
+def adaptive_nodes(pressure, V1, V2, num=129, adaptive=True):
+    """Titik lintasan V (batch, num) dengan kerapatan mengikuti kelengkungan P(V).
+
+    Kerapatan titik sebanding dengan |P''|^(1/3) (ekuidistribusi galat
+    trapesium), dihitung dari grid referensi lalu diinversi untuk semua
+    baris sekaligus. Dengan `adaptive=False` grid seragam dipakai.
+    """
+    V1, V2 = _column(V1), _column(V2)
+    u = np.linspace(0, 1, num)[None, :]
+    if not adaptive:
+        return V1 + (V2 - V1) * u
+
+    u_ref = np.linspace(0, 1, REFERENCE_POINTS)
+    V_ref = V1 + (V2 - V1) * u_ref[None, :]
+    P_ref = pressure(V_ref)
+    curvature = np.abs(np.gradient(np.gradient(P_ref, u_ref, axis=1), u_ref, axis=1))
+    density = np.cbrt(curvature)
+    # Lantai kerapatan agar daerah datar tetap mendapat titik
+    density += 0.1 * density.mean(axis=1, keepdims=True) + 1e-12
+
+    cum = np.concatenate([np.zeros((len(V1), 1)),
+                          np.cumsum(0.5 * (density[:, 1:] + density[:, :-1]), axis=1)], axis=1)
+    cum /= cum[:, -1:]
+
+    # Inversi cum(u) untuk semua baris: geser tiap baris agar satu searchsorted cukup
+    rows = np.arange(len(V1))[:, None] * 2.0
+    flat = (cum + rows).ravel()
+    targets = (u + rows).ravel()
+    idx = np.clip(np.searchsorted(flat, targets), 1, flat.size - 1)
+    lo, hi = flat[idx - 1], flat[idx]
+    same_row = (idx % REFERENCE_POINTS) != 0
+    frac = np.where(same_row & (hi > lo), (targets - lo) / np.where(hi > lo, hi - lo, 1), 0)
+    u_ref_flat = np.tile(u_ref, len(V1))
+    u_nodes = np.where(same_row, u_ref_flat[idx - 1] + frac * (u_ref_flat[idx] - u_ref_flat[idx - 1]),
+                       u_ref_flat[idx])
+    u_nodes = u_nodes.reshape(len(V1), num)
+    u_nodes[:, 0], u_nodes[:, -1] = 0.0, 1.0
+    return V1 + (V2 - V1) * u_nodes
+
+
+def _finish(n, V, P, T, U1, U2):
+    """Energi proses dari satu lintasan bersama (konvensi w = kerja pada sistem)"""
+    W_by = _trapezoid_rows(P, V) * L_ATM_TO_J  # ∫P dV oleh gas
+    w = -W_by
+    dU = U2 - U1
+    q = dU - w
+    dH = dU + (P[:, -1] * V[:, -1] - P[:, 0] * V[:, 0]) * L_ATM_TO_J
+    return {
+        "P1": P[:, 0], "P2": P[:, -1], "T1": T[:, 0], "T2": T[:, -1],
+        "V1": V[:, 0], "V2": V[:, -1],
+        "q": q, "w": w, "dU": dU, "dH": dH,
+        "V": V, "P": P, "T": T,
+    }
+
+
+def polytropic_process(n, T1, V1, V2, k, Cv, num=129, adaptive=True):
+    """Proses politropik PVᵏ = konstan untuk gas ideal (batch).
+
+    Semua argumen boleh berupa array sepanjang B. Cv dalam J/mol·K.
+    Mengembalikan dict berisi keadaan awal/akhir, q, w, dU, dH (J) dan
+    lintasan V, P, T berbentuk (B, num).
+    """
+    n, T1, V1, V2, k, Cv = (_column(x) for x in np.broadcast_arrays(n, T1, V1, V2, k, Cv))
+    P1 = n * R * T1 / V1
+
+    V = adaptive_nodes(lambda V: P1 * (V1 / V)**k, V1[:, 0], V2[:, 0], num, adaptive)
+    P = P1 * (V1 / V)**k
+    T = P * V / (n * R)
+
+    U1 = (n * Cv * T[:, :1])[:, 0]
+    U2 = (n * Cv * T[:, -1:])[:, 0]
+    return _finish(n[:, 0], V, P, T, U1, U2)
+
+
+def vdw_process(kind, n, T1, V1, V2, a, b, Cv, num=129, adaptive=True):
+    """Proses reversibel gas Van der Waals (batch).
+
+    `kind` adalah "isotermal" atau "adiabatik" (T(V - nb)^(R/Cv) konstan).
+    a dalam L²·atm/mol², b dalam L/mol, Cv dalam J/mol·K. Energi dalam
+    U = n·Cv·T - a·n²/V.
+    """
+    n, T1, V1, V2, a, b, Cv = (_column(x) for x in np.broadcast_arrays(n, T1, V1, V2, a, b, Cv))
+    if np.any(np.minimum(V1, V2) <= n * b):
+        raise ValueError("Volume harus lebih besar dari nb")
+    Cv_latm = Cv / L_ATM_TO_J
+
+    if kind == "isotermal":
+        def temperature(V):
+            return T1 * np.ones_like(V)
+    elif kind == "adiabatik":
+        def temperature(V):
+            return T1 * ((V1 - n * b) / (V - n * b))**(R / Cv_latm)
+    else:
+        raise ValueError(f"Proses Van der Waals tidak dikenal: {kind!r}")
+
+    def pressure(V):
+        return van_der_waals(temperature(V), V, n, a, b, R_gas=R)
+
+    V = adaptive_nodes(pressure, V1[:, 0], V2[:, 0], num, adaptive)
+    T = temperature(V)
+    P = pressure(V)
+
+    U = n * Cv * T - a * n**2 / V * L_ATM_TO_J
+    return _finish(n[:, 0], V, P, T, U[:, 0], U[:, -1])
+
+
+def solve_process_batch(process, n, T1, V1, V2, Cv, k=None, a=None, b=None, num=129, adaptive=True):
+    """Satu pintu untuk proses di PROCESSES, semua parameter boleh berupa array"""
+    if process == "politropik":
+        return polytropic_process(n, T1, V1, V2, k, Cv, num, adaptive)
+    if process in ("vdw_isotermal", "vdw_adiabatik"):
+        return vdw_process(process.split("_")[1], n, T1, V1, V2, a, b, Cv, num, adaptive)
+    raise ValueError(f"Proses tidak dikenal: {process!r}")
@@ -0,0 +1,162 @@
+"""Instrumentasi per rerun (opt-in): timer fase, ukuran payload dan log JSON.
+
+Aktifkan lewat checkbox "Profiling" di sidebar atau variabel lingkungan
+GASIDEAL_PROFILE=1. Setiap rerun menambahkan satu baris JSON ke
+GASIDEAL_PROFILE_LOG (default .cache/profile.jsonl). Ringkasan p50/p99:
+
+    python profiling.py summarize .cache/profile.jsonl
+"""
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+LOG_PATH = Path(os.environ.get("GASIDEAL_PROFILE_LOG", BASE_DIR / ".cache" / "profile.jsonl"))
+ENABLED_BY_DEFAULT = os.environ.get("GASIDEAL_PROFILE", "") not in ("", "0")
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+class RerunProfiler:
+    """Pencatat waktu satu rerun skrip.
+
+    `checkpoint(name)` mengatribusikan waktu sejak checkpoint sebelumnya
+    ke fase `name`; `phase(name)` mengukur blok bersarang (mis. render
+    grafik) beserta ukuran payload-nya.
+    """
+
+    def __init__(self, mode=None, session=None):
+        self.mode = mode
+        self.session = session
+        self.start = time.perf_counter()
+        self._last = self.start
+        self.phases = []
+        self.renders = []
+
+    def checkpoint(self, name):
+        now = time.perf_counter()
+        self.phases.append({"name": name, "ms": (now - self._last) * 1e3})
+        self._last = now
+
+    @contextmanager
+    def phase(self, name, payload=None):
+        start = time.perf_counter()
+        entry = {"name": name, "ms": 0.0, "bytes": 0}
+        try:
+            yield entry
+        finally:
+            entry["ms"] = (time.perf_counter() - start) * 1e3
+            if payload is not None:
+                entry["bytes"] = int(payload() or 0)
+            self.renders.append(entry)
+
+    def add_payload(self, name, nbytes):
+        self.renders.append({"name": name, "ms": 0.0, "bytes": int(nbytes)})
+
+    @property
+    def total_ms(self):
+        return (time.perf_counter() - self.start) * 1e3
+
+    def record(self):
+        return {
+            "ts": time.time(),
+            "session": self.session,
+            "mode": self.mode,
+            "total_ms": self.total_ms,
+            "phases": {p["name"]: round(p["ms"], 3) for p in self.phases},
+            "renders": [{k: (round(v, 3) if isinstance(v, float) else v) for k, v in r.items()}
+                        for r in self.renders],
+            "payload_bytes": sum(r["bytes"] for r in self.renders),
+        }
+
+    def write_log(self, path=LOG_PATH):
+        """Tambahkan satu baris JSON untuk rerun ini"""
+        line = json.dumps(self.record(), ensure_ascii=False)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with _log_lock, open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            pass
+
+
+class _NullProfiler:
+    """Profiler nonaktif: semua operasi tanpa efek"""
+
+    mode = None
+
+    def checkpoint(self, name):
+        pass
+
+    @contextmanager
+    def phase(self, name, payload=None):
+        yield {}
+
+    def add_payload(self, name, nbytes):
+        pass
+
+
+_NULL = _NullProfiler()
+
+
+def start(enabled, session=None):
+    """Mulai profiler untuk rerun di thread ini (Streamlit menjalankan tiap sesi di thread sendiri)"""
+    _local.profiler = RerunProfiler(session=session or uuid.uuid4().hex[:8]) if enabled else _NULL
+    return _local.profiler
+
+
+def current():
+    """Profiler rerun yang sedang berjalan, atau profiler nonaktif"""
+    return getattr(_local, "profiler", _NULL)
+
+
+def is_active():
+    return isinstance(current(), RerunProfiler)
+
+
+def percentile(values, q):
+    values = sorted(values)
+    if not values:
+        return float("nan")
+    k = (len(values) - 1) * q / 100
+    lo, hi = int(k), min(int(k) + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def summarize(path=LOG_PATH):
+    """Ringkasan latensi rerun per mode: jumlah, p50, p99 (ms) dan payload rata-rata"""
+    by_mode = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            by_mode.setdefault(rec.get("mode") or "-", []).append(rec)
+
+    summary = {}
+    for mode, recs in sorted(by_mode.items()):
+        totals = [r["total_ms"] for r in recs]
+        summary[mode] = {
+            "count": len(recs),
+            "p50_ms": percentile(totals, 50),
+            "p99_ms": percentile(totals, 99),
+            "payload_kb": sum(r.get("payload_bytes", 0) for r in recs) / len(recs) / 1024,
+        }
+    return summary
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "summarize":
+        print(__doc__)
+        sys.exit(1)
+    log = Path(sys.argv[2]) if len(sys.argv) > 2 else LOG_PATH
+    for mode, s in summarize(log).items():
+        print(f"{mode:<25} n={s['count']:<6} p50={s['p50_ms']:9.1f} ms  "
+              f"p99={s['p99_ms']:9.1f} ms  payload={s['payload_kb']:8.1f} KB")
@@ -0,0 +1,153 @@
+"""Tabel properti gas ideal Cp(T), H(T) dan S(T) yang dihitung sekali.
+
+Fit Shomate di thermo_engine dievaluasi pada grid suhu halus, diintegrasi
+menjadi entalpi dan entropi, lalu disimpan sebagai file .npy biner di
+direktori cache. File dibuka dengan memory map sehingga semua proses
+(sesi Streamlit, worker batch) berbagi halaman yang sama dari page cache
+OS, dan lookup cukup interpolasi linier tervektorisasi tanpa evaluasi
+polinom ulang.
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from thermo_engine import R_J, SHOMATE, STANDARD_ENTROPY, gas_formula, heat_capacity
+
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_DIR = Path(os.environ.get("GASIDEAL_CACHE_DIR", BASE_DIR / ".cache")) / "tables"
+
+# Grid suhu tabel (K); di luar rentang nilai ditahan pada batas grid
+T_MIN, T_MAX, T_STEP = 50.0, 3000.0, 0.5
+T_REF = 298.15  # Keadaan acuan entalpi dan entropi standar
+
+GASES = tuple(SHOMATE)
+CP, H, S = range(3)  # Kolom tabel: Cp (J/mol·K), H - H(298.15 K) (J/mol), S° pada 1 bar (J/mol·K)
+
+_lock = threading.Lock()
+_table = None
+
+
+def temperature_grid():
+    return T_MIN + T_STEP * np.arange(int(round((T_MAX - T_MIN) / T_STEP)) + 1)
+
+
+def _cumulative(y, x):
+    """Integral kumulatif trapesium, mulai dari nol"""
+    return np.concatenate([[0.0], np.cumsum(0.5 * (y[1:] + y[:-1]) * np.diff(x))])
+
+
+def build_table():
+    """Hitung tabel (gas, kolom, suhu) dari fit Shomate"""
+    T = temperature_grid()
+    data = np.empty((len(GASES), 3, len(T)))
+    for i, gas in enumerate(GASES):
+        cp = heat_capacity(gas, T)
+        h = _cumulative(cp, T)
+        s = _cumulative(cp / T, T)
+        data[i, CP] = cp
+        data[i, H] = h - np.interp(T_REF, T, h)
+        data[i, S] = s - np.interp(T_REF, T, s) + STANDARD_ENTROPY[gas]
+    return data
+
+
+def _signature():
+    """Hash isi fit dan grid; file tabel dibangun ulang jika salah satunya berubah"""
+    spec = json.dumps([SHOMATE, STANDARD_ENTROPY, T_MIN, T_MAX, T_STEP, T_REF], sort_keys=True)
+    return hashlib.sha256(spec.encode()).hexdigest()[:16]
+
+
+def table_path():
+    return CACHE_DIR / f"thermo_{_signature()}.npy"
+
+
+def _load(path):
+    """Buka tabel sebagai memory map, bangun dan tulis (atomik) jika belum ada"""
+    if not path.exists():
+        data = build_table()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, data)
+            os.replace(tmp, path)
+        except OSError:
+            return data  # Direktori cache read-only: pakai tabel di memori
+    return np.load(path, mmap_mode="r")
+
+
+class PropertyTable:
+    """Lookup Cp, Cv, H, U dan S per gas dengan interpolasi linier.
+
+    `gas` boleh satu nama (mis. "N₂ (Nitrogen)", "N₂" atau "N2") atau
+    array nama per elemen; T (K) boleh array dan di-broadcast dengan gas.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.T = temperature_grid()
+        self._index = {gas: i for i, gas in enumerate(GASES)}
+
+    def gas_index(self, gas):
+        if isinstance(gas, str):
+            return self._index[gas_formula(gas)]
+        names = np.asarray(gas)
+        unique, inverse = np.unique(names, return_inverse=True)
+        return np.array([self._index[gas_formula(g)] for g in unique])[inverse].reshape(names.shape)
+
+    def _lookup(self, gas, column, T):
+        return self._interp(self.gas_index(gas), column, T)
+
+    def _interp(self, gi, column, T):
+        gi, T = np.broadcast_arrays(gi, np.asarray(T, dtype=float))
+        x = (np.clip(T, T_MIN, T_MAX) - T_MIN) / T_STEP
+        i = np.minimum(x.astype(int), len(self.T) - 2)
+        f = x - i
+        return self.data[gi, column, i] * (1 - f) + self.data[gi, column, i + 1] * f
+
+    def cp(self, gas, T):
+        return self._lookup(gas, CP, T)
+
+    def cv(self, gas, T):
+        return self._lookup(gas, CP, T) - R_J
+
+    def enthalpy(self, gas, T):
+        """H(T) - H(298.15 K) dalam J/mol"""
+        return self._lookup(gas, H, T)
+
+    def internal_energy(self, gas, T):
+        """U(T) - U(298.15 K) dalam J/mol"""
+        return self._lookup(gas, H, T) - R_J * (np.asarray(T, dtype=float) - T_REF)
+
+    def entropy(self, gas, T):
+        """S°(T) pada 1 bar dalam J/mol·K"""
+        return self._lookup(gas, S, T)
+
+    def adiabatic_temperature(self, gas, T1, volume_ratio):
+        """Suhu akhir proses adiabatik reversibel dengan V2/V1 = volume_ratio.
+
+        Dari ∫Cv/T dT = -R ln(V2/V1): fungsi φ(T) = S°(T) - R ln T naik
+        monoton sehingga T2 didapat dari interpolasi balik pada tabel.
+        """
+        gi, T1, ratio = np.broadcast_arrays(self.gas_index(gas), np.asarray(T1, dtype=float),
+                                            np.asarray(volume_ratio, dtype=float))
+        target = self._interp(gi, S, T1) - R_J * np.log(T1) - R_J * np.log(ratio)
+        T2 = np.empty(target.shape)
+        for g in np.unique(gi):
+            mask = gi == g
+            phi = self.data[g, S] - R_J * np.log(self.T)
+            T2[mask] = np.interp(target[mask], phi, self.T)
+        return T2
+
+
+def get_table():
+    """Tabel bersama untuk proses ini (memory map dari file cache)"""
+    global _table
+    if _table is None:
+        with _lock:
+            if _table is None:
+                _table = PropertyTable(_load(table_path()))
+    return _table
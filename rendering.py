@@ -0,0 +1,310 @@
+import io
+import os
+import sys
+
+try:
+    import resource  # Hanya POSIX; di Windows RSS puncak tidak dilaporkan
+except ImportError:
+    resource = None
+
+import numpy as np
+import streamlit as st
+
+import profiling
+
+BACKENDS = ("Matplotlib", "Plotly")
+PNG_CACHE_ENTRIES = 64  # PNG grafik matplotlib yang dibagi antar sesi (masing-masing ~100-400 KB)
+# Lebar maksimum konten Streamlit (px); gambar yang lebih lebar diperkecil ulang oleh st.image tiap render
+MAX_IMAGE_WIDTH = 2 * 730
+
+_MPL_STYLES = {"solid": "-", "dash": "--", "dot": ":"}
+
+
+def new_figure(figsize=(10, 6), **subplot_kw):
+    """Figure matplotlib tanpa pyplot.
+
+    Figure dibuat langsung dari matplotlib.figure.Figure sehingga tidak
+    didaftarkan ke figure manager global pyplot dan bisa dibebaskan GC
+    setelah dirender.
+    """
+    from matplotlib.figure import Figure  # diimpor saat grafik matplotlib pertama dibuat
+
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots(**subplot_kw)
+
+
+def _savefig(fig):
+    """PNG figure (pengaturan savefig sama dengan st.pyplot), lalu lepaskan isinya.
+
+    PNG langsung diperkecil ke MAX_IMAGE_WIDTH dengan resampling yang sama
+    seperti st.image, sehingga Streamlit meneruskannya tanpa decode dan
+    encode ulang (penting untuk PNG yang diambil dari cache).
+    """
+    from PIL import Image
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    fig.clear()
+    image = Image.open(buf)
+    if image.width > MAX_IMAGE_WIDTH:
+        image = image.resize((MAX_IMAGE_WIDTH, int(image.height * MAX_IMAGE_WIDTH / image.width)),
+                             resample=Image.BILINEAR)
+        buf = io.BytesIO()
+        image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _render_png(name, render):
+    with profiling.current().phase(f"pyplot: {name}") as entry:
+        png = render()
+        st.image(png, width="stretch", output_format="PNG")
+    entry["bytes"] = len(png)
+
+
+def show_matplotlib(fig, name="matplotlib"):
+    """Render figure matplotlib lalu lepaskan isinya"""
+    _render_png(name, lambda: _savefig(fig))
+
+
+# PNG dibagi oleh semua sesi dalam satu proses server: grafik dengan input sama
+# (mis. peta Z untuk n default) dirender matplotlib sekali, bukan per sesi per rerun.
+# Kunci cache adalah nama builder dan seluruh argumennya (array di-hash isinya).
+@st.cache_resource(max_entries=PNG_CACHE_ENTRIES, show_spinner=False)
+def _cached_png(builder, *args, **kwargs):
+    return _savefig(_BUILDERS[builder](*args, **kwargs))
+
+
+def _show_cached(builder, name, *args, **kwargs):
+    _render_png(name, lambda: _cached_png(builder, *args, **kwargs))
+
+
+def show_plotly(fig, name="plotly"):
+    """Render figure Plotly; ukuran JSON dicatat saat profiling aktif"""
+    payload = (lambda: len(fig.to_json())) if profiling.is_active() else None
+    with profiling.current().phase(f"plotly: {name}", payload=payload):
+        st.plotly_chart(fig, width="stretch")
+
+
+def lttb(x, y, threshold):
+    """Indeks downsampling Largest-Triangle-Three-Buckets.
+
+    `y` boleh berbentuk (n,) atau (B, n) dengan `x` bersama (n,). Untuk
+    input 2D tiap baris memilih titiknya sendiri, namun bucket diproses
+    serentak untuk semua baris. Titik pertama dan terakhir selalu
+    dipertahankan. Mengembalikan indeks (threshold,) atau (B, threshold).
+    """
+    x = np.asarray(x, dtype=float)
+    y2 = np.atleast_2d(np.asarray(y, dtype=float))
+    rows, n = y2.shape
+    if threshold >= n or threshold < 3:
+        idx = np.broadcast_to(np.arange(n), (rows, n))
+        return idx[0] if np.ndim(y) == 1 else idx
+
+    # threshold - 2 bucket di antara titik pertama dan terakhir
+    edges = (np.arange(threshold - 1) * (n - 2) / (threshold - 2)).astype(int) + 1
+    edges[-1] = n - 1
+    idx = np.empty((rows, threshold), dtype=int)
+    idx[:, 0], idx[:, -1] = 0, n - 1
+    row = np.arange(rows)
+    a = np.zeros(rows, dtype=int)
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt = slice(hi, edges[i + 2] if i + 2 < len(edges) else n)
+        cx, cy = x[nxt].mean(), y2[:, nxt].mean(axis=1)
+        ax, ay = x[a][:, None], y2[row, a][:, None]
+        area = np.abs((ax - cx) * (y2[:, lo:hi] - ay) - (ax - x[lo:hi]) * (cy[:, None] - ay))
+        a = lo + area.argmax(axis=1)
+        idx[:, i + 1] = a
+    return idx[0] if np.ndim(y) == 1 else idx
+
+
+def downsample(x, y, threshold):
+    """Pasangan (x, y) float32 hasil LTTB, siap dikirim sebagai trace WebGL.
+
+    Untuk `y` 2D hasilnya berbentuk (B, threshold) karena tiap baris
+    memilih titik x-nya sendiri.
+    """
+    idx = lttb(x, y, threshold)
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if y.ndim == 1:
+        return x[idx].astype(np.float32), y[idx].astype(np.float32)
+    return x[idx].astype(np.float32), np.take_along_axis(y, idx, axis=1).astype(np.float32)
+
+
+def animated_line_chart(x, curves, frame_values, title, xlabel, ylabel,
+                        frame_label="{:.0f}", slider_prefix="", points=200, name="animasi"):
+    """Kurva Plotly beranimasi: satu frame per baris `curves`.
+
+    Semua frame dikirim sekaligus dan slider/tombol putar berjalan di
+    browser tanpa rerun server. Tiap frame didownsampling dengan LTTB ke
+    `points` titik dan digambar dengan Scattergl. Sumbu dikunci ke
+    rentang seluruh frame agar animasi tidak melompat.
+    """
+    import plotly.graph_objects as go
+
+    xs, ys = downsample(x, curves, points)
+    labels = [frame_label.format(v) for v in frame_values]
+    fig = go.Figure(
+        data=[go.Scattergl(x=xs[0], y=ys[0], mode="lines", line=dict(color="blue", width=2),
+                           name=slider_prefix + labels[0])],
+        # Nama frame memakai indeks: label terformat bisa kembar (mis. "{:.0f}" untuk suhu berdekatan)
+        frames=[go.Frame(data=[go.Scattergl(x=fx, y=fy, name=slider_prefix + label)], name=str(i))
+                for i, (fx, fy, label) in enumerate(zip(xs, ys, labels))],
+    )
+    step_args = dict(mode="immediate", frame=dict(duration=0, redraw=True), transition=dict(duration=0))
+    fig.update_layout(
+        title=title, height=450,
+        xaxis=dict(title=xlabel, range=[float(np.min(x)), float(np.max(x))]),
+        yaxis=dict(title=ylabel, range=[0, float(np.max(curves)) * 1.05]),
+        updatemenus=[dict(
+            type="buttons", direction="left", x=0, y=-0.15, xanchor="left", yanchor="top",
+            buttons=[
+                dict(label="▶", method="animate",
+                     args=[None, dict(step_args, frame=dict(duration=60, redraw=True), fromcurrent=True)]),
+                dict(label="⏸", method="animate", args=[[None], step_args]),
+            ],
+        )],
+        sliders=[dict(
+            x=0.1, y=-0.1, len=0.9, currentvalue=dict(prefix=slider_prefix),
+            steps=[dict(label=label, method="animate", args=[[str(i)], step_args]) for i, label in enumerate(labels)],
+        )],
+    )
+    show_plotly(fig, name)
+
+
+def line_chart(traces, title, xlabel, ylabel, backend="Matplotlib",
+               ylim=None, xlog=False, points=None, legend_size=12):
+    """Diagram garis dengan backend matplotlib atau Plotly.
+
+    `traces` adalah list dict dengan kunci x, y, label dan opsional
+    color, dash ("solid"/"dash"/"dot"), width dan fill (warna isian ke
+    sumbu x). `points` adalah (x, y) titik keadaan yang ditandai.
+    """
+    if backend == "Plotly":
+        import plotly.graph_objects as go
+
+        fig = go.Figure()
+        for tr in traces:
+            fig.add_trace(go.Scatter(
+                x=tr["x"], y=tr["y"], name=tr["label"], mode="lines",
+                line=dict(color=tr.get("color"), dash=tr.get("dash", "solid"), width=tr.get("width", 2)),
+                fill="tozeroy" if tr.get("fill") else None,
+            ))
+        if points is not None:
+            fig.add_trace(go.Scatter(x=points[0], y=points[1], mode="markers",
+                                     marker=dict(color="red", size=12), showlegend=False))
+        fig.update_layout(title=title.replace("\n", "<br>"), height=450)
+        fig.update_xaxes(title_text=xlabel, type="log" if xlog else "linear")
+        fig.update_yaxes(title_text=ylabel, range=list(ylim) if ylim else None)
+        show_plotly(fig, title.split("\n")[0])
+        return
+
+    _show_cached("line", title.split("\n")[0], traces, title, xlabel, ylabel, ylim, xlog, points, legend_size)
+
+
+def _line_figure(traces, title, xlabel, ylabel, ylim, xlog, points, legend_size):
+    fig, ax = new_figure()
+    for tr in traces:
+        ax.plot(tr["x"], tr["y"], _MPL_STYLES[tr.get("dash", "solid")], color=tr.get("color"),
+                linewidth=tr.get("width", 2), label=tr["label"])
+        if tr.get("fill"):
+            ax.fill_between(tr["x"], tr["y"], alpha=0.3, color=tr["fill"])
+    if points is not None:
+        ax.scatter(*points, color='red', s=100, zorder=5)
+    if xlog:
+        ax.set_xscale('log')
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.set_title(title, fontsize=14)
+    if ylim:
+        ax.set_ylim(*ylim)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=legend_size)
+    return fig
+
+
+def heatmap_row(maps, x, y, titles, xlabel, ylabel, colorbar_label,
+                backend="Matplotlib", cmap="RdBu_r", vmin=None, vmax=None):
+    """Satu baris heatmap berbagi sumbu, satu panel per array di `maps`"""
+    if backend == "Plotly":
+        from plotly.subplots import make_subplots
+        import plotly.graph_objects as go
+
+        fig = make_subplots(rows=1, cols=len(maps), subplot_titles=titles, shared_yaxes=True)
+        for i, z in enumerate(maps):
+            fig.add_trace(go.Heatmap(x=x, y=y, z=z, zmin=vmin, zmax=vmax, colorscale=cmap,
+                                     showscale=(i == 0), colorbar=dict(title=colorbar_label)),
+                          row=1, col=i + 1)
+            fig.update_xaxes(title_text=xlabel, row=1, col=i + 1)
+        fig.update_yaxes(title_text=ylabel, row=1, col=1)
+        fig.update_layout(height=400)
+        show_plotly(fig, colorbar_label)
+        return
+
+    _show_cached("heatmap", colorbar_label, maps, x, y, titles, xlabel, ylabel, colorbar_label, cmap, vmin, vmax)
+
+
+def _heatmap_figure(maps, x, y, titles, xlabel, ylabel, colorbar_label, cmap, vmin, vmax):
+    fig, axes = new_figure(figsize=(18, 4), nrows=1, ncols=len(maps), sharey=True)
+    axes = np.atleast_1d(axes)
+    extent = [x[0], x[-1], y[0], y[-1]]
+    for ax, title, z in zip(axes, titles, maps):
+        im = ax.imshow(z, origin='lower', aspect='auto', extent=extent, cmap=cmap, vmin=vmin, vmax=vmax)
+        ax.set_title(title, fontsize=12)
+        ax.set_xlabel(xlabel)
+    axes[0].set_ylabel(ylabel)
+    fig.colorbar(im, ax=axes, label=colorbar_label)
+    return fig
+
+
+def contour_chart(x, y, z, title, xlabel, ylabel, colorbar_label,
+                  backend="Matplotlib", cmap="viridis", levels=20):
+    """Kontur terisi z(x, y); z berbentuk (len(x), len(y))"""
+    if backend == "Plotly":
+        import plotly.graph_objects as go
+
+        fig = go.Figure(go.Contour(x=x, y=y, z=z.T, colorscale=cmap, ncontours=levels,
+                                   colorbar=dict(title=colorbar_label)))
+        fig.update_layout(title=title, height=450)
+        fig.update_xaxes(title_text=xlabel)
+        fig.update_yaxes(title_text=ylabel)
+        show_plotly(fig, title)
+        return
+
+    _show_cached("contour", title, x, y, z, title, xlabel, ylabel, colorbar_label, cmap, levels)
+
+
+def _contour_figure(x, y, z, title, xlabel, ylabel, colorbar_label, cmap, levels):
+    fig, ax = new_figure(figsize=(8, 6))
+    cs = ax.contourf(x, y, z.T, levels=levels, cmap=cmap)
+    ax.contour(x, y, z.T, levels=cs.levels[::4], colors='k', linewidths=0.5, alpha=0.5)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.set_title(title, fontsize=14)
+    fig.colorbar(cs, ax=ax, label=colorbar_label)
+    return fig
+
+
+_BUILDERS = {"line": _line_figure, "heatmap": _heatmap_figure, "contour": _contour_figure}
+
+
+def memory_usage():
+    """Pemakaian memori proses server dalam MB: (RSS saat ini, RSS puncak); None jika tidak tersedia"""
+    peak_mb = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss dalam KB di Linux, byte di macOS
+        peak_mb = peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+    try:
+        with open("/proc/self/statm") as f:
+            rss_mb = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024**2
+    except OSError:
+        rss_mb = peak_mb
+    return rss_mb, peak_mb
+
+
+def open_pyplot_figures():
+    """Jumlah figure yang masih dipegang figure manager pyplot"""
+    plt = sys.modules.get("matplotlib.pyplot")  # jangan impor pyplot hanya untuk menghitung
+    return len(plt.get_fignums()) if plt else 0
@@ -0,0 +1,238 @@
+"""Riwayat run persisten (SQLite) untuk hasil keadaan, proses dan siklus.
+
+Setiap run disimpan dengan kunci hash parameternya, sehingga input yang
+sama dilayani dari store tanpa dihitung ulang dan run lama bisa
+ditampilkan serta dibandingkan. Selain run utuh, tabel `parts` menyimpan
+hasil per baris (mis. varian politropik), sehingga saat sebagian input
+berubah hanya baris yang terdampak yang dihitung. Scope bagian diawali
+nama mode ("<mode>/<nama>") dan jumlah barisnya dibatasi MAX_PARTS;
+tabel `runs` dibatasi MAX_RUNS run yang terakhir dipakai.
+
+Kunci hash memuat FORMULA_VERSION: naikkan nilainya saat rumus engine
+berubah agar hasil lama tidak dipakai ulang.
+
+Hasil berupa dict datar berisi angka/array; disimpan sebagai .npz biner
+(tanpa pickle).
+"""
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_DIR = Path(os.environ.get("GASIDEAL_CACHE_DIR", BASE_DIR / ".cache"))
+DB_PATH = Path(os.environ.get("GASIDEAL_RUNS_DB", CACHE_DIR / "runs.sqlite"))
+
+FORMULA_VERSION = 2  # Versi rumus thermo_engine/process_engine/cycle_engine untuk kunci hash
+SCHEMA_VERSION = 2  # PRAGMA user_version; tabel parts dibuat ulang saat versinya naik
+MAX_PARTS = 20_000  # Baris tabel parts; yang tertua dihapus lebih dulu
+MAX_RUNS = 5_000  # Baris tabel runs; yang paling lama tidak dipakai dihapus lebih dulu
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    mode TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    params TEXT NOT NULL,
+    result BLOB NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (mode, key)
+);
+CREATE INDEX IF NOT EXISTS runs_mode_kind ON runs (mode, kind, last_used DESC);
+CREATE INDEX IF NOT EXISTS runs_last_used ON runs (last_used DESC);
+CREATE TABLE IF NOT EXISTS parts (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    result BLOB NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (scope, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS parts_created ON parts (created);
+"""
+
+
+def _plain(value):
+    """Nilai JSON kanonik: skalar/array NumPy menjadi list/angka Python, angka selalu float"""
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_plain(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)  # 1 dan 1.0 harus menghasilkan kunci yang sama
+    return value
+
+
+def params_key(params):
+    """Hash parameter (dan versi rumus) yang tidak bergantung urutan kunci"""
+    text = json.dumps(_plain(params), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"v{FORMULA_VERSION}:{text}".encode()).hexdigest()[:32]
+
+
+def encode(result):
+    buf = io.BytesIO()
+    np.savez(buf, **{k: np.asarray(v) for k, v in result.items()})
+    return buf.getvalue()
+
+
+def decode(blob):
+    with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+        return {k: (data[k].item() if data[k].ndim == 0 else data[k]) for k in data.files}
+
+
+class RunStore:
+    """Store SQLite bersama; satu koneksi per thread (tiap sesi Streamlit punya thread sendiri)"""
+
+    def __init__(self, path=DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS parts")  # Skema lama tanpa kolom created
+            conn.executescript(SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # === RUN UTUH ===
+    def get(self, mode, params):
+        """(id, hasil) run tersimpan untuk parameter ini, atau None"""
+        key = params_key(params)
+        with self._conn() as conn:
+            row = conn.execute("SELECT id, result FROM runs WHERE mode = ? AND key = ?", (mode, key)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE runs SET hits = hits + 1, last_used = ? WHERE id = ?", (time.time(), row[0]))
+        return row[0], decode(row[1])
+
+    def put(self, mode, kind, params, result):
+        """Simpan (atau timpa) run; mengembalikan id run"""
+        now = time.time()
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO runs (mode, kind, key, params, result, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (mode, key) DO UPDATE SET result = excluded.result, last_used = excluded.last_used",
+                (mode, kind, params_key(params), json.dumps(_plain(params), ensure_ascii=False),
+                 encode(result), now, now),
+            )
+            run_id = conn.execute("SELECT id FROM runs WHERE mode = ? AND key = ?",
+                                  (mode, params_key(params))).fetchone()[0]
+            self._prune_runs(conn)
+            return run_id
+
+    def cached(self, mode, kind, params, compute):
+        """Hasil dari store jika ada, selain itu hitung dan simpan.
+
+        Mengembalikan (id, hasil, dari_store).
+        """
+        hit = self.get(mode, params)
+        if hit is not None:
+            return hit[0], hit[1], True
+        result = compute()
+        return self.put(mode, kind, params, result), result, False
+
+    def history(self, mode=None, limit=50):
+        """Run terbaru (tanpa hasil), diurutkan dari yang terakhir dipakai"""
+        query = "SELECT id, mode, kind, params, created, last_used, hits FROM runs"
+        args = ()
+        if mode is not None:
+            query += " WHERE mode = ?"
+            args = (mode,)
+        rows = self._conn().execute(query + " ORDER BY last_used DESC LIMIT ?", args + (limit,)).fetchall()
+        return [{"id": r[0], "mode": r[1], "kind": r[2], "params": json.loads(r[3]),
+                 "created": r[4], "last_used": r[5], "hits": r[6]} for r in rows]
+
+    def load(self, run_ids):
+        """Parameter dan hasil beberapa run sekaligus, urut sesuai `run_ids`"""
+        run_ids = list(run_ids)
+        if not run_ids:
+            return []
+        marks = ",".join("?" * len(run_ids))
+        rows = self._conn().execute(
+            f"SELECT id, mode, kind, params, result FROM runs WHERE id IN ({marks})", run_ids
+        ).fetchall()
+        by_id = {r[0]: {"id": r[0], "mode": r[1], "kind": r[2], "params": json.loads(r[3]),
+                        "result": decode(r[4])} for r in rows}
+        return [by_id[i] for i in run_ids if i in by_id]
+
+    # === BAGIAN (BARIS) ===
+    def rows(self, scope, rows, compute):
+        """Hasil per baris; hanya baris yang belum tersimpan yang dihitung.
+
+        `compute(list_params)` menghitung baris yang hilang sekaligus dan
+        mengembalikan list dict hasil dengan urutan yang sama. Mengembalikan
+        (list hasil, jumlah baris yang dihitung ulang).
+        """
+        keys = [params_key(r) for r in rows]
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), 500):  # batas jumlah parameter SQLite
+            chunk = unique[start:start + 500]
+            found.update(self._conn().execute(
+                f"SELECT key, result FROM parts WHERE scope = ? AND key IN ({','.join('?' * len(chunk))})",
+                [scope, *chunk],
+            ).fetchall())
+        results = {k: decode(v) for k, v in found.items()}
+
+        first = {}
+        for i, k in enumerate(keys):
+            first.setdefault(k, i)
+        missing = [first[k] for k in unique if k not in results]
+        if missing:
+            computed = compute([rows[i] for i in missing])
+            now = time.time()
+            with self._conn() as conn:
+                conn.executemany("INSERT OR REPLACE INTO parts (scope, key, result, created) VALUES (?, ?, ?, ?)",
+                                 [(scope, keys[i], encode(r), now) for i, r in zip(missing, computed)])
+                self._prune_parts(conn)
+            results.update({keys[i]: r for i, r in zip(missing, computed)})
+        return [results[k] for k in keys], len(missing)
+
+    def _prune_runs(self, conn):
+        excess = conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] - MAX_RUNS
+        if excess > 0:
+            conn.execute("DELETE FROM runs WHERE id IN "
+                         "(SELECT id FROM runs ORDER BY last_used LIMIT ?)", (excess,))
+
+    def _prune_parts(self, conn):
+        excess = conn.execute("SELECT COUNT(*) FROM parts").fetchone()[0] - MAX_PARTS
+        if excess > 0:
+            conn.execute("DELETE FROM parts WHERE (scope, key) IN "
+                         "(SELECT scope, key FROM parts ORDER BY created LIMIT ?)", (excess,))
+
+    def clear(self, mode=None):
+        """Hapus riwayat run dan cache bagian (satu mode atau semuanya)"""
+        with self._conn() as conn:
+            if mode is None:
+                conn.execute("DELETE FROM runs")
+                conn.execute("DELETE FROM parts")
+            else:
+                conn.execute("DELETE FROM runs WHERE mode = ?", (mode,))
+                conn.execute("DELETE FROM parts WHERE substr(scope, 1, ?) = ?", (len(mode) + 1, f"{mode}/"))
+
+    def stats(self):
+        conn = self._conn()
+        return {
+            "runs": conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0],
+            "parts": conn.execute("SELECT COUNT(*) FROM parts").fetchone()[0],
+            "hits": conn.execute("SELECT COALESCE(SUM(hits), 0) FROM runs").fetchone()[0],
+        }
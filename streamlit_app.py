@@ -1,19 +1,130 @@
+# Hanya modul yang dipakai semua mode diimpor di sini. Pustaka berat
+# (pandas, matplotlib, plotly, streamlit_lottie) dan engine per mode diimpor
+# di cabang mode yang memakainya, sehingga cold start hanya membayar impor
+# yang benar-benar dirender.
 import streamlit as st
+import os
+import uuid
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import math
-import requests
-from streamlit_lottie import st_lottie
+import profiling
+from rendering import (
+    BACKENDS, line_chart, heatmap_row, contour_chart, animated_line_chart, downsample,
+    show_plotly, memory_usage, open_pyplot_figures,
+)
+from lottie_loader import load_lottie, CACHE_TTL as LOTTIE_CACHE_TTL
+from thermo_engine import R, R_J, GAS_PROPERTIES, VDW_PARAMS, SHOMATE
 
 # Fungsi untuk memuat animasi Lottie dari URL
+# Satu objek JSON dibagi semua sesi (hanya dibaca), tanpa salinan per rerun;
+# loader sendiri punya timeout, cache disk dan cadangan offline
+@st.cache_resource(ttl=LOTTIE_CACHE_TTL, show_spinner=False)
 def load_lottieurl(url: str):
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
+    return load_lottie(url)
+
+# Cache kurva Maxwell-Boltzmann, dibagi oleh semua sesi dalam satu proses server
+@st.cache_resource(show_spinner=False)
+def get_curve_cache():
+    from curve_cache import CurveCache
+
+    cache = CurveCache(maxsize=256)
+    cache.warm(GAS_PROPERTIES)
+    return cache
+
+# Riwayat run persisten (SQLite), dibagi oleh semua sesi dalam satu proses server
+@st.cache_resource(show_spinner=False)
+def get_run_store():
+    from run_store import RunStore
+
+    return RunStore()
+
+# Leg siklus Brayton/Stirling terakhir, dibagi semua sesi (LRU di memori)
+@st.cache_resource(show_spinner=False)
+def get_leg_cache():
+    from cycle_engine import LegCache
+
+    return LegCache()
+
+# Diagram Maxwell-Boltzmann mode Gas Ideal Dasar untuk (T, M): kurva LTTB dan figure
+# Plotly dibangun sekali lalu dibagi semua sesi (figure hanya dibaca saat dirender)
+@st.cache_resource(max_entries=128, show_spinner=False)
+def maxwell_boltzmann_figure(T, M):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    from curve_cache import REFERENCE_TEMPERATURES
+
+    curve_cache = get_curve_cache()
+    v_range = curve_cache.grid()
+    prob_dist = curve_cache.curve(T, M)
+    temperatures = REFERENCE_TEMPERATURES
+    reference_curves = curve_cache.reference_curves(M, temperatures)
+    # Kurva halus: LTTB ke 200 titik float32 cukup untuk tampilan dan memangkas payload
+    v_plot, prob_plot = downsample(v_range, prob_dist, 200)
+    v_refs, reference_plot = downsample(v_range, reference_curves, 200)
+    
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=('Distribusi Kecepatan', 'Perbandingan Suhu'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}]]
+    )
+    
+    # Plot 1: Distribusi kecepatan pada suhu tertentu
+    fig.add_trace(
+        go.Scattergl(x=v_plot, y=prob_plot, name=f'T = {T:.1f} K', line=dict(color='blue', width=2)),
+        row=1, col=1
+    )
+    
+    # Plot 2: Perbandingan pada berbagai suhu
+    colors = ['blue', 'red', 'green', 'orange']
+    
+    for i, temp in enumerate(temperatures):
+        fig.add_trace(
+            go.Scattergl(x=v_refs[i], y=reference_plot[i], 
+                      name=f'T = {temp} K', 
+                      line=dict(color=colors[i], width=2)),
+            row=1, col=2
+        )
+    
+    fig.update_layout(height=400, showlegend=True)
+    fig.update_xaxes(title_text="Kecepatan (m/s)", row=1, col=1)
+    fig.update_xaxes(title_text="Kecepatan (m/s)", row=1, col=2)
+    fig.update_yaxes(title_text="Probabilitas", row=1, col=1)
+    fig.update_yaxes(title_text="Probabilitas", row=1, col=2)
+    return fig
+
+# Peta Z(T, V) semua gas (mode Perbandingan Gas) hanya bergantung pada grid dan n
+@st.cache_resource(max_entries=16, show_spinner=False)
+def get_z_maps(T_grid, V_grid, n):
+    from thermo_engine import vdw_comparison
+
+    maps = vdw_comparison(T_grid, V_grid, n)
+    for value in maps.values():
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False  # dibagi antar sesi
+    return maps
+
+# Kurva koeksistensi uap-cair per gas; konstan selama parameter Van der Waals tetap
+@st.cache_resource(show_spinner=False)
+def get_coexistence(gas):
+    from thermo_engine import coexistence_curves
+
+    return coexistence_curves({gas: VDW_PARAMS[gas]})
+
+# Tombol analisis yang hasilnya tetap tampil pada rerun berikutnya selama input tidak berubah
+def submitted(label, key, params):
+    if st.button(label, key=key):
+        st.session_state[f"{key}_params"] = params
+        st.session_state.pop(f"{key}_result", None)
+        return True
+    return st.session_state.get(f"{key}_params") == params
+
+# Hasil dari riwayat run jika input yang sama pernah dihitung, selain itu hitung dan simpan.
+# Store hanya diakses sekali per klik; rerun berikutnya memakai hasil di session_state.
+def stored_run(key, mode, kind, params, compute):
+    if f"{key}_result" not in st.session_state:
+        st.session_state[f"{key}_result"] = get_run_store().cached(mode, kind, params, compute)
+    run_id, result, from_store = st.session_state[f"{key}_result"]
+    st.caption(f"💾 Run #{run_id} " + ("dilayani dari riwayat" if from_store else "dihitung dan disimpan"))
+    return result
 
 # Konfigurasi halaman
 st.set_page_config(
@@ -22,6 +133,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Profiling per rerun (opt-in lewat checkbox di sidebar atau GASIDEAL_PROFILE=1);
+# id sesi dibuat sekali agar semua rerun sesi ini tercatat dengan id yang sama
+session_id = st.session_state.setdefault("profiling_session", uuid.uuid4().hex[:8])
+prof = profiling.start(st.session_state.get("profiling", profiling.ENABLED_BY_DEFAULT), session=session_id)
+
 # Custom CSS untuk styling yang lebih menarik
 st.markdown("""
 <style>
@@ -57,42 +173,28 @@ st.markdown("""
     <p>Simulasi lengkap dengan visualisasi interaktif dan analisis mendalam</p>
 </div>
 """, unsafe_allow_html=True)
+prof.checkpoint("header")
 
 with st.sidebar:
-    lottie_json = load_lottieurl("https://lottie.host/4c738dc6-b583-4fec-8fc8-872106791b3b/Xjm5xqRaFf.json")
-    if lottie_json:
-        st_lottie(lottie_json, height=53, key="side bar")
+    # Slot animasi diisi di akhir skrip: komponen Lottie menarik pandas/pyarrow
+    # (dan mungkin unduhan), jadi konten utama dipaint lebih dulu
+    lottie_slot = st.empty()
     
     st.header("🎛️ Kontrol Utama")
     simulation_mode = st.selectbox(
         "Pilih Mode Simulasi",
-        ["Gas Ideal Dasar", "Proses Termodinamika", "Siklus Termodinamika", "Perbandingan Gas"]
+        ["Gas Ideal Dasar", "Proses Termodinamika", "Siklus Termodinamika", "Perbandingan Gas", "Simulasi Partikel"],
+        key="simulation_mode",
     )
-
-# Konstanta
-R = 0.0821  # L·atm/mol·K
-R_J = 8.314  # J/mol·K
-NA = 6.022e23  # Avogadro number
-
-# Fungsi utility
-def calculate_molecular_properties(T, M=28.014):  # Default untuk N2
-    """Hitung properti molekular"""
-    v_avg = np.sqrt(8 * R_J * T / (np.pi * M / 1000))  # m/s
-    v_rms = np.sqrt(3 * R_J * T / (M / 1000))  # m/s
-    v_mp = np.sqrt(2 * R_J * T / (M / 1000))  # m/s
-    return v_avg, v_rms, v_mp
-
-def maxwell_boltzmann(v, T, M=28.014):
-    """Distribusi Maxwell-Boltzmann"""
-    M_kg = M / 1000  # kg/mol
-    return 4 * np.pi * (M_kg / (2 * np.pi * R_J * T))**(3/2) * v**2 * np.exp(-M_kg * v**2 / (2 * R_J * T))
-
-def van_der_waals(T, V, n, a, b):
-    """Persamaan Van der Waals"""
-    return (n * R_J * T / (V - n * b)) - (a * n**2 / V**2)
+    chart_backend = st.radio("Renderer grafik", BACKENDS, horizontal=True)
+    prof.mode = simulation_mode
+    prof.checkpoint("sidebar")
 
 # === MODE 1: GAS IDEAL DASAR ===
 if simulation_mode == "Gas Ideal Dasar":
+    from thermo_engine import calculate_molecular_properties, solve_ideal_gas
+    prof.checkpoint("impor")
+    
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -105,17 +207,12 @@ if simulation_mode == "Gas Ideal Dasar":
         
         # Pilihan gas
         gas_type = st.selectbox("Jenis Gas", ["N₂ (Nitrogen)", "O₂ (Oxygen)", "H₂ (Hydrogen)", "CO₂ (Carbon Dioxide)", "He (Helium)"])
-        gas_properties = {
-            "N₂ (Nitrogen)": {"M": 28.014, "Cp": 29.1, "Cv": 20.8},
-            "O₂ (Oxygen)": {"M": 31.998, "Cp": 29.4, "Cv": 21.1},
-            "H₂ (Hydrogen)": {"M": 2.016, "Cp": 28.8, "Cv": 20.4},
-            "CO₂ (Carbon Dioxide)": {"M": 44.01, "Cp": 37.1, "Cv": 28.5},
-            "He (Helium)": {"M": 4.003, "Cp": 20.8, "Cv": 12.5}
-        }
+        gas_properties = GAS_PROPERTIES
         
         M = gas_properties[gas_type]["M"]
         Cp = gas_properties[gas_type]["Cp"]
         Cv = gas_properties[gas_type]["Cv"]
+    prof.checkpoint("input")
     
     with col2:
         st.header("🔢 Hasil Perhitungan")
@@ -123,19 +220,20 @@ if simulation_mode == "Gas Ideal Dasar":
         # Hitung PV = nRT
         var_to_calc = st.selectbox("Hitung variabel:", ["Tekanan (P)", "Volume (V)", "Mol (n)", "Suhu (T)"])
         
-        if st.button("🧮 Hitung", key="calc_basic"):
+        # "Tekanan (P)" -> "P", dst.
+        target = var_to_calc[var_to_calc.index("(") + 1:-1]
+        basic_params = dict(target=target, n=n, T=T, V=V, P=P)
+        if submitted("🧮 Hitung", "calc_basic", basic_params):
             try:
-                if var_to_calc == "Tekanan (P)":
-                    result = (n * R * T) / V
+                result = stored_run("calc_basic", "Gas Ideal Dasar", target, basic_params,
+                                    lambda: {"value": float(solve_ideal_gas(target, n=n, T=T, V=V, P=P))})["value"]
+                if target == "P":
                     st.success(f"**Tekanan (P) = {result:.4f} atm**")
-                elif var_to_calc == "Volume (V)":
-                    result = (n * R * T) / P
+                elif target == "V":
                     st.success(f"**Volume (V) = {result:.4f} L**")
-                elif var_to_calc == "Mol (n)":
-                    result = (P * V) / (R * T)
+                elif target == "n":
                     st.success(f"**Mol (n) = {result:.4f} mol**")
-                elif var_to_calc == "Suhu (T)":
-                    result = (P * V) / (n * R)
+                elif target == "T":
                     st.success(f"**Suhu = {result:.2f} K / {result - 273.15:.2f} °C**")
             except:
                 st.error("❌ Input tidak valid!")
@@ -151,48 +249,54 @@ if simulation_mode == "Gas Ideal Dasar":
         with col2b:
             st.metric("Kecepatan Paling Mungkin", f"{v_mp:.1f} m/s")
             st.metric("Energi Kinetik Rata-rata", f"{3/2 * R_J * T:.1f} J/mol")
+    prof.checkpoint("hitung")
     
     # Visualisasi distribusi kecepatan
     st.header("📈 Distribusi Kecepatan Maxwell-Boltzmann")
     
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=('Distribusi Kecepatan', 'Perbandingan Suhu'),
-        specs=[[{"secondary_y": False}, {"secondary_y": False}]]
-    )
+    curve_cache = get_curve_cache()
+    fig = maxwell_boltzmann_figure(T, M)
+    prof.checkpoint("plotly build")
     
-    # Plot 1: Distribusi kecepatan pada suhu tertentu
-    v_range = np.linspace(0, 3000, 1000)
-    prob_dist = maxwell_boltzmann(v_range, T, M)
+    show_plotly(fig, "Maxwell-Boltzmann")
+    prof.checkpoint("render")
     
-    fig.add_trace(
-        go.Scatter(x=v_range, y=prob_dist, name=f'T = {T:.1f} K', line=dict(color='blue', width=2)),
-        row=1, col=1
+    cache_stats = curve_cache.stats()
+    st.caption(
+        f"Cache kurva: {cache_stats['hits']} hit / {cache_stats['misses']} miss "
+        f"({cache_stats['hit_rate']*100:.0f}%), {cache_stats['size']}/{cache_stats['maxsize']} kurva"
     )
     
-    # Plot 2: Perbandingan pada berbagai suhu
-    temperatures = [200, 300, 400, 500]
-    colors = ['blue', 'red', 'green', 'orange']
-    
-    for i, temp in enumerate(temperatures):
-        prob_dist_temp = maxwell_boltzmann(v_range, temp, M)
-        fig.add_trace(
-            go.Scatter(x=v_range, y=prob_dist_temp, 
-                      name=f'T = {temp} K', 
-                      line=dict(color=colors[i], width=2)),
-            row=1, col=2
-        )
-    
-    fig.update_layout(height=400, showlegend=True)
-    fig.update_xaxes(title_text="Kecepatan (m/s)", row=1, col=1)
-    fig.update_xaxes(title_text="Kecepatan (m/s)", row=1, col=2)
-    fig.update_yaxes(title_text="Probabilitas", row=1, col=1)
-    fig.update_yaxes(title_text="Probabilitas", row=1, col=2)
-    
-    st.plotly_chart(fig, use_container_width=True)
+    # Animasi sweep suhu: semua frame dikirim sekali, slider berjalan di browser
+    if st.toggle("🎞️ Animasi sweep suhu", key="mb_animate"):
+        anim_col1, anim_col2, anim_col3 = st.columns(3)
+        with anim_col1:
+            T_anim_min = st.number_input("Suhu awal (°C)", value=-73.0, min_value=-273.0, max_value=1000.0, step=10.0, key="mb_anim_tmin")
+        with anim_col2:
+            T_anim_max = st.number_input("Suhu akhir (°C)", value=727.0, min_value=-273.0, max_value=1000.0, step=10.0, key="mb_anim_tmax")
+        with anim_col3:
+            n_frames = st.slider("Jumlah frame", min_value=10, max_value=200, value=60, step=10, key="mb_anim_frames")
+        
+        if T_anim_max <= T_anim_min:
+            st.error("❌ Suhu akhir harus lebih besar dari suhu awal!")
+        else:
+            T_bank, curve_bank = curve_cache.temperature_bank(M, max(T_anim_min + 273.15, 1.0), T_anim_max + 273.15, n_frames)
+            prof.checkpoint("bank kurva")
+            animated_line_chart(
+                curve_cache.grid(), curve_bank, T_bank,
+                title=f'Distribusi Kecepatan {gas_type} terhadap Suhu',
+                xlabel='Kecepatan (m/s)', ylabel='Probabilitas',
+                slider_prefix='T = ', frame_label='{:.0f} K', name='Animasi Maxwell-Boltzmann',
+            )
+            prof.checkpoint("animasi")
 
 # === MODE 2: PROSES TERMODINAMIKA ===
 elif simulation_mode == "Proses Termodinamika":
+    import pandas as pd
+    from process_engine import PROCESSES as GENERAL_PROCESSES, solve_process_batch
+    from thermo_engine import solve_process, process_path
+    prof.checkpoint("impor")
+    
     st.header("🔥 Analisis Proses Termodinamika")
     
     col1, col2 = st.columns([1, 1])
@@ -210,62 +314,89 @@ elif simulation_mode == "Proses Termodinamika":
         P1 = st.number_input("Tekanan awal (atm)", value=1.0, min_value=0.1, max_value=50.0, step=0.1, key="thermo_p1")
         
         # Pilihan proses
-        proses = st.selectbox("Jenis Proses", 
-            ["Isobarik (P konstan)", "Isokhorik (V konstan)", "Isotermal (T konstan)", "Adiabatik (Q = 0)"])
+        process_options = {
+            "Isobarik (P konstan)": "isobarik",
+            "Isokhorik (V konstan)": "isokhorik",
+            "Isotermal (T konstan)": "isotermal",
+            "Adiabatik (Q = 0)": "adiabatik",
+            "Politropik (PVᵏ konstan)": "politropik",
+            "Van der Waals Isotermal": "vdw_isotermal",
+            "Van der Waals Adiabatik": "vdw_adiabatik",
+        }
+        proses = st.selectbox("Jenis Proses", list(process_options))
+        process = process_options[proses]
         
-        # Konstanta gas
-        Cp = st.number_input("Cp (J/mol·K)", value=29.1, min_value=10.0, max_value=50.0, step=0.1)
-        Cv = st.number_input("Cv (J/mol·K)", value=20.8, min_value=10.0, max_value=50.0, step=0.1)
+        # Konstanta gas: konstan (input manual) atau Cp(T) terintegrasi dari tabel properti
+        heat_models = {"Konstan (input manual)": None, **{f"Cp(T) {g}": g for g in SHOMATE}}
+        cp_gas = heat_models[st.selectbox("Kapasitas panas", list(heat_models), key="thermo_cp_model")]
+        if cp_gas is None:
+            Cp = st.number_input("Cp (J/mol·K)", value=29.1, min_value=10.0, max_value=50.0, step=0.1)
+            Cv = st.number_input("Cv (J/mol·K)", value=20.8, min_value=10.0, max_value=50.0, step=0.1)
+        else:
+            from property_tables import get_table
+            
+            Cp = float(get_table().cp(cp_gas, T1))
+            Cv = Cp - R_J
+            st.caption(f"Cp {cp_gas}: {Cp:.2f} J/mol·K pada suhu awal, "
+                       f"{float(get_table().cp(cp_gas, T2)):.2f} J/mol·K pada suhu akhir")
         gamma = Cp / Cv
         
+        # Parameter proses umum (diintegrasikan numerik dari T awal, V awal dan V akhir)
+        if process == "politropik":
+            k_poly = st.number_input("Indeks politropik (k)", value=1.3, min_value=0.0, max_value=3.0, step=0.05)
+        elif process in ("vdw_isotermal", "vdw_adiabatik"):
+            gas_process = st.selectbox("Gas Van der Waals", list(VDW_PARAMS), key="thermo_vdw_gas")
+        
+        process_params = dict(process=process, n=n, T1=T1, T2=T2, V1=V1, V2=V2, P1=P1, Cp=Cp, Cv=Cv, cp_gas=cp_gas or "")
+        if process == "politropik":
+            process_params["k"] = k_poly
+        elif process in ("vdw_isotermal", "vdw_adiabatik"):
+            process_params["gas"] = gas_process
+    prof.checkpoint("input")
+        
     with col2:
         st.subheader("📊 Hasil Perhitungan")
         
-        if st.button("🔍 Analisis Proses", key="analyze_process"):
+        def compute_process():
+            # Proses umum: energi dan diagram dari satu lintasan hasil kuadratur adaptif
+            if process == "politropik":
+                return solve_process_batch(process, n, T1, V1, V2, Cv, k=k_poly)
+            if process in GENERAL_PROCESSES:
+                vdw = VDW_PARAMS[gas_process]
+                return solve_process_batch(process, n, T1, V1, V2, Cv, a=vdw["a"], b=vdw["b"])
+            return solve_process(process, n, T1, T2, V1, V2, P1, Cp, Cv, gas=cp_gas)
+        
+        if submitted("🔍 Analisis Proses", "analyze_process", process_params):
             try:
-                # Hitung berdasarkan jenis proses
-                if proses == "Isobarik (P konstan)":
-                    P2 = P1  # Tekanan konstan
-                    V2_calc = V1 * T2 / T1  # Hukum Charles
-                    q = n * Cp * (T2 - T1)
-                    w = -P1 * (V2_calc - V1) * 101.325  # Konversi ke J
-                    dU = n * Cv * (T2 - T1)
-                    dH = q
-                    
+                result = stored_run("analyze_process", "Proses Termodinamika", process, process_params, compute_process)
+                # Proses umum menurunkan tekanan awal dari n, T1, V1; input tekanan awal tidak dipakai
+                P_start = P1
+                if process in GENERAL_PROCESSES:
+                    V_path, P_path = result["V"][0], result["P"][0]
+                    P_start = float(result["P1"][0])
+                    st.info(f"Tekanan awal dihitung dari n, T1 dan V1: {P_start:.3f} atm "
+                            f"(input tekanan awal {P1:.3f} atm tidak dipakai)")
+                P2, V2_calc, T2 = (float(np.ravel(result[k])[0]) for k in ("P2", "V2", "T2"))
+                q, w, dU, dH = (float(np.ravel(result[k])[0]) for k in ("q", "w", "dU", "dH"))
+
+                if process == "politropik":
+                    st.success(f"**Proses Politropik (PV^{k_poly:g} konstan)**")
+                    st.info(f"Tekanan akhir: {P2:.3f} atm")
+                    st.info(f"Suhu akhir: {T2:.1f} K ({T2-273.15:.1f} °C)")
+                elif process in ("vdw_isotermal", "vdw_adiabatik"):
+                    st.success(f"**{proses} ({gas_process})**")
+                    st.info(f"Tekanan akhir: {P2:.3f} atm")
+                    st.info(f"Suhu akhir: {T2:.1f} K ({T2-273.15:.1f} °C)")
+                elif process == "isobarik":
                     st.success(f"**Proses Isobarik (P = {P1:.2f} atm)**")
                     st.info(f"Volume akhir: {V2_calc:.3f} L")
-                    
-                elif proses == "Isokhorik (V konstan)":
-                    V2_calc = V1  # Volume konstan
-                    P2 = P1 * T2 / T1  # Hukum Gay-Lussac
-                    q = n * Cv * (T2 - T1)
-                    w = 0  # Tidak ada kerja
-                    dU = q
-                    dH = n * Cp * (T2 - T1)
-                    
+                elif process == "isokhorik":
                     st.success(f"**Proses Isokhorik (V = {V1:.2f} L)**")
                     st.info(f"Tekanan akhir: {P2:.3f} atm")
-                    
-                elif proses == "Isotermal (T konstan)":
-                    T2 = T1  # Suhu konstan
-                    P2 = P1 * V1 / V2  # Hukum Boyle
-                    q = n * R_J * T1 * np.log(V2 / V1)
-                    w = -q  # Untuk gas ideal isotermal
-                    dU = 0  # Energi dalam konstan
-                    dH = 0  # Entalpi konstan
-                    
+                elif process == "isotermal":
                     st.success(f"**Proses Isotermal (T = {T1:.1f} K)**")
                     st.info(f"Tekanan akhir: {P2:.3f} atm")
-                    
-                elif proses == "Adiabatik (Q = 0)":
-                    # Untuk adiabatik: PV^γ = konstan, TV^(γ-1) = konstan
-                    P2 = P1 * (V1/V2)**gamma
-                    T2 = T1 * (V1/V2)**(gamma-1)
-                    q = 0  # Tidak ada perpindahan panas
-                    w = (P1 * V1 - P2 * V2) * 101.325 / (gamma - 1)
-                    dU = -w
-                    dH = dU + (P2 * V2 - P1 * V1) * 101.325
-                    
+                elif process == "adiabatik":
                     st.success(f"**Proses Adiabatik (Q = 0)**")
                     st.info(f"Tekanan akhir: {P2:.3f} atm")
                     st.info(f"Suhu akhir: {T2:.1f} K ({T2-273.15:.1f} °C)")
@@ -284,47 +415,77 @@ elif simulation_mode == "Proses Termodinamika":
                     ]
                 })
                 
-                st.dataframe(energy_df, use_container_width=True)
+                st.dataframe(energy_df, width="stretch")
                 
                 # Diagram P-V
                 st.markdown("### 📈 Diagram P-V")
                 
-                fig, ax = plt.subplots(figsize=(10, 6))
+                if process == "adiabatik" and cp_gas is not None:
+                    # Lintasan adiabatik dengan Cp(T): T(V) dari tabel, bukan PV^γ
+                    V_path = np.linspace(V1, V2_calc, 100)
+                    T_path = get_table().adiabatic_temperature(cp_gas, T1, V_path / V1)
+                    P_path = P1 * V1 * T_path / (V_path * T1)
+                elif process not in GENERAL_PROCESSES:
+                    V_path, P_path = process_path(process, V1, V2_calc, P1, P2, gamma)
+                styles = {
+                    "isobarik": ('blue', 'Isobarik', 'blue'),
+                    "isokhorik": ('red', 'Isokhorik', None),
+                    "isotermal": ('green', 'Isotermal', 'green'),
+                    "adiabatik": ('magenta', 'Adiabatik', 'magenta'),
+                    "politropik": ('darkorange', 'Politropik', 'orange'),
+                    "vdw_isotermal": ('teal', 'Van der Waals Isotermal', 'teal'),
+                    "vdw_adiabatik": ('purple', 'Van der Waals Adiabatik', 'purple'),
+                }
+                color, label, fill_color = styles[process]
+                line_chart(
+                    [dict(x=V_path, y=P_path, label=label, color=color, width=3, fill=fill_color)],
+                    title=f'Diagram P-V untuk {proses}',
+                    xlabel='Volume (L)', ylabel='Tekanan (atm)',
+                    backend=chart_backend, points=([V1, V2], [P_start, P2]),
+                )
                 
-                if proses == "Isobarik (P konstan)":
-                    ax.plot([V1, V2_calc], [P1, P1], 'b-', linewidth=3, label='Isobarik')
-                    ax.fill_between([V1, V2_calc], [P1, P1], alpha=0.3, color='blue')
+                # Varian politropik dihitung sekaligus dalam satu panggilan batch
+                if process == "politropik":
+                    st.markdown("### 🧮 Perbandingan Indeks Politropik")
+                    k_variants = np.unique(np.round([0.0, 1.0, k_poly, gamma, 1.0 + 2 * (gamma - 1)], 4))
                     
-                elif proses == "Isokhorik (V konstan)":
-                    ax.plot([V1, V1], [P1, P2], 'r-', linewidth=3, label='Isokhorik')
+                    # Per baris dari riwayat: hanya varian k yang belum pernah dihitung yang diintegrasi
+                    def compute_variants(rows):
+                        out = solve_process_batch("politropik", n, T1, V1, V2, Cv, k=[r["k"] for r in rows])
+                        return [{key: out[key][i] for key in ("P2", "T2", "q", "w", "dU", "V", "P")}
+                                for i in range(len(rows))]
                     
-                elif proses == "Isotermal (T konstan)":
-                    V_range = np.linspace(V1, V2, 100)
-                    P_range = P1 * V1 / V_range
-                    ax.plot(V_range, P_range, 'g-', linewidth=3, label='Isotermal')
-                    ax.fill_between(V_range, P_range, alpha=0.3, color='green')
+                    rows, recomputed = get_run_store().rows(
+                        "Proses Termodinamika/politropik", [dict(n=n, T1=T1, V1=V1, V2=V2, Cv=Cv, k=k) for k in k_variants], compute_variants)
+                    variants = {key: np.array([row[key] for row in rows]) for key in rows[0]}
+                    st.caption(f"🧩 {recomputed} dari {len(rows)} varian dihitung ulang")
                     
-                elif proses == "Adiabatik (Q = 0)":
-                    V_range = np.linspace(V1, V2, 100)
-                    P_range = P1 * (V1/V_range)**gamma
-                    ax.plot(V_range, P_range, 'm-', linewidth=3, label='Adiabatik')
-                    ax.fill_between(V_range, P_range, alpha=0.3, color='magenta')
-                
-                ax.scatter([V1, V2], [P1, P2 if 'P2' in locals() else P1], 
-                          color='red', s=100, zorder=5)
-                ax.set_xlabel('Volume (L)', fontsize=12)
-                ax.set_ylabel('Tekanan (atm)', fontsize=12)
-                ax.set_title(f'Diagram P-V untuk {proses}', fontsize=14)
-                ax.grid(True, alpha=0.3)
-                ax.legend(fontsize=12)
-                
-                st.pyplot(fig)
+                    st.dataframe(pd.DataFrame({
+                        'k': k_variants,
+                        'P akhir (atm)': variants["P2"],
+                        'T akhir (K)': variants["T2"],
+                        'q (J)': variants["q"],
+                        'w (J)': variants["w"],
+                        'ΔU (J)': variants["dU"]
+                    }).round(3), width="stretch")
+                    line_chart(
+                        [dict(x=V_k, y=P_k, label=f'k = {k:g}') for k, V_k, P_k in zip(k_variants, variants["V"], variants["P"])],
+                        title='Lintasan Politropik untuk Berbagai k', xlabel='Volume (L)', ylabel='Tekanan (atm)',
+                        backend=chart_backend, legend_size=10,
+                    )
                 
             except Exception as e:
                 st.error(f"❌ Error dalam perhitungan: {str(e)}")
+    prof.checkpoint("analisis")
 
 # === MODE 3: SIKLUS TERMODINAMIKA ===
 elif simulation_mode == "Siklus Termodinamika":
+    import pandas as pd
+    from cycle_engine import brayton_cycle, stirling_cycle
+    from cycle_sweep import run_sweep
+    from thermo_engine import carnot_cycle, otto_cycle
+    prof.checkpoint("impor")
+    
     st.header("🔄 Siklus Termodinamika")
     
     cycle_type = st.selectbox("Pilih Siklus", 
@@ -341,40 +502,58 @@ elif simulation_mode == "Siklus Termodinamika":
             T_cold = st.number_input("Suhu Reservoir Dingin (K)", value=300.0, min_value=200.0, max_value=500.0, step=10.0)
             V1 = st.number_input("Volume titik 1 (L)", value=1.0, min_value=0.1, max_value=10.0, step=0.1, key="carnot_v1")
             V2 = st.number_input("Volume titik 2 (L)", value=2.0, min_value=0.1, max_value=10.0, step=0.1, key="carnot_v2")
+            cycle_inputs = dict(T_hot=T_hot, T_cold=T_cold, V1=V1, V2=V2)
             
         elif cycle_type == "Siklus Otto":
             T1 = st.number_input("Suhu Awal (K)", value=300.0, min_value=200.0, max_value=500.0, step=10.0)
             compression_ratio = st.number_input("Rasio Kompresi", value=8.0, min_value=2.0, max_value=15.0, step=0.5)
             Q_in = st.number_input("Kalor Masuk (J)", value=1000.0, min_value=100.0, max_value=5000.0, step=100.0)
+            cycle_inputs = dict(T1=T1, compression_ratio=compression_ratio, Q_in=Q_in)
+            
+        elif cycle_type == "Siklus Brayton":
+            T1 = st.number_input("Suhu Masuk Kompresor (K)", value=300.0, min_value=200.0, max_value=500.0, step=10.0, key="brayton_t1")
+            pressure_ratio = st.number_input("Rasio Tekanan", value=10.0, min_value=2.0, max_value=40.0, step=0.5)
+            Q_in = st.number_input("Kalor Masuk (J)", value=20000.0, min_value=100.0, max_value=100000.0, step=500.0, key="brayton_qin")
+            cycle_inputs = dict(T1=T1, pressure_ratio=pressure_ratio, Q_in=Q_in)
+            
+        elif cycle_type == "Siklus Stirling":
+            T_hot = st.number_input("Suhu Reservoir Panas (K)", value=600.0, min_value=300.0, max_value=1000.0, step=10.0, key="stirling_th")
+            T_cold = st.number_input("Suhu Reservoir Dingin (K)", value=300.0, min_value=200.0, max_value=500.0, step=10.0, key="stirling_tc")
+            V1 = st.number_input("Volume minimum (L)", value=1.0, min_value=0.1, max_value=10.0, step=0.1, key="stirling_v1")
+            V2 = st.number_input("Volume maksimum (L)", value=2.0, min_value=0.1, max_value=10.0, step=0.1, key="stirling_v2")
+            regenerator = st.checkbox("Regenerator ideal", value=True)
+            cycle_inputs = dict(T_hot=T_hot, T_cold=T_cold, V1=V1, V2=V2, regenerator=regenerator)
             
         gamma = st.number_input("Rasio Panas Spesifik (γ)", value=1.4, min_value=1.1, max_value=1.7, step=0.1, key="cycle_gamma")
+        cycle_params = dict(cycle=cycle_type, n=n, gamma=gamma, **cycle_inputs)
+    prof.checkpoint("input")
         
     with col2:
         st.subheader("📊 Hasil Analisis")
         
-        if st.button("🔄 Analisis Siklus", key="analyze_cycle"):
+        def compute_cycle():
+            if cycle_type == "Siklus Carnot":
+                return carnot_cycle(n, T_hot, T_cold, V1, V2, gamma)
+            if cycle_type == "Siklus Otto":
+                return otto_cycle(n, T1, compression_ratio, Q_in, gamma)
+            # Brayton/Stirling: leg yang input-nya tidak berubah diambil dari cache leg
+            legs = get_leg_cache()
+            misses = legs.misses
+            if cycle_type == "Siklus Brayton":
+                result = brayton_cycle(n, T1, pressure_ratio, Q_in, gamma, leg_cache=legs)
+            else:
+                result = stirling_cycle(n, T_hot, T_cold, V1, V2, gamma, regenerator, leg_cache=legs)
+            st.caption(f"🧩 {legs.misses - misses} dari {len(result['W'])} leg diintegrasi ulang")
+            return result
+        
+        if submitted("🔄 Analisis Siklus", "analyze_cycle", cycle_params):
             try:
+                result = stored_run("analyze_cycle", "Siklus Termodinamika", cycle_type, cycle_params, compute_cycle)
                 if cycle_type == "Siklus Carnot":
-                    # Efisiensi Carnot
-                    eta_carnot = 1 - T_cold/T_hot
-                    
-                    # Titik-titik siklus (simplified)
-                    P1 = n * R * T_hot / V1
-                    P2 = n * R * T_hot / V2
-                    V3 = V2 * (T_hot/T_cold)**(1/(gamma-1))
-                    V4 = V1 * (T_hot/T_cold)**(1/(gamma-1))
-                    P3 = n * R * T_cold / V3
-                    P4 = n * R * T_cold / V4
-                    
-                    # Kerja dan kalor
-                    W12 = n * R * T_hot * np.log(V2/V1)  # Ekspansi isotermal
-                    W23 = n * R * T_hot / (gamma-1) * (1 - (T_cold/T_hot))  # Ekspansi adiabatik
-                    W34 = n * R * T_cold * np.log(V4/V3)  # Kompresi isotermal
-                    W41 = n * R * T_cold / (gamma-1) * (1 - (T_hot/T_cold))  # Kompresi adiabatik
-                    
-                    W_net = W12 + W23 + W34 + W41
-                    Q_hot = W12
-                    Q_cold = W34
+                    eta_carnot = float(result["eta"])
+                    W_net = float(result["W_net"])
+                    Q_hot = float(result["Q_hot"])
+                    Q_cold = float(result["Q_cold"])
                     
                     st.success(f"**Efisiensi Carnot: {eta_carnot:.3f} ({eta_carnot*100:.1f}%)**")
                     st.info(f"Kerja Net: {W_net:.1f} J")
@@ -382,19 +561,9 @@ elif simulation_mode == "Siklus Termodinamika":
                     st.info(f"Kalor ke Reservoir Dingin: {abs(Q_cold):.1f} J")
                     
                 elif cycle_type == "Siklus Otto":
-                    # Efisiensi Otto
-                    eta_otto = 1 - (1/compression_ratio)**(gamma-1)
-                    
-                    # Proses siklus Otto (simplified)
-                    V1 = 1.0  # Volume awal
-                    V2 = V1 / compression_ratio  # Volume setelah kompresi
-                    
-                    T2 = T1 * compression_ratio**(gamma-1)  # Suhu setelah kompresi
-                    T3 = T2 + Q_in / (n * R / (gamma-1))  # Suhu setelah pembakaran
-                    T4 = T3 / compression_ratio**(gamma-1)  # Suhu setelah ekspansi
-                    
-                    W_net = eta_otto * Q_in
-                    Q_out = Q_in - W_net
+                    eta_otto = float(result["eta"])
+                    W_net = float(result["W_net"])
+                    Q_out = float(result["Q_out"])
                     
                     st.success(f"**Efisiensi Otto: {eta_otto:.3f} ({eta_otto*100:.1f}%)**")
                     st.info(f"Kerja Net: {W_net:.1f} J")
@@ -403,23 +572,150 @@ elif simulation_mode == "Siklus Termodinamika":
                     # Tabel titik siklus
                     cycle_data = pd.DataFrame({
                         'Titik': ['1 (Awal)', '2 (Kompresi)', '3 (Pembakaran)', '4 (Ekspansi)'],
-                        'Volume (L)': [V1, V2, V2, V1],
-                        'Suhu (K)': [T1, T2, T3, T4],
-                        'Tekanan (atm)': [
-                            n * R * T1 / V1,
-                            n * R * T2 / V2,
-                            n * R * T3 / V2,
-                            n * R * T4 / V1
-                        ]
+                        'Volume (L)': result["V"],
+                        'Suhu (K)': result["T"],
+                        'Tekanan (atm)': result["P"]
                     })
                     
-                    st.dataframe(cycle_data, use_container_width=True)
+                    st.dataframe(cycle_data, width="stretch")
+                    
+                elif cycle_type in ("Siklus Brayton", "Siklus Stirling"):
+                    if cycle_type == "Siklus Brayton":
+                        labels = ['1 (Awal)', '2 (Kompresi)', '3 (Pemanasan)', '4 (Ekspansi)']
+                        leg_names = ['Kompresi adiabatik', 'Pemanasan isobarik', 'Ekspansi adiabatik', 'Pendinginan isobarik']
+                    else:
+                        labels = ['1 (Awal)', '2 (Ekspansi)', '3 (Pendinginan)', '4 (Kompresi)']
+                        leg_names = ['Ekspansi isotermal', 'Pendinginan isokhorik', 'Kompresi isotermal', 'Pemanasan isokhorik']
+                    
+                    st.success(f"**Efisiensi {cycle_type.split()[1]}: {result['eta']:.3f} ({result['eta']*100:.1f}%)**")
+                    st.info(f"Kerja Net: {result['W_net']:.1f} J")
+                    st.info(f"Kalor Masuk: {result['Q_in']:.1f} J")
+                    st.info(f"Kalor Keluar: {result['Q_out']:.1f} J")
+                    
+                    st.dataframe(pd.DataFrame({
+                        'Titik': labels,
+                        'Volume (L)': result["states"][:, 1],
+                        'Suhu (K)': result["states"][:, 2],
+                        'Tekanan (atm)': result["states"][:, 0]
+                    }), width="stretch")
+                    
+                    st.dataframe(pd.DataFrame({
+                        'Proses': leg_names,
+                        'Kerja (J)': result["W"],
+                        'Kalor (J)': result["Q"],
+                        'ΔU (J)': result["dU"]
+                    }), width="stretch")
+                    
+                    # Diagram P-V dan T-S dari lintasan yang sama
+                    bounds = result["leg_bounds"]
+                    legs = [slice(bounds[k], bounds[k + 1]) for k in range(len(leg_names))]
+                    line_chart(
+                        [dict(x=result["V"][sl], y=result["P"][sl], label=name) for sl, name in zip(legs, leg_names)],
+                        title=f'Diagram P-V {cycle_type}', xlabel='Volume (L)', ylabel='Tekanan (atm)',
+                        backend=chart_backend, points=(result["states"][:, 1], result["states"][:, 0]), legend_size=10,
+                    )
+                    line_chart(
+                        [dict(x=result["S"][sl], y=result["T"][sl], label=name) for sl, name in zip(legs, leg_names)],
+                        title=f'Diagram T-S {cycle_type}', xlabel='Entropi relatif (J/K)', ylabel='Suhu (K)',
+                        backend=chart_backend, legend_size=10,
+                    )
                     
             except Exception as e:
                 st.error(f"❌ Error dalam perhitungan: {str(e)}")
+    prof.checkpoint("analisis")
+
+    # Sweep parametrik: evaluasi seluruh grid desain sekaligus
+    if cycle_type in ("Siklus Carnot", "Siklus Otto"):
+        st.header("📐 Sweep Parametrik")
+        
+        sweep_col1, sweep_col2 = st.columns([1, 1])
+        with sweep_col1:
+            if cycle_type == "Siklus Otto":
+                sweep_cycle = "otto"
+                x_name, y_name = "compression_ratio", "gamma"
+                x_label, y_label = "Rasio Kompresi", "γ"
+                x_min, x_max = st.slider("Rentang Rasio Kompresi", 2.0, 20.0, (4.0, 14.0), step=0.5)
+                y_min, y_max = st.slider("Rentang γ", 1.1, 1.7, (1.2, 1.67), step=0.01)
+                fixed = dict(n=n, T1=T1, Q_in=Q_in)
+            else:
+                sweep_cycle = "carnot"
+                x_name, y_name = "T_hot", "T_cold"
+                x_label, y_label = "Suhu Reservoir Panas (K)", "Suhu Reservoir Dingin (K)"
+                x_min, x_max = st.slider("Rentang Suhu Panas (K)", 300.0, 1500.0, (500.0, 1200.0), step=10.0)
+                y_min, y_max = st.slider("Rentang Suhu Dingin (K)", 200.0, 500.0, (250.0, 400.0), step=10.0)
+                fixed = dict(n=n, V1=V1, V2=V2, gamma=gamma)
+        with sweep_col2:
+            resolution = st.select_slider("Resolusi grid (titik per sumbu)", [50, 100, 200, 500, 1000, 2000, 3000], value=200)
+            workers = st.number_input("Jumlah worker (0 = otomatis)", value=0, min_value=0, max_value=os.cpu_count() or 1, step=1)
+            st.caption(f"Total titik: {resolution**2:,}")
+        
+        if st.button("▶️ Jalankan Sweep", key="run_sweep"):
+            params = dict(fixed)
+            params[x_name] = np.linspace(x_min, x_max, resolution)
+            params[y_name] = np.linspace(y_min, y_max, resolution)
+            
+            progress = st.progress(0.0, text="Memulai sweep...")
+            partial_status = st.empty()
+            best = {"eta": -np.inf}
+            # Kontur memakai grid ber-stride agar payload grafik dan memori hasil tetap kecil
+            step = max(1, resolution // 200)
+            
+            # Tampilkan hasil sementara setiap chunk selesai
+            def on_chunk(done, total, start, stop, partial):
+                if partial["best"]["eta"] > best["eta"]:
+                    best.update(eta=partial["best"]["eta"], W_net=partial["best"]["W_net"])
+                progress.progress(done / total, text=f"{done:,} / {total:,} titik")
+                partial_status.info(f"Efisiensi terbaik sementara: {best['eta']*100:.2f}% (W net {best['W_net']:.1f} J)")
+            
+            try:
+                axes, sweep = run_sweep(
+                    sweep_cycle, params,
+                    chunk_size=max(resolution**2 // 20, 10_000),
+                    workers=workers or None,
+                    on_chunk=on_chunk,
+                    stride=step,
+                )
+                progress.empty()
+                
+                x_vals, y_vals = axes[x_name], axes[y_name]
+                top = sweep["best"]
+                i, j = top["index"]
+                partial_status.success(
+                    f"**Efisiensi maksimum: {top['eta']*100:.2f}%** pada "
+                    f"{x_label} = {x_vals[i]:.3g}, {y_label} = {y_vals[j]:.3g}"
+                )
+                
+                xs, ys = x_vals[::step], y_vals[::step]
+                plot_col1, plot_col2 = st.columns(2)
+                with plot_col1:
+                    contour_chart(xs, ys, sweep["eta"] * 100, "Efisiensi (%)",
+                                  x_label, y_label, "η (%)", backend=chart_backend)
+                    contour_chart(xs, ys, sweep["T_max"], "Suhu Maksimum Siklus (K)",
+                                  x_label, y_label, "T (K)", backend=chart_backend, cmap="inferno")
+                with plot_col2:
+                    contour_chart(xs, ys, sweep["W_net"], "Kerja Net (J)",
+                                  x_label, y_label, "W (J)", backend=chart_backend, cmap="plasma")
+                    contour_chart(xs, ys, sweep["P_max"], "Tekanan Maksimum Siklus (atm)",
+                                  x_label, y_label, "P (atm)", backend=chart_backend, cmap="cividis")
+                
+                st.dataframe(pd.DataFrame({
+                    'Titik': ['1', '2', '3', '4'],
+                    'Suhu (K)': top["T"],
+                    'Tekanan (atm)': top["P"]
+                }), width="stretch")
+                
+            except Exception as e:
+                st.error(f"❌ Error dalam sweep: {str(e)}")
+        prof.checkpoint("sweep")
 
 # === MODE 4: PERBANDINGAN GAS ===
 elif simulation_mode == "Perbandingan Gas":
+    import pandas as pd
+    from thermo_engine import (
+        vdw_comparison, vdw_volume, vdw_critical_point, maxwell_isotherms,
+    )
+    prof.checkpoint("impor")
+    
     st.header("⚖️ Perbandingan Gas Real vs Ideal")
     
     col1, col2 = st.columns([1, 1])
@@ -431,67 +727,275 @@ elif simulation_mode == "Perbandingan Gas":
         T = T_C + 273.15
         
         # Parameter Van der Waals
-        gas_vdw = st.selectbox("Gas untuk Van der Waals", 
-            ["CO₂", "N₂", "O₂", "H₂O", "NH₃"])
-        
-        vdw_params = {
-            "CO₂": {"a": 3.640, "b": 0.04267},
-            "N₂": {"a": 1.390, "b": 0.03913},
-            "O₂": {"a": 1.360, "b": 0.03183},
-            "H₂O": {"a": 5.536, "b": 0.03049},
-            "NH₃": {"a": 4.170, "b": 0.03707}
-        }
-        
-        a = vdw_params[gas_vdw]["a"]
-        b = vdw_params[gas_vdw]["b"]
+        vdw_params = VDW_PARAMS
+        gas_vdw = st.selectbox("Gas untuk Van der Waals", list(vdw_params))
+        gas_idx = list(vdw_params).index(gas_vdw)
         
         V_range = np.linspace(0.1, 5.0, 100)
+    prof.checkpoint("input")
         
     with col2:
         st.subheader("📈 Perbandingan P-V")
         
-        # Hitung tekanan untuk gas ideal dan Van der Waals
-        P_ideal = n * R * T / V_range
-        P_vdw = []
+        # Semua gas pada suhu T dalam satu operasi array; V ≤ nb otomatis NaN
+        comparison = vdw_comparison([T], V_range, n)
+        P_ideal = comparison["P_ideal"][0]
+        P_vdw = comparison["P"][gas_idx, 0]
         
-        for V in V_range:
-            try:
-                P_vdw.append(van_der_waals(T, V, n, a, b))
-            except:
-                P_vdw.append(np.nan)
+        # Plot perbandingan
+        line_chart(
+            [dict(x=V_range, y=P_ideal, label='Gas Ideal', color='blue'),
+             dict(x=V_range, y=P_vdw, label=f'Van der Waals ({gas_vdw})', color='red', dash='dash')],
+            title=f'Perbandingan Gas Ideal vs Van der Waals\n(T = {T:.1f} K, n = {n} mol)',
+            xlabel='Volume (L)', ylabel='Tekanan (atm)',
+            backend=chart_backend, ylim=(0, 50),
+        )
         
-        P_vdw = np.array(P_vdw)
+        # Tabel perbandingan pada volume tertentu
+        st.subheader("📊 Perbandingan Numerik")
         
-        # Plot perbandingan
-        fig, ax = plt.subplots(figsize=(10, 6))
+        V_test = np.array([0.5, 1.0, 2.0, 3.0])
+        test = vdw_comparison([T], V_test, n)
         
-        ax.plot(V_range, P_ideal, 'b-', linewidth=2, label='Gas Ideal')
-        ax.plot(V_range, P_vdw, 'r--', linewidth=2, label=f'Van der Waals ({gas_vdw})')
+        comparison_data = pd.DataFrame({
+            'Volume (L)': V_test,
+            'P Ideal (atm)': test["P_ideal"][0],
+            'P Van der Waals (atm)': test["P"][gas_idx, 0],
+            'Z': test["Z"][gas_idx, 0],
+            'Deviasi (%)': test["deviation"][gas_idx, 0]
+        })
         
-        ax.set_xlabel('Volume (L)', fontsize=12)
-        ax.set_ylabel('Tekanan (atm)', fontsize=12)
-        ax.set_title(f'Perbandingan Gas Ideal vs Van der Waals\n(T = {T:.1f} K, n = {n} mol)', fontsize=14)
-        ax.grid(True, alpha=0.3)
-        ax.legend(fontsize=12)
-        ax.set_ylim(0, 50)
+        st.dataframe(comparison_data.round(3), width="stretch")
+    prof.checkpoint("perbandingan P-V")
+    
+    # Peta faktor kompresibilitas Z(T, V) untuk semua gas sekaligus
+    st.header("🗺️ Faktor Kompresibilitas Z(T, V)")
+    
+    T_grid = np.linspace(173.15, 773.15, 300)
+    V_grid = np.linspace(0.05, 5.0, 400)
+    z_maps = get_z_maps(T_grid, V_grid, n)
+    prof.checkpoint("hitung peta Z")
+    
+    heatmap_row(
+        z_maps["Z"], V_grid, T_grid, z_maps["gases"],
+        xlabel='Volume (L)', ylabel='Suhu (K)', colorbar_label='Z = PV/nRT',
+        backend=chart_backend, vmin=0.5, vmax=1.5,
+    )
+    
+    # Ringkasan semua gas pada suhu input
+    summary = pd.DataFrame({
+        'Gas': comparison["gases"],
+        'a (L²·atm/mol²)': [vdw_params[g]["a"] for g in comparison["gases"]],
+        'b (L/mol)': [vdw_params[g]["b"] for g in comparison["gases"]],
+        'Z min': np.nanmin(comparison["Z"][:, 0], axis=1),
+        'Deviasi maks (%)': np.nanmax(comparison["deviation"][:, 0], axis=1)
+    })
+    st.dataframe(summary.round(3), width="stretch")
+    prof.checkpoint("peta Z")
+    
+    # Volume dari P dan T (akar fisis persamaan kubik) dan isoterm terkoreksi Maxwell
+    st.header("🧊 Volume Van der Waals & Konstruksi Maxwell")
+    
+    col3, col4 = st.columns([1, 2])
+    
+    a = vdw_params[gas_vdw]["a"]
+    b = vdw_params[gas_vdw]["b"]
+    Tc, Pc, Vc = (float(x) for x in vdw_critical_point(a, b))
+    
+    with col3:
+        P_target = st.number_input("Tekanan (atm)", value=1.0, min_value=0.1, max_value=500.0, step=0.1, key="comp_P")
+        V_real = float(vdw_volume(P_target, T, n, a, b))
+        V_ideal = n * R * T / P_target
         
-        st.pyplot(fig)
+        st.metric("Volume Van der Waals", f"{V_real:.4f} L")
+        st.metric("Volume Ideal", f"{V_ideal:.4f} L", f"{(V_real / V_ideal - 1) * 100:.2f}%")
+        st.caption(f"Titik kritis {gas_vdw}: Tc = {Tc:.1f} K, Pc = {Pc:.1f} atm, Vc = {Vc:.4f} L/mol")
+    
+    with col4:
+        Tr_list = np.array([0.80, 0.85, 0.90, 0.95, 1.00, 1.10])
+        V_iso = n * np.geomspace(1.2 * b, 40 * b, 400)
+        P_iso = maxwell_isotherms(Tr_list * Tc, V_iso, n, a, b)
+        coex = get_coexistence(gas_vdw)
+        prof.checkpoint("hitung isoterm")
         
-        # Tabel perbandingan pada volume tertentu
-        st.subheader("📊 Perbandingan Numerik")
+        traces = [dict(x=V_iso, y=P_row, label=f'T = {Tr * Tc:.0f} K (Tr = {Tr:.2f})')
+                  for Tr, P_row in zip(Tr_list, P_iso)]
+        traces.append(dict(
+            x=n * np.concatenate([coex["Vl"][0], coex["Vg"][0][::-1]]),
+            y=np.concatenate([coex["P_sat"][0], coex["P_sat"][0][::-1]]),
+            label='Kurva koeksistensi', color='black', dash='dash', width=1.5,
+        ))
+        line_chart(
+            traces,
+            title=f'Isoterm Van der Waals Terkoreksi Maxwell ({gas_vdw}, n = {n} mol)',
+            xlabel='Volume (L)', ylabel='Tekanan (atm)',
+            backend=chart_backend, ylim=(0, 1.5 * Pc), xlog=True, legend_size=10,
+        )
+        prof.checkpoint("isoterm Maxwell")
+
+# === MODE 5: SIMULASI PARTIKEL ===
+elif simulation_mode == "Simulasi Partikel":
+    import pandas as pd
+    from particle_sim import ParticleGas
+    from thermo_engine import calculate_molecular_properties, maxwell_boltzmann
+    prof.checkpoint("impor")
+    
+    st.header("🎱 Simulasi Partikel Bola Keras")
+    st.markdown("""
+    Gas dimodelkan sebagai N bola keras dalam kotak kubus: partikel bergerak lurus, memantul di dinding
+    dan bertumbukan elastis. Distribusi kecepatan dan tekanan dari impuls dinding dibandingkan langsung
+    dengan teori kinetik (Maxwell-Boltzmann) dan PV = nRT.
+    """)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.subheader("🔧 Parameter")
+        gas_sim = st.selectbox("Jenis Gas", list(GAS_PROPERTIES), key="sim_gas")
+        T_C = st.number_input("Suhu (°C)", value=25.0, min_value=-200.0, max_value=1000.0, step=5.0, key="sim_T")
+        P_sim = st.number_input("Tekanan (atm)", value=1.0, min_value=0.01, max_value=100.0, step=0.1, key="sim_P")
+        N_sim = st.select_slider("Jumlah partikel", options=[1_000, 10_000, 100_000, 1_000_000], value=10_000,
+                                 format_func=lambda x: f"{x:,}", key="sim_N")
+        packing = st.slider("Fraksi isian η", min_value=0.001, max_value=0.05, value=0.005, step=0.001,
+                            format="%.3f", key="sim_eta",
+                            help="Menentukan diameter partikel; η kecil → gas hampir ideal")
+        budget = st.slider("Waktu komputasi per potongan (s)", min_value=0.1, max_value=2.0, value=0.5, step=0.1,
+                           key="sim_budget")
         
-        V_test = [0.5, 1.0, 2.0, 3.0]
-        comparison_data = []
+        running = st.toggle("▶️ Jalankan", key="sim_running")
+        step_once = st.button("⏭️ Satu potongan", key="sim_step", disabled=running)
+        reset = st.button("🔄 Reset", key="sim_reset")
+    prof.checkpoint("input")
+    
+    # Keadaan simulasi tinggal di session_state sehingga bisa dilanjutkan antar rerun
+    sim_params = dict(N=N_sim, T=T_C + 273.15, M=GAS_PROPERTIES[gas_sim]["M"], P=P_sim, packing=packing)
+    if reset or st.session_state.get("particle_params") != sim_params:
+        try:
+            st.session_state["particle_sim"] = ParticleGas(**sim_params)
+            st.session_state["particle_params"] = sim_params
+        except Exception as e:
+            st.error(f"❌ Error membuat simulasi: {str(e)}")
+            st.stop()
+    prof.checkpoint("inisialisasi")
+    
+    # Selama berjalan hanya fragmen ini yang dirender ulang; tiap rerun menjalankan satu potongan
+    # waktu terbatas, dan intervalnya selalu lebih panjang dari potongan itu agar widget lain
+    # tetap responsif
+    @st.fragment(run_every=max(1.0, budget + 0.5) if running else None)
+    def particle_panel():
+        sim = st.session_state["particle_sim"]
+        if running or step_once:
+            sim.advance(budget)
         
-        for V in V_test:
-            P_ideal_val = n * R * T / V
-            P_vdw_val = van_der_waals(T, V, n, a, b)
-            deviation = abs(P_vdw_val - P_ideal_val) / P_ideal_val * 100
-            
-            comparison_data.append({
-                'Volume (L)': V,
-                'P Ideal (atm)': f"{P_ideal_val:.3f}",
-                'P Van der Waals (atm)': f"{P_vdw_val:.3f}",
-                'Deviasi (%)': f"{deviation:.2f}%"
-            })
+        obs = sim.observables()
+        v_avg, v_rms, v_mp = calculate_molecular_properties(sim.T, sim.M)
+        v_bins, density = sim.speed_histogram()
+        mb = maxwell_boltzmann(v_bins, sim.T, sim.M)
+        # Jarak variasi total ke Maxwell-Boltzmann: 0 = identik, 1 = tidak beririsan
+        distance = 0.5 * np.abs(density - mb).sum() * (v_bins[1] - v_bins[0])
+        
+        metric_cols = st.columns(4)
+        metric_cols[0].metric("Langkah", f"{obs['steps']:,}")
+        metric_cols[1].metric("Waktu simulasi", f"{obs['time'] * 1e9:.3f} ns")
+        metric_cols[2].metric("Tumbukan per partikel", f"{obs['collisions_per_particle']:.2f}")
+        metric_cols[3].metric("Jarak ke Maxwell-Boltzmann", f"{distance:.3f}")
+        
+        line_chart(
+            [dict(x=v_bins, y=density, label=f'Simulasi (N = {sim.N:,})', color='blue', fill='blue'),
+             dict(x=v_bins, y=mb, label='Maxwell-Boltzmann', color='black', dash='dash')],
+            title=f'Distribusi Laju Partikel {gas_sim} (T = {sim.T:.1f} K)',
+            xlabel='Kecepatan (m/s)', ylabel='Probabilitas',
+            backend=chart_backend,
+        )
         
+        def deviation(sim_value, theory):
+            return (sim_value / theory - 1) * 100 if np.isfinite(sim_value) else np.nan
+        
+        st.subheader("✅ Validasi terhadap Teori")
+        st.dataframe(pd.DataFrame({
+            'Besaran': ['Kecepatan rata-rata (m/s)', 'Kecepatan RMS (m/s)', 'Suhu kinetik (K)',
+                        'Tekanan vs PV = nRT (atm)', 'Z vs Carnahan-Starling'],
+            'Simulasi': [obs['v_avg'], obs['v_rms'], obs['T_kin'], obs['P'], obs['Z']],
+            'Teori': [v_avg, v_rms, sim.T, obs['P_ideal'], obs['Z_hard_sphere']],
+            'Deviasi (%)': [deviation(obs['v_avg'], v_avg), deviation(obs['v_rms'], v_rms),
+                            deviation(obs['T_kin'], sim.T), deviation(obs['P'], obs['P_ideal']),
+                            deviation(obs['Z'], obs['Z_hard_sphere'])],
+        }).round(4), width="stretch", hide_index=True)
+        st.caption(
+            f"Kotak {obs['box'] * 1e9:.1f} nm, diameter partikel σ = {obs['sigma'] * 1e9:.3f} nm, "
+            f"jalan bebas rata-rata {obs['mean_free_path'] * 1e9:.2f} nm. "
+            f"Tekanan dirata-rata sejak awal run; Z bola keras > 1 karena volume eksklusi."
+        )
+    
+    particle_panel()
+    prof.checkpoint("simulasi partikel")
+
+# Riwayat run: daftar dan perbandingan berdampingan untuk mode yang menyimpan hasil
+if simulation_mode in ("Gas Ideal Dasar", "Proses Termodinamika", "Siklus Termodinamika"):
+    import pandas as pd
+    
+    def format_value(value):
+        return f"{value:.6g}" if isinstance(value, float) else str(value)
+    
+    with st.expander("📜 Riwayat Run"):
+        run_store = get_run_store()
+        history = run_store.history(simulation_mode)
+        if not history:
+            st.info("Belum ada run tersimpan untuk mode ini")
+        else:
+            st.dataframe(pd.DataFrame({
+                'Run': [h["id"] for h in history],
+                'Jenis': [h["kind"] for h in history],
+                'Terakhir dipakai': pd.to_datetime([h["last_used"] for h in history], unit="s"),
+                'Dipakai ulang': [h["hits"] for h in history],
+                'Parameter': [", ".join(f"{k}={format_value(v)}" for k, v in h["params"].items()) for h in history],
+            }), width="stretch", hide_index=True)
+            
+            selected = st.multiselect("Bandingkan run", [h["id"] for h in history],
+                                      format_func=lambda i: f"#{i}", key="history_compare")
+            if selected:
+                # Parameter dan hasil skalar berdampingan, satu kolom per run
+                st.dataframe(pd.DataFrame({
+                    f"#{run['id']}": {
+                        **{f"↳ {k}": format_value(v) for k, v in run["params"].items()},
+                        **{k: format_value(v) for k, v in run["result"].items() if np.ndim(v) == 0},
+                    }
+                    for run in run_store.load(selected)
+                }).fillna("–"), width="stretch")
+            
+            if st.button("🗑️ Hapus riwayat mode ini", key="history_clear"):
+                run_store.clear(simulation_mode)
+                st.rerun()
+prof.checkpoint("riwayat")
+
+with lottie_slot:
+    lottie_json = load_lottieurl("https://lottie.host/4c738dc6-b583-4fec-8fc8-872106791b3b/Xjm5xqRaFf.json")
+    if lottie_json:
+        from streamlit_lottie import st_lottie
+
+        st_lottie(lottie_json, height=53, key="side bar")
+prof.checkpoint("lottie")
+
+# Pemakaian memori proses server, untuk memantau pertumbuhan RSS antar rerun
+with st.sidebar:
+    rss_mb, peak_mb = memory_usage()
+    rss_text = "tidak tersedia" if rss_mb is None else f"{rss_mb:.0f} MB"
+    if peak_mb is not None:
+        rss_text += f" (puncak {peak_mb:.0f} MB)"
+    st.caption(f"💾 Memori server: {rss_text}, figure pyplot terbuka: {open_pyplot_figures()}")
+    
+    st.checkbox("🩺 Profiling", value=profiling.ENABLED_BY_DEFAULT, key="profiling",
+                help="Catat waktu tiap fase rerun dan ukuran payload grafik ke log JSON")
+    if profiling.is_active():
+        prof.checkpoint("sidebar akhir")
+        import pandas as pd
+        with st.expander("⏱️ Profil Rerun", expanded=True):
+            st.dataframe(pd.DataFrame(prof.phases).rename(columns={"name": "Fase", "ms": "Waktu (ms)"}).round(1),
+                         width="stretch", hide_index=True)
+            if prof.renders:
+                renders = pd.DataFrame(prof.renders)
+                renders["KB"] = renders.pop("bytes") / 1024
+                st.dataframe(renders.rename(columns={"name": "Render", "ms": "Waktu (ms)"}).round(1),
+                             width="stretch", hide_index=True)
+            st.caption(f"Total rerun: {prof.total_ms:.0f} ms · log: {profiling.LOG_PATH}")
+        prof.write_log()
@@ -0,0 +1,500 @@
+import numpy as np
+
+# Konstanta
+R = 0.0821  # L·atm/mol·K
+R_J = 8.314  # J/mol·K
+NA = 6.022e23  # Avogadro number
+L_ATM_TO_J = 101.325  # 1 L·atm = 101.325 J
+
+# Properti gas: massa molar (g/mol), Cp dan Cv (J/mol·K)
+GAS_PROPERTIES = {
+    "N₂ (Nitrogen)": {"M": 28.014, "Cp": 29.1, "Cv": 20.8},
+    "O₂ (Oxygen)": {"M": 31.998, "Cp": 29.4, "Cv": 21.1},
+    "H₂ (Hydrogen)": {"M": 2.016, "Cp": 28.8, "Cv": 20.4},
+    "CO₂ (Carbon Dioxide)": {"M": 44.01, "Cp": 37.1, "Cv": 28.5},
+    "He (Helium)": {"M": 4.003, "Cp": 20.8, "Cv": 12.5}
+}
+
+# Parameter Van der Waals: a (L²·atm/mol²), b (L/mol)
+VDW_PARAMS = {
+    "CO₂": {"a": 3.640, "b": 0.04267},
+    "N₂": {"a": 1.390, "b": 0.03913},
+    "O₂": {"a": 1.360, "b": 0.03183},
+    "H₂O": {"a": 5.536, "b": 0.03049},
+    "NH₃": {"a": 4.170, "b": 0.03707}
+}
+
+# Fit Shomate (NIST WebBook) untuk Cp(T) gas ideal dalam J/mol·K:
+# Cp = A + B·t + C·t² + D·t³ + E/t² dengan t = T/1000.
+# Tiap gas: (T minimum fit, [(T maksimum rentang, (A, B, C, D, E)), ...]);
+# di luar rentang keseluruhan Cp ditahan pada nilai di batasnya.
+SHOMATE = {
+    "N₂": (100.0, [
+        (500.0, (28.98641, 1.853978, -9.647459, 16.63537, 0.000117)),
+        (2000.0, (19.50583, 19.88705, -8.598535, 1.369784, 0.527601)),
+        (6000.0, (35.51872, 1.128728, -0.196103, 0.014662, -4.553760)),
+    ]),
+    "O₂": (100.0, [
+        (700.0, (31.32234, -20.23531, 57.86644, -36.50624, -0.007374)),
+        (2000.0, (30.03235, 8.772972, -3.988133, 0.788313, -0.741599)),
+        (6000.0, (20.91111, 10.72071, -2.020498, 0.146449, 9.245722)),
+    ]),
+    "H₂": (298.0, [
+        (1000.0, (33.066178, -11.363417, 11.432816, -2.772874, -0.158558)),
+        (2500.0, (18.563083, 12.257357, -2.859786, 0.268238, 1.977990)),
+        (6000.0, (43.413560, -4.293079, 1.272428, -0.096876, -20.533862)),
+    ]),
+    "CO₂": (298.0, [
+        (1200.0, (24.99735, 55.18696, -33.69137, 7.948387, -0.136638)),
+        (6000.0, (58.16639, 2.720074, -0.492289, 0.038844, -6.447293)),
+    ]),
+    "He": (298.0, [
+        (6000.0, (20.78603, 4.850638e-10, -1.582916e-10, 1.525102e-11, 3.196347e-11)),
+    ]),
+    "H₂O": (298.0, [
+        (1700.0, (30.09200, 6.832514, 6.793435, -2.534480, 0.082139)),
+        (6000.0, (41.96426, 8.622053, -1.499780, 0.098119, -11.15764)),
+    ]),
+    "NH₃": (298.0, [
+        (1400.0, (19.99563, 49.77119, -15.37599, 1.921168, 0.189174)),
+        (6000.0, (52.02427, 18.48801, -3.765128, 0.248541, -13.40888)),
+    ]),
+}
+
+# Entropi standar S° pada 298.15 K dan 1 bar (J/mol·K)
+STANDARD_ENTROPY = {
+    "N₂": 191.61, "O₂": 205.15, "H₂": 130.68, "CO₂": 213.79,
+    "He": 126.15, "H₂O": 188.84, "NH₃": 192.77,
+}
+
+_TO_SUBSCRIPT = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+
+
+def gas_formula(name):
+    """Rumus kimia gas sebagai kunci SHOMATE, mis. "N₂ (Nitrogen)" atau "N2" -> "N₂" """
+    return str(name).split(" (")[0].strip().translate(_TO_SUBSCRIPT)
+
+
+def heat_capacity(gas, T):
+    """Cp(T) gas ideal (J/mol·K) dari fit Shomate, T dalam K (array)"""
+    T_min, ranges = SHOMATE[gas_formula(gas)]
+    T = np.clip(np.asarray(T, dtype=float), T_min, ranges[-1][0])
+    cp = np.empty_like(T)
+    lower = -np.inf
+    for upper, (A, B, C, D, E) in ranges:
+        mask = (T > lower) & (T <= upper)
+        t = T[mask] / 1000
+        cp[mask] = A + B * t + C * t**2 + D * t**3 + E / t**2
+        lower = upper
+    return cp
+
+
+# Nama proses yang dikenali oleh solve_process
+PROCESSES = ("isobarik", "isokhorik", "isotermal", "adiabatik")
+
+
+def _as_float_arrays(*args):
+    """Konversi argumen ke array float yang sudah di-broadcast"""
+    return np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in args])
+
+
+# Fungsi utility
+def calculate_molecular_properties(T, M=28.014):  # Default untuk N2
+    """Hitung properti molekular"""
+    v_avg = np.sqrt(8 * R_J * T / (np.pi * M / 1000))  # m/s
+    v_rms = np.sqrt(3 * R_J * T / (M / 1000))  # m/s
+    v_mp = np.sqrt(2 * R_J * T / (M / 1000))  # m/s
+    return v_avg, v_rms, v_mp
+
+
+def maxwell_boltzmann(v, T, M=28.014):
+    """Distribusi Maxwell-Boltzmann"""
+    M_kg = M / 1000  # kg/mol
+    return 4 * np.pi * (M_kg / (2 * np.pi * R_J * T))**(3/2) * v**2 * np.exp(-M_kg * v**2 / (2 * R_J * T))
+
+
+def van_der_waals(T, V, n, a, b, R_gas=R_J):
+    """Persamaan Van der Waals"""
+    return (n * R_gas * T / (V - n * b)) - (a * n**2 / V**2)
+
+
+def vdw_comparison(T, V, n=1.0, gases=None):
+    """Bandingkan semua gas Van der Waals dengan gas ideal dalam satu operasi array.
+
+    T (K) dan V (L) berupa array 1D; hasil dibroadcast menjadi bentuk
+    (gas, T, V). Tekanan dalam atm (memakai R dalam L·atm/mol·K). Titik
+    dengan V ≤ nb bernilai NaN. Mengembalikan dict berisi nama gas,
+    P Van der Waals, P ideal (T, V), faktor kompresibilitas Z dan
+    deviasi relatif (%).
+    """
+    gases = VDW_PARAMS if gases is None else gases
+    names = list(gases)
+    a = np.array([gases[g]["a"] for g in names], dtype=float)[:, None, None]
+    b = np.array([gases[g]["b"] for g in names], dtype=float)[:, None, None]
+    T = np.atleast_1d(np.asarray(T, dtype=float))
+    V = np.atleast_1d(np.asarray(V, dtype=float))
+
+    result = vdw_deviation(T[None, :, None], V[None, None, :], n, a, b)
+    result["P_ideal"] = result["P_ideal"][0]
+    result.update(gases=names, T=T, V=V)
+    return result
+
+
+def vdw_deviation(T, V, n, a, b):
+    """Tekanan Van der Waals vs ideal per elemen (semua argumen di-broadcast).
+
+    Tekanan dalam atm; V ≤ nb bernilai NaN. Mengembalikan dict berisi
+    P, P_ideal, Z = PV/nRT dan deviasi (%).
+    """
+    T, V, n, a, b = _as_float_arrays(T, V, n, a, b)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        P = van_der_waals(T, V, n, a, b, R_gas=R)
+    P = np.where(V - n * b > 0, P, np.nan)
+
+    P_ideal = n * R * T / V
+    Z = P / P_ideal  # = PV / nRT
+    return {"P": P, "P_ideal": P_ideal, "Z": Z, "deviation": np.abs(Z - 1) * 100}
+
+
+def _solve_cubic(c2, c1, c0):
+    """Akar real x³ + c2·x² + c1·x + c0 = 0 secara analitik (batch).
+
+    Memakai rumus Cardano untuk satu akar real dan bentuk trigonometri
+    untuk tiga akar real. Mengembalikan array (..., 3) terurut naik;
+    posisi akar kompleks diisi NaN (berada di akhir).
+    """
+    c2, c1, c0 = _as_float_arrays(c2, c1, c0)
+    shift = c2 / 3
+    p = c1 - c2 * shift
+    q = 2 * shift**3 - shift * c1 + c0
+    disc = (q / 2)**2 + (p / 3)**3
+
+    roots = np.full(c2.shape + (3,), np.nan)
+
+    one = disc > 0
+    if np.any(one):
+        sq = np.sqrt(disc[one])
+        roots[one, 0] = np.cbrt(-q[one] / 2 + sq) + np.cbrt(-q[one] / 2 - sq) - shift[one]
+
+    three = ~one
+    if np.any(three):
+        p3, q3 = p[three], q[three]
+        m = 2 * np.sqrt(np.maximum(-p3 / 3, 0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            arg = np.where(p3 < 0, 3 * q3 / (p3 * m), 0)
+        theta = np.arccos(np.clip(arg, -1, 1)) / 3
+        k = np.arange(3)
+        roots[three] = m[:, None] * np.cos(theta[:, None] - 2 * np.pi * k / 3) - shift[three][:, None]
+
+    return np.sort(roots, axis=-1)
+
+
+def _vdw_molar_roots(P, T, a, b):
+    """Akar volume molar (L/mol) persamaan kubik Van der Waals"""
+    P, T, a, b = _as_float_arrays(P, T, a, b)
+    c2, c1, c0 = -(b + R * T / P), a / P, -a * b / P
+    x = _solve_cubic(c2, c1, c0)
+
+    # Satu langkah Newton untuk memperbaiki pembulatan rumus tertutup
+    c2, c1, c0 = c2[..., None], c1[..., None], c0[..., None]
+    f = ((x + c2) * x + c1) * x + c0
+    df = (3 * x + 2 * c2) * x + c1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = np.where(df != 0, x - f / df, x)
+
+    # Akar di bawah b tidak fisis
+    return np.where(x > b[..., None], x, np.nan)
+
+
+def _vdw_gibbs_gap(P, T, a, b, Vl, Vg):
+    """G(gas) - G(cair) per mol untuk dua akar pada P dan T yang sama"""
+    area = R * T * np.log((Vg - b) / (Vl - b)) + a * (1 / Vg - 1 / Vl)
+    return P * (Vg - Vl) - area
+
+
+def vdw_volume(P, T, n, a, b, root="stable"):
+    """Volume Van der Waals V(P, T, n) dalam L (batch, analitik).
+
+    `root` memilih akar fisis: "gas" (terbesar), "liquid" (terkecil)
+    atau "stable" (fasa dengan energi Gibbs terendah). P dalam atm,
+    a dalam L²·atm/mol², b dalam L/mol.
+    """
+    P, T, n, a, b = _as_float_arrays(P, T, n, a, b)
+    roots = _vdw_molar_roots(P, T, a, b)
+    Vl = np.fmin.reduce(roots, axis=-1)
+    Vg = np.fmax.reduce(roots, axis=-1)
+
+    if root == "gas":
+        Vm = Vg
+    elif root == "liquid":
+        Vm = Vl
+    elif root == "stable":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gap = _vdw_gibbs_gap(P, T, a, b, Vl, Vg)
+        Vm = np.where(gap > 0, Vl, Vg)
+    else:
+        raise ValueError(f"Pilihan akar tidak dikenal: {root!r}")
+    return n * Vm
+
+
+def vdw_critical_point(a, b):
+    """Titik kritis Van der Waals: Tc (K), Pc (atm), Vc (L/mol)"""
+    a, b = _as_float_arrays(a, b)
+    return 8 * a / (27 * R * b), a / (27 * b**2), 3 * b
+
+
+def vdw_saturation(T, a, b, iterations=60):
+    """Konstruksi luas sama Maxwell, tervektorisasi atas suhu.
+
+    Mengembalikan (P_sat, Vl, Vg): tekanan saturasi (atm) dan volume
+    molar cair/gas (L/mol). Bernilai NaN untuk T ≥ Tc.
+    """
+    T, a, b = _as_float_arrays(T, a, b)
+    Tc = 8 * a / (27 * R * b)
+    sub = T < Tc
+
+    # Titik spinodal (dP/dV = 0): RT·V³ - 2a·V² + 4ab·V - 2ab² = 0
+    RT = np.where(sub, R * T, 1.0)
+    spin = _solve_cubic(-2 * a / RT, 4 * a * b / RT, -2 * a * b**2 / RT)
+    Vs_low, Vs_high = spin[..., 1], spin[..., 2]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        P_low = van_der_waals(T, Vs_low, 1, a, b, R_gas=R)
+        P_high = van_der_waals(T, Vs_high, 1, a, b, R_gas=R)
+
+    # Bisection serentak untuk semua suhu: G(gas) - G(cair) naik terhadap P
+    lo = np.where(sub, np.maximum(P_low, 1e-9 * np.abs(P_high)), np.nan)
+    hi = np.where(sub, P_high, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for _ in range(iterations):
+            mid = (lo + hi) / 2
+            roots = _vdw_molar_roots(mid, T, a, b)
+            gap = _vdw_gibbs_gap(mid, T, a, b, np.fmin.reduce(roots, axis=-1), np.fmax.reduce(roots, axis=-1))
+            above = gap > 0
+            hi = np.where(above, mid, hi)
+            lo = np.where(above, lo, mid)
+
+        P_sat = (lo + hi) / 2
+        roots = _vdw_molar_roots(P_sat, T, a, b)
+    return P_sat, np.fmin.reduce(roots, axis=-1), np.fmax.reduce(roots, axis=-1)
+
+
+def maxwell_isotherms(T, V, n, a, b):
+    """Isoterm Van der Waals terkoreksi Maxwell, bentuk (T, V), P dalam atm"""
+    T = np.atleast_1d(np.asarray(T, dtype=float))[:, None]
+    V = np.atleast_1d(np.asarray(V, dtype=float))[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        P = van_der_waals(T, V, n, a, b, R_gas=R)
+    P = np.where(V > n * b, P, np.nan)
+
+    P_sat, Vl, Vg = vdw_saturation(T, a, b)
+    plateau = (V > n * Vl) & (V < n * Vg)
+    return np.where(plateau, P_sat, P)
+
+
+def coexistence_curves(gases=None, num=100, Tr_min=0.5):
+    """Kurva koeksistensi cair-uap untuk semua gas sekaligus.
+
+    Suhu tereduksi Tr = T/Tc dari Tr_min sampai mendekati 1. Mengembalikan
+    dict berisi nama gas dan array (gas, num) untuk T, P_sat, Vl, Vg.
+    """
+    gases = VDW_PARAMS if gases is None else gases
+    names = list(gases)
+    a = np.array([gases[g]["a"] for g in names], dtype=float)[:, None]
+    b = np.array([gases[g]["b"] for g in names], dtype=float)[:, None]
+    Tc, Pc, Vc = vdw_critical_point(a, b)
+    T = Tc * np.linspace(Tr_min, 0.999, num)[None, :]
+    P_sat, Vl, Vg = vdw_saturation(T, a, b)
+    return {"gases": names, "T": T, "P_sat": P_sat, "Vl": Vl, "Vg": Vg,
+            "Tc": Tc[:, 0], "Pc": Pc[:, 0], "Vc": Vc[:, 0]}
+
+
+# === GAS IDEAL: PV = nRT ===
+def solve_ideal_gas(target, n=None, T=None, V=None, P=None):
+    """Selesaikan PV = nRT untuk satu variabel (batch).
+
+    `target` adalah salah satu dari "P", "V", "n", "T". Tiga variabel
+    lainnya boleh berupa skalar atau array yang bisa di-broadcast.
+    Satuan: P dalam atm, V dalam L, T dalam K.
+    """
+    if target == "P":
+        n, T, V = _as_float_arrays(n, T, V)
+        return n * R * T / V
+    if target == "V":
+        n, T, P = _as_float_arrays(n, T, P)
+        return n * R * T / P
+    if target == "n":
+        P, V, T = _as_float_arrays(P, V, T)
+        return P * V / (R * T)
+    if target == "T":
+        P, V, n = _as_float_arrays(P, V, n)
+        return P * V / (n * R)
+    raise ValueError(f"Variabel tidak dikenal: {target!r}")
+
+
+def evaluate_states(n, T, V, M=28.014):
+    """Evaluasi sekumpulan keadaan gas ideal sekaligus.
+
+    Mengembalikan dict berisi tekanan (atm), kecepatan molekular (m/s)
+    dan energi kinetik rata-rata (J/mol) untuk tiap baris (n, T, V).
+    """
+    n, T, V, M = _as_float_arrays(n, T, V, M)
+    v_avg, v_rms, v_mp = calculate_molecular_properties(T, M)
+    return {
+        "P": n * R * T / V,
+        "v_avg": v_avg,
+        "v_rms": v_rms,
+        "v_mp": v_mp,
+        "E_k": 1.5 * R_J * T,
+    }
+
+
+# === PROSES TERMODINAMIKA ===
+def solve_process(process, n, T1, T2, V1, V2, P1, Cp, Cv, gas=None):
+    """Hitung keadaan akhir dan energi proses (batch).
+
+    `process` adalah salah satu dari PROCESSES. Dengan `gas` (nama gas
+    atau array nama per elemen) energi memakai Cp(T) terintegrasi dari
+    tabel properti dan Cp/Cv diabaikan. Mengembalikan dict berisi P2,
+    V2, T2 dan energi q, w, dU, dH dalam J.
+    """
+    n, T1, T2, V1, V2, P1, Cp, Cv = _as_float_arrays(n, T1, T2, V1, V2, P1, Cp, Cv)
+    if gas is not None:
+        return _solve_process_table(process, n, T1, T2, V1, V2, P1, gas)
+    gamma = Cp / Cv
+
+    if process == "isobarik":
+        P2 = P1  # Tekanan konstan
+        V2 = V1 * T2 / T1  # Hukum Charles
+        q = n * Cp * (T2 - T1)
+        w = -P1 * (V2 - V1) * L_ATM_TO_J  # Konversi ke J
+        dU = n * Cv * (T2 - T1)
+        dH = q
+    elif process == "isokhorik":
+        V2 = V1  # Volume konstan
+        P2 = P1 * T2 / T1  # Hukum Gay-Lussac
+        q = n * Cv * (T2 - T1)
+        w = np.zeros_like(q)  # Tidak ada kerja
+        dU = q
+        dH = n * Cp * (T2 - T1)
+    elif process == "isotermal":
+        T2 = T1  # Suhu konstan
+        P2 = P1 * V1 / V2  # Hukum Boyle
+        q = n * R_J * T1 * np.log(V2 / V1)
+        w = -q  # Untuk gas ideal isotermal
+        dU = np.zeros_like(q)  # Energi dalam konstan
+        dH = np.zeros_like(q)  # Entalpi konstan
+    elif process == "adiabatik":
+        # PV^γ = konstan, TV^(γ-1) = konstan
+        P2 = P1 * (V1 / V2)**gamma
+        T2 = T1 * (V1 / V2)**(gamma - 1)
+        w = (P1 * V1 - P2 * V2) * L_ATM_TO_J / (gamma - 1)
+        q = np.zeros_like(w)  # Tidak ada perpindahan panas
+        dU = -w
+        dH = dU + (P2 * V2 - P1 * V1) * L_ATM_TO_J
+    else:
+        raise ValueError(f"Proses tidak dikenal: {process!r}")
+
+    return {"P2": P2, "V2": V2, "T2": T2, "q": q, "w": w, "dU": dU, "dH": dH}
+
+
+def _solve_process_table(process, n, T1, T2, V1, V2, P1, gas):
+    """Seperti solve_process, dengan U(T) dan H(T) dari tabel Cp(T)"""
+    from property_tables import get_table  # Tabel memory-mapped, dibuat saat pertama dipakai
+
+    table = get_table()
+    if process == "isobarik":
+        P2, V2 = P1, V1 * T2 / T1
+    elif process == "isokhorik":
+        V2, P2 = V1, P1 * T2 / T1
+    elif process == "isotermal":
+        T2, P2 = T1, P1 * V1 / V2
+    elif process == "adiabatik":
+        T2 = table.adiabatic_temperature(gas, T1, V2 / V1)
+        P2 = P1 * V1 * T2 / (V2 * T1)
+    else:
+        raise ValueError(f"Proses tidak dikenal: {process!r}")
+
+    # Konvensi q dan w sama dengan cabang Cp konstan di solve_process
+    dU = n * (table.internal_energy(gas, T2) - table.internal_energy(gas, T1))
+    dH = n * (table.enthalpy(gas, T2) - table.enthalpy(gas, T1))
+    if process == "isobarik":
+        q, w = dH, -P1 * (V2 - V1) * L_ATM_TO_J
+    elif process == "isokhorik":
+        q, w = dU, np.zeros_like(dU)
+    elif process == "isotermal":
+        q = n * R_J * T1 * np.log(V2 / V1)
+        w = -q
+    else:
+        q, w = np.zeros_like(dU), -dU
+    return {"P2": P2, "V2": V2, "T2": T2, "q": q, "w": w, "dU": dU, "dH": dH}
+
+
+def process_path(process, V1, V2, P1, P2, gamma, num=100):
+    """Lintasan P-V sebuah proses, didiskretisasi menjadi `num` titik"""
+    if process == "isobarik":
+        return np.linspace(V1, V2, num), np.full(num, float(P1))
+    if process == "isokhorik":
+        return np.full(num, float(V1)), np.linspace(P1, P2, num)
+    V_range = np.linspace(V1, V2, num)
+    if process == "isotermal":
+        return V_range, P1 * V1 / V_range
+    if process == "adiabatik":
+        return V_range, P1 * (V1 / V_range)**gamma
+    raise ValueError(f"Proses tidak dikenal: {process!r}")
+
+
+# === SIKLUS TERMODINAMIKA ===
+def carnot_cycle(n, T_hot, T_cold, V1, V2, gamma):
+    """Analisis siklus Carnot (batch, simplified)"""
+    n, T_hot, T_cold, V1, V2, gamma = _as_float_arrays(n, T_hot, T_cold, V1, V2, gamma)
+
+    eta = 1 - T_cold / T_hot
+
+    # Titik-titik siklus
+    P1 = n * R * T_hot / V1
+    P2 = n * R * T_hot / V2
+    V3 = V2 * (T_hot / T_cold)**(1 / (gamma - 1))
+    V4 = V1 * (T_hot / T_cold)**(1 / (gamma - 1))
+    P3 = n * R * T_cold / V3
+    P4 = n * R * T_cold / V4
+
+    # Kerja dan kalor
+    W12 = n * R * T_hot * np.log(V2 / V1)  # Ekspansi isotermal
+    W23 = n * R * T_hot / (gamma - 1) * (1 - (T_cold / T_hot))  # Ekspansi adiabatik
+    W34 = n * R * T_cold * np.log(V4 / V3)  # Kompresi isotermal
+    W41 = n * R * T_cold / (gamma - 1) * (1 - (T_hot / T_cold))  # Kompresi adiabatik
+
+    return {
+        "eta": eta,
+        "W_net": W12 + W23 + W34 + W41,
+        "Q_hot": W12,
+        "Q_cold": W34,
+        "V": np.stack([V1, V2, V3, V4], axis=-1),
+        "P": np.stack([P1, P2, P3, P4], axis=-1),
+        "T": np.stack([T_hot, T_hot, T_cold, T_cold], axis=-1),
+    }
+
+
+def otto_cycle(n, T1, compression_ratio, Q_in, gamma, V1=1.0):
+    """Analisis siklus Otto (batch, simplified)"""
+    n, T1, r, Q_in, gamma, V1 = _as_float_arrays(n, T1, compression_ratio, Q_in, gamma, V1)
+
+    eta = 1 - (1 / r)**(gamma - 1)
+
+    V2 = V1 / r  # Volume setelah kompresi
+    T2 = T1 * r**(gamma - 1)  # Suhu setelah kompresi
+    T3 = T2 + Q_in / (n * R / (gamma - 1))  # Suhu setelah pembakaran
+    T4 = T3 / r**(gamma - 1)  # Suhu setelah ekspansi
+
+    W_net = eta * Q_in
+    V = np.stack([V1, V2, V2, V1], axis=-1)
+    T = np.stack([T1, T2, T3, T4], axis=-1)
+
+    return {
+        "eta": eta,
+        "W_net": W_net,
+        "Q_out": Q_in - W_net,
+        "V": V,
+        "T": T,
+        "P": n[..., None] * R * T / V,
+    }